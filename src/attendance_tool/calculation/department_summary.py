@@ -5,9 +5,13 @@ from datetime import date
 from typing import List
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DepartmentSummary:
-    """部門別集計サマリー - Red Phase スタブ実装"""
+    """部門別集計サマリー - Red Phase スタブ実装
+
+    部門・階層ごとに生成されるため、slotsでインスタンス辞書を持たず、
+    生成後は変更不可とする。
+    """
 
     department_code: str  # 部門コード
     department_name: str  # 部門名
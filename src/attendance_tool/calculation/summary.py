@@ -5,11 +5,13 @@ from datetime import date
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class AttendanceSummary:
     """勤怠集計結果
 
     Red Phase: 必要なフィールドのみ定義、計算ロジックは未実装
+    社員ごとに生成されるため、slotsでインスタンス辞書を持たない。
+    違反情報の統合でwarnings/violationsを更新するため、変更不可にはしない。
     """
 
     # 基本情報
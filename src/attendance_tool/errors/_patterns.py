@@ -0,0 +1,47 @@
+"""
+エラーハンドリング共通の正規表現パターン
+
+パターンはインポート時に1度だけコンパイルし、各クラスから共有する
+"""
+
+import re
+from typing import Iterable
+
+# 個人情報の検出パターン
+EMAIL_LOCAL_PART = r"[\w.-]+@"
+PHONE_NUMBER = r"\d{3}-\d{4}-\d{4}"
+JAPANESE_NAME = r"[一-龯]{2,4}"
+
+# 個人情報マスキング用パターン（1回の走査で全種別を置換するため名前付き選択で結合）
+MASK_PATTERN_SOURCE = (
+    f"(?P<email>{EMAIL_LOCAL_PART})"
+    f"|(?P<phone>{PHONE_NUMBER})"
+    f"|(?P<jpname>{JAPANESE_NAME})"
+)
+MASK_PATTERN = re.compile(MASK_PATTERN_SOURCE)
+
+# マッチしたグループ名 → 置換文字列
+MASK_REPLACEMENTS = {
+    "employee": "******",
+    "email": "******@",
+    "phone": "***-****-****",
+    "jpname": "******",
+}
+
+
+def mask_replacement(match: re.Match) -> str:
+    """マッチ種別に応じたマスク文字列を返す"""
+    return MASK_REPLACEMENTS[match.lastgroup]
+
+
+def build_mask_pattern(employee_names: Iterable[str]) -> re.Pattern:
+    """既知の社員名を先頭の選択肢に加えたマスキングパターンを構築
+
+    長い名前を優先してマッチさせるため、名前は長さの降順で並べる
+    """
+    names = sorted({name for name in employee_names if name}, key=len, reverse=True)
+    if not names:
+        return MASK_PATTERN
+
+    alternation = "|".join(re.escape(name) for name in names)
+    return re.compile(f"(?P<employee>{alternation})|{MASK_PATTERN_SOURCE}")
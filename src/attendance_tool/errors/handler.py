@@ -145,27 +145,38 @@ class ErrorHandler:
     def classify_error(
         self, exception: Exception, context: Optional[ErrorContext] = None
     ) -> ErrorClassification:
-        """エラーを分類する (改善版)"""
+        """エラーを分類する (改善版)
+
+        分類済みの型は辞書1回の参照で済むため、そのまま結果を組み立てる
+        （ErrorClassificationはフィールド定義順の位置引数で生成）
+        """
+        entry = self._classification_map.get(type(exception))
+        if entry is None:
+            entry = self._resolve_classification(exception)
+        category, code, severity, retry_enabled = entry
+
+        return ErrorClassification(
+            category, code, severity, exception, context, retry_enabled
+        )
+
+    def _resolve_classification(self, exception: Exception) -> tuple:
+        """未登録の例外型を分類し、結果を型ごとにキャッシュする
+
+        基底クラスが登録済みであればその分類を継承し、
+        該当がなければ未知エラーとして推測分類する
+        """
         exception_type = type(exception)
 
-        if exception_type in self._classification_map:
-            category, code, severity, retry_enabled = self._classification_map[
-                exception_type
-            ]
+        for base in exception_type.__mro__[1:]:
+            entry = self._classification_map.get(base)
+            if entry is not None:
+                break
         else:
             # デフォルト分類（未知のエラー）
-            category, code, severity, retry_enabled = self._classify_unknown_error(
-                exception
-            )
+            entry = self._classify_unknown_error(exception)
 
-        return ErrorClassification(
-            category=category,
-            code=code,
-            severity=severity,
-            original_exception=exception,
-            context=context,
-            retry_enabled=retry_enabled,
-        )
+        self._classification_map[exception_type] = entry
+        return entry
 
     def _classify_unknown_error(self, exception: Exception) -> tuple:
         """未知エラーの分類"""
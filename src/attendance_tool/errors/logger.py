@@ -5,16 +5,212 @@
 """
 
 import json
-import re
-from datetime import datetime
-from typing import Any, Dict, List
+import logging
+import logging.handlers
+import os
+import queue
+import weakref
+from datetime import date, datetime, time
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+
+from ._patterns import MASK_PATTERN, build_mask_pattern, mask_replacement
+
+try:
+    import orjson
+except ImportError:  # orjsonは任意依存（未インストール時は標準jsonを使用）
+    orjson = None
+
+# ログレベル → 出力先（インポート時に1度だけ構築）
+_LEVEL_ROUTES = {
+    "CRITICAL": frozenset({"console", "file", "system_log"}),
+    "ERROR": frozenset({"console", "file"}),
+    "WARNING": frozenset({"file"}),
+    "INFO": frozenset({"file"}),
+}
+_NO_ROUTES: FrozenSet[str] = frozenset()
+
+# 出力先ハンドラーへ渡すまでに滞留できるログレコード数の上限
+_DEFAULT_QUEUE_SIZE = 10000
+
+# 構造化ログファイルへの書き込みバッファ上限（バイト）
+_LOG_BUFFER_LIMIT = 64 * 1024
+
+# 即時にファイルへ書き出すレベル（重大なエラーは取りこぼさない）
+_FLUSH_LEVELS = frozenset({"CRITICAL", "ERROR"})
+
+
+class _RouteDispatcher(logging.Handler):
+    """レコードの出力先名に対応するハンドラーへ振り分けるハンドラー
+
+    利用者から渡されたハンドラーにはフィルターを追加せず、
+    リスナースレッド上でここから直接呼び出す
+    """
+
+    def __init__(self, sinks: Dict[str, logging.Handler]):
+        super().__init__()
+        self._sinks = dict(sinks)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        routes = getattr(record, "routes", _NO_ROUTES)
+        # 複数の出力先名に同じハンドラーが割り当てられていても1回だけ渡す
+        targets = dict.fromkeys(
+            handler for route, handler in self._sinks.items() if route in routes
+        )
+        for handler in targets:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class _BufferedLogFile:
+    """構造化ログファイル（行をバッファに溜め、まとめて1回のwriteで追記する）"""
+
+    def __init__(self, path: str):
+        self._fd: Optional[int] = os.open(
+            path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
+        self._buffer = bytearray()
+
+    def append(self, line: bytes, flush: bool) -> None:
+        """1行追加（flush指定時・バッファ上限到達時は書き出す）"""
+        self._buffer += line
+        self._buffer += b"\n"
+        if flush or len(self._buffer) >= _LOG_BUFFER_LIMIT:
+            self.flush()
+
+    def flush(self) -> None:
+        """バッファ中の行をファイルへ書き出す"""
+        if self._fd is None or not self._buffer:
+            return
+
+        view = memoryview(self._buffer)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+        view.release()
+        self._buffer.clear()
+
+    def close(self) -> None:
+        """残りの行を書き出してファイルを閉じる"""
+        if self._fd is None:
+            return
+        try:
+            self.flush()
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+
+def _is_plain_ascii(text: str) -> bool:
+    """JSONエスケープが不要なASCII文字列か判定"""
+    return (
+        text.isascii() and text.isprintable() and '"' not in text and "\\" not in text
+    )
+
+
+def _json_default(value: Any) -> str:
+    """JSON非対応の値を文字列化（日時はorjsonと同じISO 8601形式に揃える）"""
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return str(value)
+
+
+def _encode_json(data: Dict[str, Any]) -> str:
+    """標準jsonによるエンコード（orjson未導入時のフォールバック）
+
+    タイムスタンプ・レベル・コード等のエスケープ不要なASCII文字列は
+    エンコーダーを通さずにそのまま連結し、利用者由来のテキストなど
+    それ以外の値のみjson.dumpsでエンコードする
+    """
+    fragments = []
+    for key, value in data.items():
+        if isinstance(value, str) and _is_plain_ascii(value):
+            encoded = f'"{value}"'
+        else:
+            encoded = json.dumps(
+                value, ensure_ascii=False, separators=(",", ":"), default=_json_default
+            )
+        fragments.append(f"{json.dumps(key, ensure_ascii=False)}:{encoded}")
+    return "{" + ",".join(fragments) + "}"
+
+
+def _dumps_bytes(data: Dict[str, Any]) -> bytes:
+    """ログエントリをUTF-8のJSONバイト列に変換（orjsonが利用可能なら優先）"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str)
+    return _encode_json(data).encode("utf-8")
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """ログエントリをJSON文字列に変換"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str).decode("utf-8")
+    return _encode_json(data)
+
+
+def _release(
+    listener: Optional[logging.handlers.QueueListener],
+    log_file: Optional[_BufferedLogFile],
+) -> None:
+    """滞留中のレコードを書き出してリスナーを停止し、ログファイルを閉じる"""
+    try:
+        if listener is not None:
+            listener.stop()
+    finally:
+        if log_file is not None:
+            log_file.close()
 
 
 class ErrorLogger:
     """エラーログ機能"""
 
-    def __init__(self):
-        pass
+    def __init__(
+        self,
+        employee_names: Optional[Iterable[str]] = None,
+        sinks: Optional[Dict[str, logging.Handler]] = None,
+        queue_size: int = _DEFAULT_QUEUE_SIZE,
+        log_file_path: Optional[str] = None,
+    ):
+        """初期化
+
+        Args:
+            employee_names: マスキング対象の既知の社員名（ローマ字・カナ表記等、
+                汎用パターンで検出できない名前を含められる）
+            sinks: 出力先名（"console"/"file"/"system_log"）→ ハンドラー。
+                指定時はバックグラウンドスレッドでハンドラーへ書き出す
+            queue_size: 書き出し待ちレコードの上限（超過時は呼び出し側が待機）
+            log_file_path: 構造化ログをJSON Lines形式で追記するファイル
+        """
+        # 社員名リストは初期化時に1度だけパターンへ組み込む
+        self._mask_pattern = (
+            build_mask_pattern(employee_names) if employee_names else MASK_PATTERN
+        )
+
+        # 出力先I/Oを呼び出し元から切り離すためのキューとリスナー
+        self._queue: Optional[queue.Queue] = None
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        if sinks:
+            self._queue = queue.Queue(maxsize=queue_size)
+            self._listener = logging.handlers.QueueListener(
+                self._queue, _RouteDispatcher(sinks)
+            )
+            self._listener.start()
+
+        # 構造化ログはバッファに溜め、まとめて1回のwriteで追記する
+        self._log_file = _BufferedLogFile(log_file_path) if log_file_path else None
+
+        # close()が呼ばれないままGC・インタプリタ終了となっても、
+        # リスナーを停止し、バッファ中の構造化ログを書き出してファイルを閉じる
+        self._finalizer = (
+            weakref.finalize(self, _release, self._listener, self._log_file)
+            if self._listener is not None or self._log_file is not None
+            else None
+        )
+
+    def __enter__(self) -> "ErrorLogger":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def log_structured_error(self, error_info: Dict[str, Any]) -> Dict[str, Any]:
         """構造化エラーログ (最小実装)"""
@@ -35,32 +231,59 @@ class ErrorLogger:
             "recovery_success": False,
         }
 
+        if self._log_file is not None:
+            self._log_file.append(
+                _dumps_bytes(log_entry), flush=log_entry["level"] in _FLUSH_LEVELS
+            )
+
         return log_entry
 
+    def serialize_log_entry(self, log_entry: Dict[str, Any]) -> str:
+        """構造化ログエントリをJSON文字列に変換"""
+        return _dumps(log_entry)
+
     def mask_personal_info(self, text: str) -> str:
-        """個人情報マスキング (最小実装)"""
-        # 日本語名前のマスキング
-        text = re.sub(r"[一-龯]{2,4}", "******", text)
+        """個人情報マスキング
+
+        既知の社員名・日本語名前・メールアドレス・電話番号を1パスでマスキングする
+        """
+        return self._mask_pattern.sub(mask_replacement, text)
+
+    def log_with_level(self, message: str, level: str) -> FrozenSet[str]:
+        """レベル別ログ出力
+
+        出力先が設定されている場合はレコードをキューに積むだけで戻り、
+        実際の書き出しはリスナースレッドが行う
 
-        # メールアドレスのマスキング
-        text = re.sub(r"[\w.-]+@", "******@", text)
+        Returns:
+            FrozenSet[str]: 出力先名
+        """
+        routes = _LEVEL_ROUTES.get(level, _NO_ROUTES)
 
-        # 電話番号のマスキング
-        text = re.sub(r"\d{3}-\d{4}-\d{4}", "***-****-****", text)
+        if self._queue is not None and routes:
+            record = logging.LogRecord(
+                name=__name__,
+                level=logging.getLevelName(level),
+                pathname=__file__,
+                lineno=0,
+                msg=message,
+                args=None,
+                exc_info=None,
+            )
+            record.routes = routes
+            self._queue.put(record)
 
-        return text
+        return routes
 
-    def log_with_level(self, message: str, level: str) -> List[str]:
-        """レベル別ログ出力 (最小実装)"""
-        outputs = []
+    def flush(self) -> None:
+        """バッファ中の構造化ログをファイルへ書き出す"""
+        if self._log_file is not None:
+            self._log_file.flush()
 
-        if level == "CRITICAL":
-            outputs = ["console", "file", "system_log"]
-        elif level == "ERROR":
-            outputs = ["console", "file"]
-        elif level == "WARNING":
-            outputs = ["file"]
-        elif level == "INFO":
-            outputs = ["file"]
+    def close(self) -> None:
+        """滞留中のレコードを書き出してリスナー・ログファイルを閉じる"""
+        self._listener = None
+        self._queue = None
 
-        return outputs
+        if self._finalizer is not None:
+            self._finalizer()
@@ -4,10 +4,21 @@
 ユーザーフレンドリーなエラーメッセージを提供
 """
 
-from typing import List
+from typing import Optional, Tuple
 
 from attendance_tool.validation.models import ValidationError
 
+# 解決方法が未登録のエラー種別に返す既定の提案
+_DEFAULT_SOLUTIONS = ("サポートに問い合わせてください",)
+
+
+def _compile_template(template: str) -> Tuple[str, Optional[str]]:
+    """テンプレートを{path}の前後に分割する"""
+    head, placeholder, tail = template.partition("{path}")
+    if not placeholder:
+        return head, None
+    return head, tail
+
 
 class MessageFormatter:
     """メッセージフォーマッター"""
@@ -21,6 +32,12 @@ class MessageFormatter:
             PermissionError: "ファイルへのアクセス権限がありません\n詳細: ファイルまたはフォルダへの読み書き権限がない可能性があります\n解決方法: 管理者権限で実行するか、ファイルの権限設定を確認してください",
         }
 
+        # {path}の前後で分割したテンプレート（固定メッセージはtailがNone）
+        self._compiled_templates = {
+            exception_type: _compile_template(template)
+            for exception_type, template in self._message_templates.items()
+        }
+
         # 簡易化マッピング
         self._simplification_map = {
             ValidationError: "データの形式に問題があります",
@@ -28,31 +45,39 @@ class MessageFormatter:
             TimeoutError: "処理に時間がかかりすぎました",
         }
 
-        # 解決方法マッピング
+        # 解決方法マッピング（不変のタプルで保持し、呼び出し側と共有する）
         self._solution_map = {
-            "FileNotFoundError": [
+            "FileNotFoundError": (
                 "ファイルパスを確認してください",
                 "ファイルが存在することを確認してください",
                 "ファイル名にタイプミスがないか確認してください",
-            ],
-            "PermissionError": [
+            ),
+            "PermissionError": (
                 "管理者権限で実行してください",
                 "ファイルの権限設定を確認してください",
                 "他のプロセスがファイルを使用していないか確認してください",
-            ],
+            ),
         }
 
     def format_message(self, exception: Exception) -> str:
-        """メッセージフォーマット (最小実装)"""
-        exception_type = type(exception)
+        """メッセージフォーマット
+
+        テンプレートは初期化時に分割済みのため、呼び出し時は
+        パス部分の連結のみを行う
+        """
+        compiled = self._compiled_templates.get(type(exception))
+
+        if compiled is not None:
+            head, tail = compiled
+            if tail is None:
+                # プレースホルダーを含まない固定メッセージ
+                return head
 
-        if exception_type in self._message_templates:
-            template = self._message_templates[exception_type]
-            # 簡単な文字列置換（最小実装）
             if hasattr(exception, "filename") and exception.filename:
-                return template.format(path=exception.filename)
+                path = str(exception.filename)
             else:
-                return template.format(path=str(exception))
+                path = str(exception)
+            return head + path + tail
 
         return f"エラーが発生しました: {str(exception)}"
 
@@ -65,6 +90,10 @@ class MessageFormatter:
 
         return str(exception)
 
-    def get_solution_suggestions(self, error_type: str) -> List[str]:
-        """解決方法の提案 (最小実装)"""
-        return self._solution_map.get(error_type, ["サポートに問い合わせてください"])
+    def get_solution_suggestions(self, error_type: str) -> Tuple[str, ...]:
+        """解決方法の提案
+
+        提案は構築済みのタプルをそのまま返すため、呼び出しごとの
+        リスト生成は発生しない
+        """
+        return self._solution_map.get(error_type, _DEFAULT_SOLUTIONS)
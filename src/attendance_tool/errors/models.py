@@ -1,5 +1,8 @@
 """
 エラーハンドリング用データモデル (改善版)
+
+エラー継続処理では1行ごとにErrorRecordが生成されるため、
+各モデルはslots=Trueでインスタンス辞書を持たない構成とする
 """
 
 from dataclasses import dataclass, field
@@ -7,7 +10,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorContext:
     """エラー発生時のコンテキスト情報"""
 
@@ -19,7 +22,7 @@ class ErrorContext:
     additional_data: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorClassification:
     """エラー分類結果 (改善版)"""
 
@@ -41,13 +44,14 @@ class ErrorClassification:
         return self.severity in ["WARNING", "INFO"]
 
 
-@dataclass
+@dataclass(slots=True)
 class RecoveryResult:
     """リカバリー結果 (改善版)"""
 
     success: bool = False
     gc_executed: bool = False
-    memory_freed: int = 0
+    # GCで解放されたメモリ量（バイト。tracemalloc無効時は計測できないためNone）
+    memory_freed: Optional[int] = 0
     attempts: int = 0
     final_exception: Optional[Exception] = None
     recovery_time: float = 0.0
@@ -58,7 +62,7 @@ class RecoveryResult:
         return self.success
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """処理結果（エラー継続処理用） (改善版)"""
 
@@ -78,7 +82,7 @@ class ProcessingResult:
             self.success_rate = len(self.successful_results) / self.total_processed
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorRecord:
     """エラーレコード (改善版)"""
 
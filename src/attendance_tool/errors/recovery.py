@@ -5,11 +5,31 @@
 """
 
 import gc
+import operator
+import random
 import time
-from typing import Any, Callable, List
+import tracemalloc
+from concurrent.futures import Executor, as_completed
+from functools import reduce
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional
 
 from .models import ErrorRecord, ProcessingResult, RecoveryResult
 
+if TYPE_CHECKING:
+    # pandasの読み込みは重いため、attendance_tool.errorsのインポート時には読み込まない
+    # （ベクトル化処理は呼び出し側が用意したDataFrameのメソッドのみを使う）
+    import pandas as pd
+
+# リトライ待機時間に加えるジッターの割合（同時リトライの集中を避ける）
+_RETRY_JITTER_RATIO = 0.1
+
+
+def _traced_memory() -> Optional[int]:
+    """tracemallocがトレース中のメモリ量（バイト）。トレース無効時はNone"""
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    return None
+
 
 class RecoveryManager:
     """リカバリー機能管理"""
@@ -18,9 +38,29 @@ class RecoveryManager:
         pass
 
     def retry_operation(
-        self, operation: Callable, max_retries: int = 3, delay: float = 1.0
+        self,
+        operation: Callable,
+        max_retries: int = 3,
+        delay: float = 1.0,
+        backoff_multiplier: float = 2.0,
+        max_delay: float = 10.0,
+        timeout: Optional[float] = None,
     ) -> Any:
-        """操作のリトライ実行 (最小実装)"""
+        """操作のリトライ実行
+
+        失敗ごとに待機時間を指数的に伸ばし（±ジッター付き）、timeoutが
+        指定された場合はtime.monotonic()基準の期限を超えて待機しない
+
+        Args:
+            operation: 実行する操作
+            max_retries: 最大試行回数
+            delay: 初回リトライまでの待機秒数
+            backoff_multiplier: 待機時間の増加倍率
+            max_delay: 1回あたりの最大待機秒数
+            timeout: 全体の期限（秒）。Noneの場合は期限なし
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        current_delay = delay
         last_exception = None
 
         for attempt in range(max_retries):
@@ -28,20 +68,41 @@ class RecoveryManager:
                 return operation()
             except Exception as e:
                 last_exception = e
-                if attempt < max_retries - 1:
-                    time.sleep(delay)
+
+            if attempt >= max_retries - 1:
+                break
+
+            wait = min(current_delay, max_delay)
+            wait += random.uniform(0, wait * _RETRY_JITTER_RATIO)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                wait = min(wait, remaining)
+
+            time.sleep(wait)
+            current_delay *= backoff_multiplier
 
         # 最終的に失敗した場合は例外を再発生
         raise last_exception
 
     def handle_memory_error(self, operation: Callable) -> RecoveryResult:
-        """メモリエラーハンドリング (最小実装)"""
+        """メモリエラーハンドリング
+
+        tracemalloc有効時はガベージコレクション前後の使用量差分を
+        memory_freed（バイト）として記録する。無効時は正確なバイト数を
+        得られないため、推定値は出さずにNoneとする
+        """
         # ガベージコレクション実行
-        before_gc = gc.get_count()[0]
+        before_gc = _traced_memory()
         gc.collect()
-        after_gc = gc.get_count()[0]
+        after_gc = _traced_memory()
 
-        memory_freed = max(0, before_gc - after_gc)
+        memory_freed = (
+            max(0, before_gc - after_gc)
+            if before_gc is not None and after_gc is not None
+            else None
+        )
 
         # 回復試行
         recovery_success = None
@@ -56,24 +117,126 @@ class RecoveryManager:
         )
 
     def process_with_error_continuation(
-        self, data: List[dict], processor: Callable
+        self,
+        data: Iterable[dict],
+        processor: Callable,
+        pre_check: Optional[Callable[[dict], bool]] = None,
+        error_sink: Optional[Callable[[ErrorRecord], Any]] = None,
+        executor: Optional[Executor] = None,
     ) -> ProcessingResult:
-        """エラー継続処理 (最小実装)"""
+        """エラー継続処理
+
+        不正レコードの判定が安価な真偽値チェックで済む場合はpre_checkを
+        渡すことで、例外の送出・捕捉を経ずにエラーとして記録できる。
+        pre_checkを通過したレコードでprocessorが例外を送出した場合も
+        従来どおりエラーとして記録して処理を継続する
+
+        error_sinkには分類・メッセージ整形・ログ出力などエラーごとの後処理を
+        渡す。executorを併せて指定すると後処理をワーカースレッドへ投入し、
+        レコード処理とログI/Oを重ねて実行する（エラーが大量に出る場合向け）
+
+        Args:
+            data: 処理対象レコード（リストに限らず任意のイテラブル／ジェネレータ）
+            processor: 1レコードを処理する関数
+            pre_check: レコードが処理可能ならTrueを返す事前チェック関数
+            error_sink: エラーレコードごとに呼び出す後処理
+            executor: error_sinkを実行するExecutor（未指定時は同期実行）
+
+        Returns:
+            ProcessingResult: 成功結果とエラーレコード
+        """
         successful_results = []
         error_records = []
+        sink_futures = []
+        # ループ内での属性参照を避けるためappendをローカルに束縛
+        append_result = successful_results.append
+        append_error = error_records.append
+
+        def record_error(error_record: ErrorRecord) -> None:
+            append_error(error_record)
+            if error_sink is None:
+                return
+            if executor is None:
+                error_sink(error_record)
+            else:
+                sink_futures.append(executor.submit(error_sink, error_record))
 
         for i, record in enumerate(data):
+            if pre_check is not None and not pre_check(record):
+                record_error(_pre_check_error_record(record, i))
+                continue
+
+            try:
+                append_result(processor(record))
+            except Exception as e:
+                record_error(_error_record(record, i, e))
+
+        # 後処理の完了を待ち、後処理自体の例外は呼び出し元へ伝える
+        for future in as_completed(sink_futures):
+            future.result()
+
+        return ProcessingResult(
+            successful_results=successful_results, error_records=error_records
+        )
+
+    def process_with_error_continuation_vectorized(
+        self,
+        df: "pd.DataFrame",
+        processor: Callable,
+        validators: List[Callable[["pd.DataFrame"], "pd.Series"]],
+    ) -> ProcessingResult:
+        """ベクトル化事前検証付きエラー継続処理
+
+        各validatorはDataFrame全体を受け取り、行ごとの妥当性を表す
+        ブールSeriesを返す。全validatorを満たす行のみprocessorに渡し、
+        満たさない行は例外を発生させずにエラーレコードとして記録する
+
+        Args:
+            df: 処理対象DataFrame
+            processor: 1レコード（辞書）を処理する関数
+            validators: DataFrame → ブールSeriesの検証関数リスト
+
+        Returns:
+            ProcessingResult: 成功結果とエラーレコード
+        """
+        if validators:
+            mask = reduce(operator.and_, (validator(df) for validator in validators))
+            valid_df = df[mask]
+            invalid_df = df[~mask]
+        else:
+            valid_df = df
+            invalid_df = df.iloc[0:0]
+
+        successful_results = []
+        error_records = []
+        append_result = successful_results.append
+        append_error = error_records.append
+
+        for index, record in zip(valid_df.index, valid_df.to_dict("records")):
             try:
-                result = processor(record)
-                successful_results.append(result)
+                append_result(processor(record))
             except Exception as e:
-                error_record = ErrorRecord(
-                    record_id=record.get("employee_id", str(i)),
-                    error=e,
-                    timestamp=str(time.time()),
-                )
-                error_records.append(error_record)
+                append_error(_error_record(record, index, e))
+
+        for index, record in zip(invalid_df.index, invalid_df.to_dict("records")):
+            append_error(_pre_check_error_record(record, index))
 
         return ProcessingResult(
             successful_results=successful_results, error_records=error_records
         )
+
+
+def _error_record(record: dict, position: Any, error: Exception) -> ErrorRecord:
+    """処理に失敗したレコードのエラーレコードを生成"""
+    return ErrorRecord(
+        record_id=record.get("employee_id", str(position)),
+        error=error,
+        timestamp=str(time.time()),
+    )
+
+
+def _pre_check_error_record(record: dict, position: Any) -> ErrorRecord:
+    """事前検証で除外したレコードのエラーレコードを生成（例外は送出しない）"""
+    return _error_record(
+        record, position, ValueError(f"事前検証に失敗しました: 行{position}")
+    )
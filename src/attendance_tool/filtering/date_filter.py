@@ -5,11 +5,11 @@ TASK-103 Green Phase実装
 
 import time
 from datetime import date, datetime
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from dateutil.parser import parse as date_parse
-from dateutil.relativedelta import relativedelta
 
 from .models import (
     DateFilterConfig,
@@ -18,10 +18,17 @@ from .models import (
     FilterResult,
     InvalidPeriodError,
     PeriodSpecification,
-    PeriodType,
+    _month_period,
+    _period_date_range,
+    _relative_period,
 )
 
 
+def _today() -> date:
+    """現在日付の取得（現在日付の参照はここに集約し、テストで差し替える）"""
+    return date.today()
+
+
 class DateFilter:
     """期間フィルタリングメインクラス"""
 
@@ -44,21 +51,21 @@ class DateFilter:
         """
         start_time = time.time()
 
+        # 月の期間は文字列から一度だけ算出する（うるう年・月末日はPeriodが処理）
+        period = _month_period(month)
+
         # 日付列の取得
         date_col = self._get_date_column(df, date_column)
 
+        # 空データはコピー・型変換・マスク生成を省略する
+        if len(df) == 0:
+            return self._empty_result(df, _period_date_range(period), start_time)
+
         # DataFrame準備
         df_work = df.copy()
         self._prepare_dataframe(df_work, date_col)
 
-        # 期間仕様作成
-        spec = PeriodSpecification(period_type=PeriodType.MONTH, month_string=month)
-
-        # フィルタリング実行
-        result = self._execute_filter(df_work, spec, date_col)
-        result.processing_time = time.time() - start_time
-
-        return result
+        return self._filter_by_period(df_work, period, date_col, start_time)
 
     def filter_by_range(
         self,
@@ -81,20 +88,21 @@ class DateFilter:
         # 日付列の取得
         date_col = self._get_date_column(df, date_column)
 
+        # 空データはコピー・型変換・マスク生成を省略する
+        if len(df) == 0:
+            return self._empty_result(df, (start_date_obj, end_date_obj), start_time)
+
         # DataFrame準備
         df_work = df.copy()
         self._prepare_dataframe(df_work, date_col)
 
-        # 期間仕様作成
-        spec = PeriodSpecification(
-            period_type=PeriodType.DATE_RANGE,
-            start_date=start_date_obj,
-            end_date=end_date_obj,
+        selector = self._range_selector(
+            self._dates(df_work, date_col), start_date_obj, end_date_obj
         )
 
-        # フィルタリング実行
-        result = self._execute_filter(df_work, spec, date_col)
-        result.processing_time = time.time() - start_time
+        result = self._build_result(
+            df_work, selector, (start_date_obj, end_date_obj), date_col, start_time
+        )
 
         return result
 
@@ -105,26 +113,34 @@ class DateFilter:
         date_column: str = None,
         reference_date: Optional[date] = None,
     ) -> FilterResult:
-        """相対期間フィルタリング"""
+        """相対期間フィルタリング
+
+        Args:
+            df: 対象DataFrame
+            relative_period: "last_month" / "this_month" / "next_month"
+            date_column: 日付列名（自動検出可）
+            reference_date: 基準日（省略時は今日）
+
+        Returns:
+            FilterResult: フィルタリング結果
+        """
         start_time = time.time()
 
+        # 基準日の月Periodを月数だけずらす（年跨ぎ・うるう年はPeriodが処理）
+        period = _relative_period(relative_period, reference_date or _today())
+
         # 日付列の取得
         date_col = self._get_date_column(df, date_column)
 
+        # 空データはコピー・型変換・マスク生成を省略する
+        if len(df) == 0:
+            return self._empty_result(df, _period_date_range(period), start_time)
+
         # DataFrame準備
         df_work = df.copy()
         self._prepare_dataframe(df_work, date_col)
 
-        # 期間仕様作成
-        spec = PeriodSpecification(
-            period_type=PeriodType.RELATIVE, relative_string=relative_period
-        )
-
-        # フィルタリング実行
-        result = self._execute_filter(df_work, spec, date_col)
-        result.processing_time = time.time() - start_time
-
-        return result
+        return self._filter_by_period(df_work, period, date_col, start_time)
 
     def filter_by_specification(
         self, df: pd.DataFrame, spec: PeriodSpecification, date_column: str = None
@@ -135,20 +151,29 @@ class DateFilter:
         # 日付列の取得
         date_col = self._get_date_column(df, date_column)
 
+        # 空データはコピー・型変換・マスク生成を省略する
+        if len(df) == 0:
+            return self._empty_result(df, spec.to_date_range(_today()), start_time)
+
         # DataFrame準備
         df_work = df.copy()
         self._prepare_dataframe(df_work, date_col)
 
         # フィルタリング実行
-        result = self._execute_filter(df_work, spec, date_col)
-        result.processing_time = time.time() - start_time
+        result = self._execute_filter(df_work, spec, date_col, start_time)
 
         return result
 
     # === プライベートメソッド ===
 
-    def _get_date_column(self, df: pd.DataFrame, date_column: str = None) -> str:
-        """日付列名の取得（自動検出対応）"""
+    def _get_date_column(
+        self, df: pd.DataFrame, date_column: str = None
+    ) -> Optional[str]:
+        """日付列名の取得（自動検出対応）
+
+        日付列がなくインデックスがDatetimeIndexの場合はNoneを返し、
+        インデックスを日付として扱う。
+        """
         if date_column:
             if date_column not in df.columns:
                 raise InvalidPeriodError(
@@ -174,12 +199,20 @@ class DateFilter:
             if pd.api.types.is_datetime64_any_dtype(df[col]):
                 return col
 
+        # 日付インデックス（df.set_index("work_date")等）
+        if isinstance(df.index, pd.DatetimeIndex):
+            return None
+
         raise InvalidPeriodError(
             "日付列が見つかりません。date_columnを明示的に指定してください"
         )
 
-    def _prepare_dataframe(self, df: pd.DataFrame, date_column: str):
+    def _prepare_dataframe(self, df: pd.DataFrame, date_column: Optional[str]):
         """DataFrame前処理"""
+        # 日付インデックスは変換済みのため処理不要
+        if date_column is None:
+            return
+
         # 日付列の型変換
         if not pd.api.types.is_datetime64_any_dtype(df[date_column]):
             try:
@@ -196,28 +229,116 @@ class DateFilter:
                 df.drop(df[invalid_dates].index, inplace=True)
             # 'adjust'の場合は特に処理しない（NaTとして残す）
 
+    def _filter_by_period(
+        self,
+        df: pd.DataFrame,
+        period: pd.Period,
+        date_column: Optional[str],
+        start_time: float,
+    ) -> FilterResult:
+        """月Periodによるフィルタリング実行"""
+        date_mask = self._range_selector(
+            self._dates(df, date_column), *_period_date_range(period)
+        )
+
+        return self._build_result(
+            df, date_mask, _period_date_range(period), date_column, start_time
+        )
+
+    def _dates(
+        self, df: pd.DataFrame, date_column: Optional[str]
+    ) -> Union[pd.Series, pd.DatetimeIndex]:
+        """日付列（Noneの場合は日付インデックス）"""
+        return df.index if date_column is None else df[date_column]
+
+    def _range_selector(
+        self,
+        dates: Union[pd.Series, pd.DatetimeIndex],
+        start_date: date,
+        end_date: date,
+    ) -> Union[np.ndarray, slice]:
+        """日付がstart_dateからend_dateまで（終了日は時刻付きも含む）の行を選ぶ
+
+        全フィルタ共通で、下限は開始日0時・上限は終了日翌日0時（含まない）とする。
+        タイムゾーン付きの日付は、境界を同じタイムゾーンの0時として比較する。
+        """
+        timezone = dates.tz if isinstance(dates, pd.DatetimeIndex) else dates.dt.tz
+        lower = pd.Timestamp(start_date).tz_localize(timezone).value
+        upper = (
+            (pd.Timestamp(end_date) + pd.Timedelta(days=1)).tz_localize(timezone).value
+        )
+
+        # タイムゾーン付きの値はUTCのナノ秒になるため、境界もUTCのナノ秒で比較する
+        values = dates.to_numpy(dtype="datetime64[ns]").view("i8")
+
+        # 日付順に並んでいれば二分探索で境界を求め、マスクを作らず連続スライスで切り出す
+        if dates.is_monotonic_increasing:
+            return slice(
+                np.searchsorted(values, lower, "left"),
+                np.searchsorted(values, upper, "left"),
+            )
+
+        # int64表現同士の比較で1回のベクトル演算にする（NaTは最小値なので除外される）
+        return (values >= lower) & (values < upper)
+
+    def _empty_result(
+        self, df: pd.DataFrame, date_range: Tuple[date, date], start_time: float
+    ) -> FilterResult:
+        """0件入力のフィルタリング結果"""
+        return FilterResult(
+            filtered_data=df.copy(),
+            original_count=0,
+            filtered_count=0,
+            date_range=date_range,
+            processing_time=time.time() - start_time,
+        )
+
     def _execute_filter(
-        self, df: pd.DataFrame, spec: PeriodSpecification, date_column: str
+        self,
+        df: pd.DataFrame,
+        spec: PeriodSpecification,
+        date_column: Optional[str],
+        start_time: float,
     ) -> FilterResult:
         """フィルタリング実行"""
-        original_count = len(df)
-
-        # 期間範囲取得
-        start_date, end_date = spec.to_date_range()
+        # 期間範囲取得（相対指定の基準日もfilter_by_relativeと同じ_todayから取る）
+        start_date, end_date = spec.to_date_range(_today())
 
         # フィルタリング実行
-        date_mask = (df[date_column] >= pd.Timestamp(start_date)) & (
-            df[date_column] <= pd.Timestamp(end_date)
+        date_mask = self._range_selector(
+            self._dates(df, date_column), start_date, end_date
+        )
+
+        return self._build_result(
+            df, date_mask, (start_date, end_date), date_column, start_time
         )
-        filtered_df = df[date_mask].copy()
+
+    def _build_result(
+        self,
+        df: pd.DataFrame,
+        date_mask: Union[pd.Series, np.ndarray, slice],
+        date_range: Tuple[date, date],
+        date_column: Optional[str],
+        start_time: float,
+    ) -> FilterResult:
+        """マスク（または行位置スライス）適用とフィルタリング結果の組み立て
+
+        結果は生成後に変更しないため、処理時間もここで確定させる。
+        """
+        original_count = len(df)
+        if isinstance(date_mask, slice):
+            filtered_df = df.iloc[date_mask].copy()
+        else:
+            filtered_df = df[date_mask].copy()
 
         filtered_count = len(filtered_df)
         excluded_records = original_count - filtered_count
 
         # 統計情報計算
         if filtered_count > 0:
-            earliest_date = filtered_df[date_column].min().date()
-            latest_date = filtered_df[date_column].max().date()
+            filtered_dates = self._dates(filtered_df, date_column)
+            earliest_date = filtered_dates.min().date()
+            latest_date = filtered_dates.max().date()
         else:
             earliest_date = None
             latest_date = None
@@ -226,8 +347,8 @@ class DateFilter:
             filtered_data=filtered_df,
             original_count=original_count,
             filtered_count=filtered_count,
-            date_range=(start_date, end_date),
-            processing_time=0.0,  # 呼び出し元で設定
+            date_range=date_range,
+            processing_time=time.time() - start_time,
             earliest_date=earliest_date,
             latest_date=latest_date,
             excluded_records=excluded_records,
@@ -3,13 +3,52 @@
 TASK-103 Green Phase実装
 """
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple, Union
 
 import pandas as pd
 
+# 月指定文字列 "YYYY-MM" / "YYYY-M"
+_MONTH_STRING_PATTERN = re.compile(r"\d{4}-\d{1,2}")
+
+# 相対期間指定と基準月からの月数
+_RELATIVE_MONTH_OFFSETS = {"last_month": -1, "this_month": 0, "next_month": 1}
+
+
+@lru_cache(maxsize=512)
+def _month_period(month_string: str) -> pd.Period:
+    """月指定文字列を月Periodに変換（同じ月は繰り返し解決されるため結果をキャッシュ）
+
+    うるう年・月末日はPeriodが処理する。
+    """
+    if not _MONTH_STRING_PATTERN.fullmatch(month_string):
+        raise InvalidPeriodError(f"無効な月指定フォーマット: {month_string}")
+    try:
+        return pd.Period(month_string, freq="M")
+    except ValueError:
+        raise InvalidPeriodError(f"無効な月指定フォーマット: {month_string}")
+
+
+@lru_cache(maxsize=64)
+def _relative_period(relative_string: str, reference_date: date) -> pd.Period:
+    """相対指定を月Periodに変換（基準日をキーにし、日付が変われば再計算）
+
+    基準日の月を月数だけずらす（年跨ぎ・うるう年はPeriodが処理）。
+    """
+    months = _RELATIVE_MONTH_OFFSETS.get(relative_string)
+    if months is None:
+        raise InvalidPeriodError(f"未サポートの相対期間: {relative_string}")
+    return pd.Period(reference_date, freq="M") + months
+
+
+def _period_date_range(period: pd.Period) -> Tuple[date, date]:
+    """月Periodの初日・末日"""
+    return (period.start_time.date(), period.end_time.date())
+
 
 class PeriodType(Enum):
     """期間指定種別"""
@@ -31,8 +70,12 @@ class PeriodSpecification:
     relative_string: Optional[str] = None  # "last_month"
     custom_config: Optional[dict] = None  # カスタム設定
 
-    def to_date_range(self) -> Tuple[date, date]:
-        """期間仕様を日付範囲に変換"""
+    def to_date_range(self, reference_date: Optional[date] = None) -> Tuple[date, date]:
+        """期間仕様を日付範囲に変換
+
+        Args:
+            reference_date: 相対指定の基準日（省略時は今日）
+        """
         if self.period_type == PeriodType.DATE_RANGE:
             if self.start_date and self.end_date:
                 return (self.start_date, self.end_date)
@@ -47,7 +90,7 @@ class PeriodSpecification:
 
         elif self.period_type == PeriodType.RELATIVE:
             if self.relative_string:
-                return self._relative_to_range(self.relative_string)
+                return self._relative_to_range(self.relative_string, reference_date)
             else:
                 raise InvalidPeriodError("相対指定にはrelative_stringが必要です")
 
@@ -56,55 +99,15 @@ class PeriodSpecification:
 
     def _month_string_to_range(self, month_string: str) -> Tuple[date, date]:
         """月文字列を日付範囲に変換"""
-        try:
-            year, month = map(int, month_string.split("-"))
-
-            # 月初日
-            start_date = date(year, month, 1)
+        return _period_date_range(_month_period(month_string))
 
-            # 月末日の計算（うるう年対応）
-            if month == 12:
-                next_month_start = date(year + 1, 1, 1)
-            else:
-                next_month_start = date(year, month + 1, 1)
-
-            from datetime import timedelta
-
-            end_date = next_month_start - timedelta(days=1)
-
-            return (start_date, end_date)
-
-        except (ValueError, IndexError) as e:
-            raise InvalidPeriodError(f"無効な月指定フォーマット: {month_string}")
-
-    def _relative_to_range(self, relative_string: str) -> Tuple[date, date]:
+    def _relative_to_range(
+        self, relative_string: str, reference_date: Optional[date] = None
+    ) -> Tuple[date, date]:
         """相対指定を日付範囲に変換"""
-        from dateutil.relativedelta import relativedelta
-
-        today = date.today()
-
-        if relative_string == "last_month":
-            # 先月の範囲
-            last_month_start = today.replace(day=1) - relativedelta(months=1)
-            last_month_end = today.replace(day=1) - relativedelta(days=1)
-            return (last_month_start, last_month_end)
-
-        elif relative_string == "this_month":
-            # 今月の範囲
-            this_month_start = today.replace(day=1)
-            next_month_start = this_month_start + relativedelta(months=1)
-            this_month_end = next_month_start - relativedelta(days=1)
-            return (this_month_start, this_month_end)
-
-        elif relative_string == "next_month":
-            # 来月の範囲
-            next_month_start = today.replace(day=1) + relativedelta(months=1)
-            next_next_month_start = next_month_start + relativedelta(months=1)
-            next_month_end = next_next_month_start - relativedelta(days=1)
-            return (next_month_start, next_month_end)
-
-        else:
-            raise InvalidPeriodError(f"未サポートの相対期間: {relative_string}")
+        return _period_date_range(
+            _relative_period(relative_string, reference_date or date.today())
+        )
 
     def validate(self) -> bool:
         """期間仕様の妥当性検証"""
@@ -118,9 +121,13 @@ class PeriodSpecification:
             return False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FilterResult:
-    """フィルタリング結果"""
+    """フィルタリング結果
+
+    社員別ループ等で大量に生成されるため、slotsでインスタンス辞書を持たず、
+    生成後は変更不可とする。
+    """
 
     filtered_data: pd.DataFrame
     original_count: int
@@ -133,26 +140,37 @@ class FilterResult:
     latest_date: Optional[date] = None
     excluded_records: int = 0
 
+    # get_summary()の計算結果キャッシュ
+    _summary: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def get_summary(self) -> Dict[str, Any]:
-        """サマリー情報取得"""
-        filtered_ratio = (
-            self.filtered_count / self.original_count
-            if self.original_count > 0
-            else 0.0
-        )
-        date_span_days = (self.date_range[1] - self.date_range[0]).days
-
-        return {
-            "original_count": self.original_count,
-            "filtered_count": self.filtered_count,
-            "excluded_records": self.excluded_records,
-            "filtered_ratio": filtered_ratio,
-            "processing_time": self.processing_time,
-            "date_range": self.date_range,
-            "date_span_days": date_span_days,
-            "earliest_date": self.earliest_date,
-            "latest_date": self.latest_date,
-        }
+        """サマリー情報取得（初回のみ計算し、以降はキャッシュのコピーを返す）"""
+        if self._summary is None:
+            filtered_ratio = (
+                self.filtered_count / self.original_count
+                if self.original_count
+                else 0.0
+            )
+            # date同士の減算で日数を求める（日付列を生成しない）
+            date_span_days = (self.date_range[1] - self.date_range[0]).days
+
+            summary = {
+                "original_count": self.original_count,
+                "filtered_count": self.filtered_count,
+                "excluded_records": self.excluded_records,
+                "filtered_ratio": filtered_ratio,
+                "processing_time": self.processing_time,
+                "date_range": self.date_range,
+                "date_span_days": date_span_days,
+                "earliest_date": self.earliest_date,
+                "latest_date": self.latest_date,
+            }
+            # frozenのためキャッシュのみ直接設定する
+            object.__setattr__(self, "_summary", summary)
+        # 呼び出し元での変更がキャッシュに及ばないようコピーを返す
+        return dict(self._summary)
 
 
 @dataclass
@@ -5,16 +5,31 @@ TASK-402: Green Phase - 最小実装
 
 import hashlib
 import json
+import logging
 import uuid
+from collections import defaultdict, deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# メモリ内に保持する監査ログの上限件数（全体・イベント種別ごと）
+# 上限を超えると古いエントリから破棄される（永続化は行わない）
+_MAX_RECENT_LOGS = 10_000
+_MAX_RECENT_LOGS_PER_TYPE = 1_000
 
 
 class AuditLogger:
     """監査ログ機能の最小実装"""
 
     def __init__(self):
-        self._audit_logs: List[Dict[str, Any]] = []
+        self._audit_logs: Deque[Dict[str, Any]] = deque(maxlen=_MAX_RECENT_LOGS)
+        # イベント種別 → 直近の監査ログ（種別指定の取得を走査なしで行うため）
+        self._audit_logs_by_type: Dict[str, Deque[Dict[str, Any]]] = defaultdict(
+            lambda: deque(maxlen=_MAX_RECENT_LOGS_PER_TYPE)
+        )
+        # 上限に達して破棄を始めた保持先（警告は保持先ごとに1度だけ出す）
+        self._evicting: Set[Optional[str]] = set()
 
     def log_audit_event(
         self,
@@ -52,10 +67,30 @@ class AuditLogger:
         audit_entry["integrity_hash"] = self._generate_integrity_hash(audit_entry)
 
         # メモリ内保存（最小実装）
-        self._audit_logs.append(audit_entry)
+        self._append_recent(self._audit_logs, audit_entry, None)
+        self._append_recent(
+            self._audit_logs_by_type[event_type], audit_entry, event_type
+        )
 
         return audit_entry
 
+    def _append_recent(
+        self,
+        logs: Deque[Dict[str, Any]],
+        audit_entry: Dict[str, Any],
+        event_type: Optional[str],
+    ) -> None:
+        """直近の監査ログに追加（上限到達で破棄が始まる時に警告を出す）"""
+        if len(logs) == logs.maxlen and event_type not in self._evicting:
+            self._evicting.add(event_type)
+            logger.warning(
+                "監査ログの保持件数が上限（%d件）に達したため、古いエントリを破棄します"
+                "（イベント種別: %s）",
+                logs.maxlen,
+                event_type or "全体",
+            )
+        logs.append(audit_entry)
+
     def _determine_resource_type(self, resource: str) -> str:
         """リソースタイプの判定"""
         if resource.endswith(".csv"):
@@ -111,8 +146,11 @@ class AuditLogger:
         """完全性ハッシュの生成"""
         # integrity_hashフィールドを除いてハッシュ化
         hash_data = {k: v for k, v in audit_entry.items() if k != "integrity_hash"}
-        hash_string = json.dumps(hash_data, sort_keys=True, ensure_ascii=False)
-        return hashlib.sha256(hash_string.encode()).hexdigest()
+        # キー順固定・区切り文字なしの正規形をハッシュ化（BLAKE2bの256bitダイジェスト）
+        hash_string = json.dumps(
+            hash_data, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+        )
+        return hashlib.blake2b(hash_string.encode("utf-8"), digest_size=32).hexdigest()
 
     def verify_integrity(self, audit_entry: Dict[str, Any]) -> bool:
         """監査ログの完全性検証"""
@@ -124,6 +162,12 @@ class AuditLogger:
         calculated_hash = self._generate_integrity_hash(audit_entry)
         return stored_hash == calculated_hash
 
-    def get_recent_logs(self) -> List[Dict[str, Any]]:
-        """最近の監査ログを取得"""
-        return self._audit_logs.copy()
+    def get_recent_logs(self, event_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """最近の監査ログを取得（イベント種別指定時はその種別のみ）
+
+        メモリ内には全体で直近10,000件、イベント種別ごとに直近1,000件までしか
+        保持しないため、それより古いエントリは返らない
+        """
+        if event_type is None:
+            return list(self._audit_logs)
+        return list(self._audit_logs_by_type.get(event_type, ()))
@@ -8,6 +8,10 @@ from typing import Dict, List, Optional, Pattern
 
 from .config import LoggingConfig
 
+# 番号付き後方参照（\1等）・番号による条件分岐（(?(1)...)）の検出用
+# 結合時に各パターンを名前付きグループで包むとグループ番号がずれるため
+_NUMBERED_GROUP_REFERENCE = re.compile(r"(?<!\\)(?:\\\\)*(?:\\[1-9]|\(\?\(\d)")
+
 
 class PIIMasker:
     """個人情報マスキング機能（改善版）"""
@@ -17,6 +21,8 @@ class PIIMasker:
         self.masking_level = self.config.get("masking.level", "MEDIUM")
         self.enabled = self.config.get("masking.enabled", True)
         self._compiled_patterns: Dict[str, Pattern] = {}
+        self._combined_pattern: Optional[Pattern] = None
+        self._group_names: Dict[str, str] = {}
         self._compile_patterns()
 
     def set_level(self, level: str) -> None:
@@ -47,11 +53,45 @@ class PIIMasker:
                 "employee_id": re.compile(r"(EMP)(\d{4})(\d{2})"),
             }
 
+        self._compile_combined_pattern()
+
+    def _compile_combined_pattern(self) -> None:
+        """全パターンを名前付き選択で結合（1回の走査で全種別を置換するため）
+
+        グループ名は設定上のパターン名に依存しないよう連番で付与する。
+        番号でグループを参照するパターンは結合すると参照先がずれるため、
+        その場合は結合せずパターンごとに適用する
+        """
+        if any(
+            _NUMBERED_GROUP_REFERENCE.search(pattern.pattern)
+            for pattern in self._compiled_patterns.values()
+        ):
+            self._combined_pattern = None
+            return
+
+        self._group_names = {
+            f"p{index}": pattern_name
+            for index, pattern_name in enumerate(self._compiled_patterns)
+        }
+        try:
+            self._combined_pattern = re.compile(
+                "|".join(
+                    f"(?P<{group}>{self._compiled_patterns[name].pattern})"
+                    for group, name in self._group_names.items()
+                )
+            )
+        except re.error:
+            # 結合できないパターン（インラインフラグ等）はパターンごとに適用する
+            self._combined_pattern = None
+
     def mask_text(self, text: str) -> str:
         """テキスト内の個人情報をマスキング（最適化版）"""
         if not self.enabled or self.masking_level == "LOOSE":
             return text
 
+        if self._combined_pattern is not None:
+            return self._combined_pattern.sub(self._replace_match, text)
+
         masked_text = text
 
         # パターンベースのマスキング処理
@@ -62,6 +102,13 @@ class PIIMasker:
 
         return masked_text
 
+    def _replace_match(self, match: re.Match) -> str:
+        """結合パターンのマッチ箇所を、マッチした種別のマスキング規則で置換"""
+        pattern_name = self._group_names[match.lastgroup]
+        return self._apply_masking_pattern(
+            match.group(), pattern_name, self._compiled_patterns[pattern_name]
+        )
+
     def _apply_masking_pattern(
         self, text: str, pattern_name: str, pattern: Pattern
     ) -> str:
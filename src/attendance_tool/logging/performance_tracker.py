@@ -23,7 +23,8 @@ class PerformanceTracker:
 
     def __enter__(self):
         """コンテキストマネージャー入口"""
-        self.start_time = time.time()
+        # 処理時間の計測には単調増加のperf_counterを使用
+        self.start_time = time.perf_counter()
         # 開始時のメモリ使用量を記録
         memory_info = self.process.memory_info()
         self.initial_memory_mb = memory_info.rss / 1024 / 1024
@@ -31,7 +32,7 @@ class PerformanceTracker:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """コンテキストマネージャー出口"""
-        self.end_time = time.time()
+        self.end_time = time.perf_counter()
 
         # 処理時間の計算
         if self.start_time is not None:
@@ -8,6 +8,20 @@ import uuid
 from datetime import datetime
 from typing import Any, Dict, List
 
+try:
+    import orjson
+except ImportError:  # orjsonは任意依存（未インストール時は標準jsonを使用）
+    orjson = None
+
+
+def _dumps_bytes(entry: Dict[str, Any]) -> bytes:
+    """構造化ログエントリをUTF-8のJSONバイト列に変換（orjsonが利用可能なら優先）"""
+    if orjson is not None:
+        return orjson.dumps(entry, default=str)
+    return json.dumps(
+        entry, ensure_ascii=False, separators=(",", ":"), default=str
+    ).encode("utf-8")
+
 
 class StructuredLogger:
     """構造化ログ機能の最小実装"""
@@ -47,6 +61,22 @@ class StructuredLogger:
 
         return structured_entry
 
+    def serialize(self, entry: Dict[str, Any]) -> bytes:
+        """構造化ログエントリをUTF-8のJSONバイト列に変換"""
+        return _dumps_bytes(entry)
+
+    def dispatch(self, entry: Dict[str, Any]) -> Dict[str, bytes]:
+        """ログレベルに応じた出力先ごとの出力内容を作成
+
+        シリアライズは呼び出しごとに1回だけ行い、全出力先で結果を共有する。
+        エントリは呼び出し元が変更し得るため、呼び出しをまたいでは保持しない。
+        """
+        outputs = self.determine_outputs(entry["level"])
+        if not outputs:
+            return {}
+        serialized = self.serialize(entry)
+        return {output: serialized for output in outputs}
+
     def determine_outputs(self, level: str) -> List[str]:
         """ログレベルに応じた出力先の決定"""
         if level == "DEBUG":
@@ -65,7 +95,7 @@ class StructuredLogger:
         else:
             return ["file"]
 
-    def info(self, message: str):
+    def info(self, message: str) -> Dict[str, Any]:
         """INFO レベルログの出力"""
         log_data = {"level": "INFO", "message": message}
         return self.log_structured(log_data)
@@ -0,0 +1,195 @@
+"""ワークシートのデータ行をXMLとして直接書き出す高速出力
+
+openpyxlはセルごとに要素オブジェクトを生成してXMLへ直列化するため、
+大量行の出力ではその処理が大半を占める。ここではopenpyxlで保存した
+ワークブック（ヘッダー行・書式・フィルター・グラフ等を含む）のZIPを複製し、
+対象ワークシートの``</sheetData>``直前へデータ行のXMLを文字列として差し込む。
+セルの表現はopenpyxlの書き込み結果と同じ形式に揃えている。
+ワークブック保存時のZIP圧縮レベルもここで統一して扱う。
+"""
+
+import os
+import shutil
+import tempfile
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from math import isinf, isnan
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, List, Optional, Sequence
+from xml.sax.saxutils import escape
+
+from openpyxl.cell.cell import ERROR_CODES, ILLEGAL_CHARACTERS_RE
+from openpyxl.compat.numbers import NUMERIC_TYPES
+from openpyxl.utils import get_column_letter
+from openpyxl.writer.excel import ExcelWriter
+
+# Excelのセルに格納できる文字列の最大長（openpyxlと同じく超過分は切り詰める）
+_MAX_STRING_LENGTH = 32767
+
+# 差し込むXMLを書き出す単位（行数）
+_ROWS_PER_CHUNK = 1000
+
+_SHEET_DATA_END = b"</sheetData>"
+
+# xlsx（ZIP）の圧縮レベル。既定の6に比べ圧縮時間を大きく短縮でき、
+# サイズの増加は1割未満（レベル1・2はサイズが3割以上増えるため採用しない）
+ZIP_COMPRESSLEVEL = 3
+
+
+def can_write_directly(rows: Iterable[Sequence[Any]]) -> bool:
+    """全セルが直接書き出しで扱える値かどうか
+
+    数式・エラー値として解釈される文字列、XMLに書けない制御文字、
+    数値・文字列・真偽値・None以外の値を含む場合はopenpyxlに任せる。
+    """
+    for row in rows:
+        for value in row:
+            if value is None or isinstance(value, bool):
+                continue
+            if isinstance(value, NUMERIC_TYPES):
+                continue
+            if not isinstance(value, str):
+                return False
+            if (len(value) > 1 and value.startswith("=")) or value in ERROR_CODES:
+                return False
+            if ILLEGAL_CHARACTERS_RE.search(value):
+                return False
+    return True
+
+
+def _cell_xml(reference: str, value: Any) -> str:
+    """1セル分のXML（openpyxlの書き込み形式と同じ）"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return f'<c r="{reference}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, NUMERIC_TYPES):
+        if isnan(value) or isinf(value):
+            return f'<c r="{reference}" t="n"><v></v></c>'
+        return f'<c r="{reference}" t="n"><v>{"%.16g" % value}</v></c>'
+
+    text = value[:_MAX_STRING_LENGTH]
+    if text == "":
+        return f'<c r="{reference}" t="inlineStr" />'
+    stripped = text.strip()
+    space = ' xml:space="preserve"' if stripped and stripped != text else ""
+    return f'<c r="{reference}" t="inlineStr"><is><t{space}>{escape(text)}</t></is></c>'
+
+
+def rows_xml(rows: Sequence[Sequence[Any]], first_row: int) -> Iterable[str]:
+    """データ行のXMLを一定行数ごとの文字列として順に生成"""
+    width = max((len(row) for row in rows), default=0)
+    letters = [get_column_letter(column) for column in range(1, width + 1)]
+
+    chunk: List[str] = []
+    for row_index, row in enumerate(rows, start=first_row):
+        cells = "".join(
+            _cell_xml(f"{letter}{row_index}", value)
+            for letter, value in zip(letters, row)
+        )
+        chunk.append(f'<row r="{row_index}">{cells}</row>')
+        if len(chunk) >= _ROWS_PER_CHUNK:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+def _write_pipelined(part: IO[bytes], chunks: Iterable[str]) -> None:
+    """XML生成と圧縮書き込みを並行させて書き出す
+
+    zlibによる圧縮とファイル書き込みはGILを解放するため、書き込みを1本の
+    ワーカースレッドに任せ、メインスレッドは次のチャンクのXML生成を進める。
+    未完了の書き込みは常に1つまでとし、メモリ使用量と書き込み順序を保つ。
+    """
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        pending: Optional[Future] = None
+        for chunk in chunks:
+            data = chunk.encode("utf-8")
+            if pending is not None:
+                pending.result()
+            pending = writer.submit(part.write, data)
+        if pending is not None:
+            pending.result()
+
+
+def save_workbook(workbook, file_path: Path, compress: bool = True) -> None:
+    """openpyxlのワークブックを圧縮レベルを指定して保存
+
+    Workbook.saveと同じ手順で保存するが、ZIPの圧縮レベルにZIP_COMPRESSLEVELを使う。
+    保存後にappend_sheet_rowsで再圧縮する場合はcompress=Falseで無圧縮とし、
+    同じデータを2回圧縮しないようにする。
+    """
+    if workbook.write_only and not workbook.worksheets:
+        workbook.create_sheet()
+    workbook.properties.modified = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+
+    archive = zipfile.ZipFile(
+        file_path,
+        "w",
+        zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED,
+        allowZip64=True,
+        compresslevel=ZIP_COMPRESSLEVEL if compress else None,
+    )
+    ExcelWriter(workbook, archive).save()
+
+
+def append_sheet_rows(
+    file_path: Path, sheet_rows: Dict[str, Sequence[Sequence[Any]]]
+) -> None:
+    """保存済みワークブックの各ワークシートへデータ行を追記
+
+    Args:
+        file_path: openpyxlで保存したxlsxファイル
+        sheet_rows: ワークシートのパート名（例: ``xl/worksheets/sheet1.xml``）と、
+            ヘッダー行の次から書き込むデータ行
+    """
+    file_path = Path(file_path)
+    fd, temp_name = tempfile.mkstemp(
+        prefix=f".{file_path.stem}-", suffix=".xlsx", dir=file_path.parent
+    )
+    os.close(fd)
+
+    try:
+        with (
+            zipfile.ZipFile(file_path) as source,
+            zipfile.ZipFile(
+                temp_name,
+                "w",
+                zipfile.ZIP_DEFLATED,
+                compresslevel=ZIP_COMPRESSLEVEL,
+            ) as target,
+        ):
+            missing = set(sheet_rows) - set(source.namelist())
+            if missing:
+                raise KeyError(f"ワークシートが見つかりません: {sorted(missing)}")
+
+            for info in source.infolist():
+                if info.filename not in sheet_rows:
+                    target.writestr(
+                        info,
+                        source.read(info),
+                        compress_type=zipfile.ZIP_DEFLATED,
+                        compresslevel=ZIP_COMPRESSLEVEL,
+                    )
+                    continue
+
+                data = source.read(info)
+                split_at = data.rindex(_SHEET_DATA_END)
+                # 既存の行（ヘッダー行）数から書き込み開始行を決める
+                first_row = data.count(b"<row ", 0, split_at) + 1
+
+                with target.open(info.filename, "w", force_zip64=True) as part:
+                    part.write(data[:split_at])
+                    _write_pipelined(
+                        part, rows_xml(sheet_rows[info.filename], first_row)
+                    )
+                    part.write(data[split_at:])
+
+        # mkstempの作成時権限（0600）ではなく、元のファイルの権限を引き継ぐ
+        shutil.copymode(file_path, temp_name)
+        os.replace(temp_name, file_path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
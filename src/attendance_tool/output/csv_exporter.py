@@ -1,11 +1,15 @@
 """CSV出力機能 - Green Phase 最小実装"""
 
+import codecs
+import csv
 import logging
+import operator
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from ..calculation.department_summary import DepartmentSummary
@@ -13,14 +17,49 @@ from ..calculation.summary import AttendanceSummary
 from ..utils.config import ConfigManager
 from .models import CSVColumnConfig, CSVExportConfig, ExportResult
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # pyarrowは任意依存（未インストール時はpandasのto_csvを使用）
+    pa = None
+    pa_csv = None
+
 logger = logging.getLogger(__name__)
 
+# pyarrowで書き出せるエンコーディングと先頭に付けるBOM
+_ARROW_ENCODING_BOMS = {"utf-8": b"", "utf-8-sig": codecs.BOM_UTF8}
+
+# 社員別レポートの元データとなるAttendanceSummaryの属性
+_EMPLOYEE_SOURCE_FIELDS = (
+    "employee_id",
+    "employee_name",
+    "department",
+    "business_days",
+    "attendance_days",
+    "tardiness_count",
+    "early_leave_count",
+    "total_work_minutes",
+    "scheduled_overtime_minutes",
+    "legal_overtime_minutes",
+    "late_night_work_minutes",
+    "paid_leave_days",
+)
+_get_employee_fields = operator.attrgetter(*_EMPLOYEE_SOURCE_FIELDS)
+
+# DataFrameを出力設定に従ってファイルへ書き出す関数
+CSVWriter = Callable[[pd.DataFrame, Path, CSVExportConfig], None]
+
 
 class CSVExporter:
     """CSV形式でのレポート出力機能"""
 
-    def __init__(self):
-        """CSVExporter初期化"""
+    def __init__(self, writer: Optional[CSVWriter] = None):
+        """CSVExporter初期化
+
+        Args:
+            writer: CSVファイルの書き出し関数（省略時は_write_dataframe）
+        """
+        self._writer = writer or self._write_dataframe
         self.config_manager = ConfigManager()
         self._load_csv_config()
 
@@ -121,37 +160,24 @@ class CSVExporter:
         """社員別CSVレポート出力"""
         start_time = time.time()
 
+        # 出力先パスは1回だけ組み立て、エラー時の結果にも同じものを使う
+        output_path = Path(output_path)
+        file_path = output_path / self.employee_config.get_filename(year, month)
+
         try:
             # 出力ディレクトリの作成
-            output_path = Path(output_path)
             output_path.mkdir(parents=True, exist_ok=True)
 
-            # ファイル名生成
-            filename = self.employee_config.get_filename(year, month)
-            file_path = output_path / filename
-
-            # データの変換
-            data_rows = []
-            for summary in summaries:
-                row_data = self._convert_employee_summary_to_row(summary, year, month)
-                data_rows.append(row_data)
-
-            # DataFrame作成
-            if data_rows:
-                df = pd.DataFrame(data_rows)
+            # DataFrame作成（列ごとにまとめて構築）
+            if summaries:
+                df = self._build_employee_frame(summaries, year, month)
             else:
                 # 空データセットの場合はヘッダーのみ
                 column_names = [col.name for col in self.employee_config.columns]
                 df = pd.DataFrame(columns=column_names)
 
             # CSV出力
-            df.to_csv(
-                file_path,
-                index=False,
-                encoding=self.employee_config.encoding,
-                sep=self.employee_config.delimiter,
-                quoting=1,  # QUOTE_ALL で特殊文字を適切に処理
-            )
+            self._writer(df, file_path, self.employee_config)
 
             # ファイルサイズ取得
             file_size = file_path.stat().st_size if file_path.exists() else 0
@@ -173,7 +199,7 @@ class CSVExporter:
         except Exception as e:
             return self._handle_export_error(
                 e,
-                output_path / self.employee_config.get_filename(year, month),
+                file_path,
                 len(summaries),
                 "社員別レポート出力",
             )
@@ -188,15 +214,14 @@ class CSVExporter:
         """部門別CSVレポート出力"""
         start_time = time.time()
 
+        # 出力先パスは1回だけ組み立て、エラー時の結果にも同じものを使う
+        output_path = Path(output_path)
+        file_path = output_path / self.department_config.get_filename(year, month)
+
         try:
             # 出力ディレクトリの作成
-            output_path = Path(output_path)
             output_path.mkdir(parents=True, exist_ok=True)
 
-            # ファイル名生成
-            filename = self.department_config.get_filename(year, month)
-            file_path = output_path / filename
-
             # データの変換
             data_rows = []
             for summary in summaries:
@@ -212,13 +237,7 @@ class CSVExporter:
                 df = pd.DataFrame(columns=column_names)
 
             # CSV出力
-            df.to_csv(
-                file_path,
-                index=False,
-                encoding=self.department_config.encoding,
-                sep=self.department_config.delimiter,
-                quoting=1,
-            )
+            self._writer(df, file_path, self.department_config)
 
             # ファイルサイズ取得
             file_size = file_path.stat().st_size if file_path.exists() else 0
@@ -240,7 +259,7 @@ class CSVExporter:
         except Exception as e:
             return self._handle_export_error(
                 e,
-                output_path / self.department_config.get_filename(year, month),
+                file_path,
                 len(summaries),
                 "部門別レポート出力",
             )
@@ -261,6 +280,35 @@ class CSVExporter:
         result.add_warning("日別詳細レポート機能は未実装です")
         return result
 
+    def _write_dataframe(
+        self, df: pd.DataFrame, file_path: Path, config: CSVExportConfig
+    ) -> None:
+        """DataFrameをCSVファイルに書き出す（pyarrowが利用可能なら優先）
+
+        全項目をクォートして特殊文字を適切に処理する
+        """
+        bom = _ARROW_ENCODING_BOMS.get(config.encoding.lower())
+        if pa is not None and bom is not None and not df.empty:
+            with open(file_path, "wb") as f:
+                f.write(bom)
+                pa_csv.write_csv(
+                    pa.Table.from_pandas(df, preserve_index=False),
+                    f,
+                    write_options=pa_csv.WriteOptions(
+                        include_header=True,
+                        delimiter=config.delimiter,
+                        quoting_style="all_valid",
+                    ),
+                )
+            return
+
+        # ヘッダー・本文（BOM含む）をメモリ上で組み立て、1回の書き込みで出力する
+        content = df.to_csv(
+            index=False, sep=config.delimiter, quoting=csv.QUOTE_ALL
+        ).encode(config.encoding)
+        with open(file_path, "wb") as f:
+            f.write(content)
+
     def _safe_get_value(self, value: Any, default: Any) -> Any:
         """安全な値の取得（None や空文字列の場合はデフォルト値を返す）"""
         if value is None or (isinstance(value, str) and not value.strip()):
@@ -271,13 +319,6 @@ class CSVExporter:
         """分を時間に換算"""
         return minutes / 60.0
 
-    def _calculate_total_overtime_hours(self, summary: AttendanceSummary) -> float:
-        """総残業時間を計算（分→時間）"""
-        total_overtime_minutes = getattr(
-            summary, "scheduled_overtime_minutes", 0
-        ) + getattr(summary, "legal_overtime_minutes", 0)
-        return self._minutes_to_hours(total_overtime_minutes)
-
     def _format_period_string(self, year: int, month: int) -> str:
         """期間文字列をフォーマット"""
         return f"{year}-{month:02d}"
@@ -317,40 +358,60 @@ class CSVExporter:
         result.add_error(error_msg)
         return result
 
-    def _convert_employee_summary_to_row(
-        self, summary: AttendanceSummary, year: int, month: int
-    ) -> Dict[str, Any]:
-        """AttendanceSummaryをCSV行データに変換"""
-        # データバリデーション関数を使用
-        employee_id = self._safe_get_value(summary.employee_id, "UNKNOWN")
-        employee_name = self._safe_get_value(summary.employee_name, "Unknown User")
-        department = self._safe_get_value(summary.department, "未設定")
-
-        # 欠勤日数計算
-        absence_days = max(0, summary.business_days - summary.attendance_days)
-
-        # 時間換算関数を使用
-        total_work_hours = self._minutes_to_hours(summary.total_work_minutes)
-        overtime_hours = self._calculate_total_overtime_hours(summary)
-
-        # 標準労働時間（仮定：8時間/日）
-        standard_work_hours = summary.attendance_days * 8.0
-
-        return {
-            "社員ID": employee_id,
-            "氏名": employee_name,
-            "部署": department,
-            "対象年月": self._format_period_string(year, month),
-            "出勤日数": summary.attendance_days,
-            "欠勤日数": absence_days,
-            "遅刻回数": summary.tardiness_count,
-            "早退回数": summary.early_leave_count,
-            "総労働時間": f"{total_work_hours:.2f}",
-            "所定労働時間": f"{standard_work_hours:.2f}",
-            "残業時間": f"{overtime_hours:.2f}",
-            "深夜労働時間": f"{getattr(summary, 'late_night_work_minutes', 0) / 60.0:.2f}",
-            "有給取得日数": f"{summary.paid_leave_days:.1f}",
-        }
+    def _build_employee_frame(
+        self, summaries: List[AttendanceSummary], year: int, month: int
+    ) -> pd.DataFrame:
+        """AttendanceSummaryのリストから社員別レポートのDataFrameを構築
+
+        行ごとの辞書を作らず、列ごとの配列から一度に構築する。
+        属性はattrgetterで1件につき1回の呼び出しでまとめて取り出す。
+        """
+        rows = list(map(_get_employee_fields, summaries))
+        columns = dict(zip(_EMPLOYEE_SOURCE_FIELDS, zip(*rows)))
+
+        def column(field: str, dtype=None) -> np.ndarray:
+            return np.array(columns.get(field, ()), dtype=dtype)
+
+        def minutes(*fields: str) -> np.ndarray:
+            return sum(column(field, np.float64) for field in fields)
+
+        attendance_days = column("attendance_days")
+        business_days = column("business_days")
+        paid_leave_days = column("paid_leave_days", float)
+
+        return pd.DataFrame(
+            {
+                "社員ID": [
+                    self._safe_get_value(v, "UNKNOWN")
+                    for v in columns.get("employee_id", ())
+                ],
+                "氏名": [
+                    self._safe_get_value(v, "Unknown User")
+                    for v in columns.get("employee_name", ())
+                ],
+                "部署": [
+                    self._safe_get_value(v, "未設定")
+                    for v in columns.get("department", ())
+                ],
+                "対象年月": self._format_period_string(year, month),
+                "出勤日数": attendance_days,
+                "欠勤日数": np.maximum(0, business_days - attendance_days),
+                "遅刻回数": list(columns.get("tardiness_count", ())),
+                "早退回数": list(columns.get("early_leave_count", ())),
+                "総労働時間": np.char.mod("%.2f", minutes("total_work_minutes") / 60.0),
+                # 標準労働時間（仮定：8時間/日）
+                "所定労働時間": np.char.mod("%.2f", attendance_days * 8.0),
+                "残業時間": np.char.mod(
+                    "%.2f",
+                    minutes("scheduled_overtime_minutes", "legal_overtime_minutes")
+                    / 60.0,
+                ),
+                "深夜労働時間": np.char.mod(
+                    "%.2f", minutes("late_night_work_minutes") / 60.0
+                ),
+                "有給取得日数": np.char.mod("%.1f", paid_leave_days),
+            }
+        )
 
     def _convert_department_summary_to_row(
         self, summary: DepartmentSummary, year: int, month: int
@@ -1,25 +1,182 @@
 """Excel出力機能 - Green Phase 最小実装"""
 
 import logging
+import operator
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.chart import BarChart, Reference
 from openpyxl.formatting.rule import CellIsRule
 from openpyxl.styles import Border, Font, PatternFill, Side
+from openpyxl.utils import get_column_letter
 from openpyxl.workbook.workbook import Workbook as OpenpyxlWorkbook
 
 from ..calculation.department_summary import DepartmentSummary
 from ..calculation.summary import AttendanceSummary
 from ..utils.config import ConfigManager
+from ._direct_xlsx_writer import append_sheet_rows, can_write_directly, save_workbook
 from .models import ConditionalFormat, ExcelExportConfig, ExportResult
 
 logger = logging.getLogger(__name__)
 
+_MINUTES_PER_HOUR = 60.0
+
+# 社員別ワークシートのヘッダー行
+_EMPLOYEE_HEADERS = (
+    "社員ID",
+    "氏名",
+    "部署",
+    "対象年月",
+    "出勤日数",
+    "欠勤日数",
+    "遅刻回数",
+    "早退回数",
+    "総労働時間",
+    "所定労働時間",
+    "残業時間",
+    "深夜労働時間",
+    "有給取得日数",
+)
+
+# 部門別ワークシートのヘッダー行
+_DEPARTMENT_HEADERS = (
+    "部署",
+    "対象年月",
+    "所属人数",
+    "総出勤日数",
+    "総欠勤日数",
+    "総労働時間",
+    "総残業時間",
+    "平均出勤率",
+)
+
+# ヘッダーセル・条件付き書式のスタイル（セルごとに生成せず全セルで共有する）
+_THIN_SIDE = Side(style="thin")
+_HEADER_FONT = Font(bold=True)
+_HEADER_FILL = PatternFill(start_color="E6F3FF", end_color="E6F3FF", fill_type="solid")
+_HEADER_BORDER = Border(
+    left=_THIN_SIDE, right=_THIN_SIDE, top=_THIN_SIDE, bottom=_THIN_SIDE
+)
+_GOOD_RATE_FILL = PatternFill(
+    start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"
+)
+_WARNING_RATE_FILL = PatternFill(
+    start_color="FFEB9C", end_color="FFEB9C", fill_type="solid"
+)
+_POOR_RATE_FILL = PatternFill(
+    start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"
+)
+
+# 社員別ワークシートの元データとなるAttendanceSummaryの属性
+_EMPLOYEE_SOURCE_FIELDS = (
+    "employee_id",
+    "employee_name",
+    "department",
+    "business_days",
+    "attendance_days",
+    "tardiness_count",
+    "early_leave_count",
+    "total_work_minutes",
+    "scheduled_overtime_minutes",
+    "legal_overtime_minutes",
+    "late_night_work_minutes",
+    "paid_leave_days",
+)
+_get_employee_fields = operator.attrgetter(*_EMPLOYEE_SOURCE_FIELDS)
+
+# 部門別ワークシートの元データとなるDepartmentSummaryの属性
+_DEPARTMENT_SOURCE_FIELDS = (
+    "department_name",
+    "employee_count",
+    "total_work_minutes",
+    "total_overtime_minutes",
+    "average_work_minutes",
+    "attendance_rate",
+)
+_get_department_fields = operator.attrgetter(*_DEPARTMENT_SOURCE_FIELDS)
+
+# これを超える行数のワークシートはデータ行をXMLとして直接書き出す
+_DIRECT_WRITE_THRESHOLD = 500
+
+# グラフ用データの配置列（J列）
+_CHART_DATA_COLUMN = 10
+
+
+def _source_frame(
+    rows: List[tuple], fields: Tuple[str, ...], text_fields: Tuple[str, ...]
+) -> pd.DataFrame:
+    """属性のタプルの並びを表にまとめる
+
+    文字列の属性はobject型の列として元の値のまま保持する。型推論に任せると
+    NoneがNaNに変換され、_safe_get_valueで既定値に置き換えられなくなる。
+    """
+    frame = pd.DataFrame(rows, columns=fields)
+    for position, field in enumerate(fields):
+        if field in text_fields:
+            frame[field] = pd.Series(
+                [row[position] for row in rows], index=frame.index, dtype=object
+            )
+    return frame
+
+
+def _collect_employee_source(summaries: Iterable[AttendanceSummary]) -> pd.DataFrame:
+    """AttendanceSummaryの並びを1回だけ走査し、出力に必要な属性の表にまとめる
+
+    ジェネレーターも受け付ける。各サマリーは属性を取り出した時点で不要になる。
+    """
+    return _source_frame(
+        list(map(_get_employee_fields, summaries)),
+        _EMPLOYEE_SOURCE_FIELDS,
+        ("employee_id", "employee_name", "department"),
+    )
+
+
+def _collect_department_source(
+    summaries: Iterable[DepartmentSummary],
+) -> pd.DataFrame:
+    """DepartmentSummaryの並びを1回だけ走査し、出力に必要な属性の表にまとめる"""
+    return _source_frame(
+        list(map(_get_department_fields, summaries)),
+        _DEPARTMENT_SOURCE_FIELDS,
+        ("department_name",),
+    )
+
+
+def _column_widths(frame: pd.DataFrame) -> List[int]:
+    """表の各列の表示幅（ヘッダーと値の最大文字数+2、上限50）を算出
+
+    整数列は最小値・最大値の桁数だけで決まるため全セルを文字列化しない。
+    それ以外の列も重複を除いた値だけを文字列化する。
+    """
+    widths = []
+    for header in frame.columns:
+        values = frame[header].dropna()
+        if values.empty:
+            max_length = 0
+        elif values.dtype.kind in "iu":
+            max_length = max(len(str(values.min())), len(str(values.max())))
+        else:
+            max_length = max(map(len, map(str, values.unique())))
+        max_length = max(max_length, len(str(header)))
+        widths.append(min(max_length + 2, 50))  # 最大幅制限
+    return widths
+
+
+def _minutes_to_hour_columns(*minute_columns) -> np.ndarray:
+    """分単位の列をまとめて時間（小数点以下2桁）に換算
+
+    各列を(N, 列数)の配列に積み、除算と丸めを配列全体に対して1回ずつ行う。
+    戻り値は列ごとに展開できるよう転置した(列数, N)の配列。
+    """
+    minutes = np.column_stack(minute_columns).astype(np.float64)
+    return np.round(minutes / _MINUTES_PER_HOUR, 2).T
+
 
 class ExcelExporter:
     """Excel形式でのレポート出力機能"""
@@ -64,48 +221,64 @@ class ExcelExporter:
 
     def export_excel_report(
         self,
-        employee_summaries: List[AttendanceSummary],
-        department_summaries: List[DepartmentSummary],
+        employee_summaries: Iterable[AttendanceSummary],
+        department_summaries: Iterable[DepartmentSummary],
         output_path: Path,
         year: int,
         month: int,
         include_charts: bool = False,
     ) -> ExportResult:
-        """Excel形式でのレポート出力"""
+        """Excel形式でのレポート出力
+
+        社員サマリーはジェネレーターでもよく、1回だけ走査する。
+        出力件数は実際に書き込んだ行数から求める。
+        """
         start_time = time.time()
+        record_count = 0
+
+        # 出力先パスは1回だけ組み立て、エラー時の結果にも同じものを使う
+        output_path = Path(output_path)
+        file_path = output_path / self.excel_config.get_filename(year, month)
 
         try:
             # 出力ディレクトリの作成
-            output_path = Path(output_path)
             output_path.mkdir(parents=True, exist_ok=True)
 
-            # ファイル名生成
-            filename = self.excel_config.get_filename(year, month)
-            file_path = output_path / filename
+            # Excelワークブック作成（行を逐次書き出す書き込み専用モード）
+            # lxmlが導入されていればopenpyxlはlxmlの逐次XML出力を使用する
+            workbook = Workbook(write_only=True)
 
-            # Excelワークブック作成
-            workbook = Workbook()
+            # 部門サマリーは複数のシートで参照するため一度だけ確定させる
+            department_summaries = list(department_summaries)
+            employee_source = _collect_employee_source(employee_summaries)
 
-            # デフォルトシートを削除
-            if "Sheet" in workbook.sheetnames:
-                workbook.remove(workbook["Sheet"])
-
-            # ワークシート作成
-            self.export_employee_worksheet(workbook, employee_summaries, year, month)
+            # ワークシート作成（大量のデータ行は保存後に直接書き出す）
+            deferred_rows: List[Tuple[Any, List[tuple]]] = []
+            record_count = self._write_employee_sheet(
+                workbook, employee_source, year, month, deferred_rows
+            )
             self.export_department_worksheet(
                 workbook, department_summaries, year, month
             )
-            self.export_summary_worksheet(
+            self._write_summary_sheet(
                 workbook,
-                employee_summaries,
+                employee_source,
                 department_summaries,
-                year,
-                month,
                 include_charts,
             )
 
             # ファイル保存
-            workbook.save(file_path)
+            # 保存後にデータ行を差し込む場合は、そこで1回だけ圧縮する
+            save_workbook(workbook, file_path, compress=not deferred_rows)
+            if deferred_rows:
+                # ワークシートのパート名は保存時に確定する
+                append_sheet_rows(
+                    file_path,
+                    {
+                        worksheet.path.lstrip("/"): rows
+                        for worksheet, rows in deferred_rows
+                    },
+                )
 
             # ファイルサイズ取得
             file_size = file_path.stat().st_size if file_path.exists() else 0
@@ -114,131 +287,106 @@ class ExcelExporter:
             result = ExportResult(
                 success=True,
                 file_path=file_path,
-                record_count=len(employee_summaries),
+                record_count=record_count,
                 file_size=file_size,
                 processing_time=processing_time,
             )
 
             # 空データの警告
-            if not employee_summaries and not department_summaries:
+            if not record_count and not department_summaries:
                 result.add_warning(
                     "データが空のためヘッダーのみのファイルを作成しました"
                 )
 
-            logger.info(
-                f"Excelレポートを出力しました: {file_path} ({len(employee_summaries)}件)"
-            )
+            logger.info(f"Excelレポートを出力しました: {file_path} ({record_count}件)")
             return result
 
         except Exception as e:
             return self._handle_export_error(
                 e,
-                output_path / self.excel_config.get_filename(year, month),
-                len(employee_summaries),
+                file_path,
+                record_count,
                 "Excelレポート出力",
             )
 
     def export_employee_worksheet(
         self,
         workbook: OpenpyxlWorkbook,
-        summaries: List[AttendanceSummary],
+        summaries: Iterable[AttendanceSummary],
         year: int,
         month: int,
-    ) -> None:
-        """社員別ワークシート出力"""
-        worksheet = workbook.create_sheet(self.excel_config.worksheet_names["employee"])
-
-        # ヘッダー行定義
-        headers = [
-            "社員ID",
-            "氏名",
-            "部署",
-            "対象年月",
-            "出勤日数",
-            "欠勤日数",
-            "遅刻回数",
-            "早退回数",
-            "総労働時間",
-            "所定労働時間",
-            "残業時間",
-            "深夜労働時間",
-            "有給取得日数",
-        ]
-
-        # ヘッダー行書き込み
-        for col, header in enumerate(headers, 1):
-            cell = worksheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
+    ) -> int:
+        """社員別ワークシート出力（書き込んだデータ行数を返す）"""
+        return self._write_employee_sheet(
+            workbook, _collect_employee_source(summaries), year, month
+        )
 
-        # データ行書き込み
-        for row, summary in enumerate(summaries, 2):
-            row_data = self._convert_employee_summary_to_row(summary, year, month)
-            for col, (header, value) in enumerate(zip(headers, row_data.values()), 1):
-                worksheet.cell(row=row, column=col, value=value)
+    def _write_employee_sheet(
+        self,
+        workbook: OpenpyxlWorkbook,
+        source: pd.DataFrame,
+        year: int,
+        month: int,
+        deferred_rows: Optional[List[Tuple[Any, List[tuple]]]] = None,
+    ) -> int:
+        """属性表から社員別ワークシートを書き込み、データ行数を返す"""
+        worksheet = workbook.create_sheet(self.excel_config.worksheet_names["employee"])
 
-        # Excel固有機能の適用
-        self._apply_excel_features(worksheet)
+        frame = self._build_employee_frame(source, year, month)
+        self._write_table(worksheet, frame, deferred_rows)
+        return len(frame)
 
     def export_department_worksheet(
         self,
         workbook: OpenpyxlWorkbook,
-        summaries: List[DepartmentSummary],
+        summaries: Iterable[DepartmentSummary],
         year: int,
         month: int,
     ) -> None:
         """部門別ワークシート出力"""
+        summaries = list(summaries)
         worksheet = workbook.create_sheet(
             self.excel_config.worksheet_names["department"]
         )
 
-        # ヘッダー行定義
-        headers = [
-            "部署",
-            "対象年月",
-            "所属人数",
-            "総出勤日数",
-            "総欠勤日数",
-            "総労働時間",
-            "総残業時間",
-            "平均出勤率",
-        ]
-
-        # ヘッダー行書き込み
-        for col, header in enumerate(headers, 1):
-            cell = worksheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
-        # データ行書き込み
-        for row, summary in enumerate(summaries, 2):
-            row_data = self._convert_department_summary_to_row(summary, year, month)
-            for col, (header, value) in enumerate(zip(headers, row_data.values()), 1):
-                worksheet.cell(row=row, column=col, value=value)
-
         # 条件付き書式の適用
         self._apply_conditional_formatting(worksheet, summaries)
 
-        # Excel固有機能の適用
-        self._apply_excel_features(worksheet)
+        frame = self._build_department_frame(
+            _collect_department_source(summaries), year, month
+        )
+        self._write_table(worksheet, frame)
 
     def export_summary_worksheet(
         self,
         workbook: OpenpyxlWorkbook,
-        employee_summaries: List[AttendanceSummary],
-        department_summaries: List[DepartmentSummary],
+        employee_summaries: Iterable[AttendanceSummary],
+        department_summaries: Iterable[DepartmentSummary],
         year: int,
         month: int,
         include_charts: bool = False,
     ) -> None:
         """サマリーワークシート出力"""
+        self._write_summary_sheet(
+            workbook,
+            _collect_employee_source(employee_summaries),
+            list(department_summaries),
+            include_charts,
+        )
+
+    def _write_summary_sheet(
+        self,
+        workbook: OpenpyxlWorkbook,
+        employee_source: pd.DataFrame,
+        department_summaries: List[DepartmentSummary],
+        include_charts: bool = False,
+    ) -> None:
+        """社員の属性表と部門サマリーからサマリーワークシートを書き込み"""
         worksheet = workbook.create_sheet(self.excel_config.worksheet_names["summary"])
 
         # サマリー情報の計算
-        total_employees = len(employee_summaries)
-        total_work_days = (
-            sum(s.attendance_days for s in employee_summaries)
-            if employee_summaries
-            else 0
-        )
+        total_employees = len(employee_source)
+        total_work_days = int(employee_source["attendance_days"].sum())
         avg_attendance_rate = (
             sum(d.attendance_rate for d in department_summaries)
             / len(department_summaries)
@@ -246,12 +394,11 @@ class ExcelExporter:
             else 0
         )
         total_overtime_hours = (
-            sum(
-                (s.scheduled_overtime_minutes + s.legal_overtime_minutes) / 60.0
-                for s in employee_summaries
+            int(
+                employee_source["scheduled_overtime_minutes"].sum()
+                + employee_source["legal_overtime_minutes"].sum()
             )
-            if employee_summaries
-            else 0
+            / _MINUTES_PER_HOUR
         )
         department_count = len(department_summaries)
 
@@ -264,33 +411,69 @@ class ExcelExporter:
             ("部門数", department_count),
         ]
 
-        for row, (label, value) in enumerate(summary_data, 1):
-            worksheet.cell(row=row, column=1, value=label)
-            worksheet.cell(row=row, column=2, value=value)
+        rows = [[label, value] for label, value in summary_data]
 
         # グラフ作成（基本実装）
         if include_charts and department_summaries:
+            chart_rows = [("部門名", "出勤率")] + [
+                (dept.department_name, dept.attendance_rate)
+                for dept in department_summaries
+            ]
+            # グラフ用データはサマリー情報と同じ行のJ列以降に配置
+            rows.extend([] for _ in range(len(chart_rows) - len(rows)))
+            for row, chart_row in zip(rows, chart_rows):
+                row.extend([None] * (_CHART_DATA_COLUMN - 1 - len(row)))
+                row.extend(chart_row)
             self._create_department_chart(worksheet, department_summaries)
 
+        for row in rows:
+            worksheet.append(row)
+
+    def _write_table(self, worksheet, frame: pd.DataFrame, deferred_rows=None) -> None:
+        """表の列名をヘッダー行、各行をデータ行として書き込み、Excel固有機能を適用
+
+        書き込み専用ワークシートでは行を書き出した後に列幅等を変更できないため、
+        表から列幅を先に求めてから書き込む。
+        deferred_rowsが渡され行数が閾値を超える場合、データ行はここでは書き込まず
+        ワークシートと共に登録し、保存後にappend_sheet_rowsで書き出す。
+        """
+        headers = list(frame.columns)
+        rows = list(frame.itertuples(index=False, name=None))
+        self._apply_excel_features(
+            worksheet, len(headers), len(rows), _column_widths(frame)
+        )
+
+        worksheet.append([self._header_cell(worksheet, header) for header in headers])
+        if (
+            deferred_rows is not None
+            and len(rows) > _DIRECT_WRITE_THRESHOLD
+            and can_write_directly(rows)
+        ):
+            deferred_rows.append((worksheet, rows))
+            return
+        for row in rows:
+            worksheet.append(row)
+
+    def _header_cell(self, worksheet, value) -> WriteOnlyCell:
+        """スタイルを適用したヘッダーセルを作成"""
+        cell = WriteOnlyCell(worksheet, value=value)
+        self._apply_header_style(cell)
+        return cell
+
     def _apply_header_style(self, cell) -> None:
         """ヘッダーセルのスタイル適用"""
-        cell.font = Font(bold=True)
-        cell.fill = PatternFill(
-            start_color="E6F3FF", end_color="E6F3FF", fill_type="solid"
-        )
-        cell.border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
-        )
+        cell.font = _HEADER_FONT
+        cell.fill = _HEADER_FILL
+        cell.border = _HEADER_BORDER
 
-    def _apply_excel_features(self, worksheet) -> None:
+    def _apply_excel_features(
+        self, worksheet, column_count: int, row_count: int, widths: List[int]
+    ) -> None:
         """Excel固有機能の適用"""
         # 自動フィルター設定
-        if worksheet.max_row > 1:
+        if row_count:
             worksheet.auto_filter.ref = (
-                f"A1:{chr(64 + worksheet.max_column)}{worksheet.max_row}"
+                f"A1:{get_column_letter(column_count)}{row_count + 1}"
             )
 
         # ウィンドウ枠固定（ヘッダー行）
@@ -300,18 +483,9 @@ class ExcelExporter:
         worksheet.page_setup.fitToWidth = 1
         worksheet.page_setup.fitToHeight = 0
 
-        # 自動幅調整（基本実装）
-        for column in worksheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)  # 最大幅制限
-            worksheet.column_dimensions[column_letter].width = adjusted_width
+        # 自動幅調整（列幅は表から事前に算出済み）
+        for column, width in enumerate(widths, start=1):
+            worksheet.column_dimensions[get_column_letter(column)].width = width
 
     def _apply_conditional_formatting(
         self, worksheet, summaries: List[DepartmentSummary]
@@ -330,27 +504,21 @@ class ExcelExporter:
         green_rule = CellIsRule(
             operator="greaterThanOrEqual",
             formula=["95"],
-            fill=PatternFill(
-                start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"
-            ),
+            fill=_GOOD_RATE_FILL,
         )
 
         # 90-95%: 黄色
         yellow_rule = CellIsRule(
             operator="between",
             formula=["90", "95"],
-            fill=PatternFill(
-                start_color="FFEB9C", end_color="FFEB9C", fill_type="solid"
-            ),
+            fill=_WARNING_RATE_FILL,
         )
 
         # 90%未満: 赤色
         red_rule = CellIsRule(
             operator="lessThan",
             formula=["90"],
-            fill=PatternFill(
-                start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"
-            ),
+            fill=_POOR_RATE_FILL,
         )
 
         worksheet.conditional_formatting.add(data_range, green_rule)
@@ -361,19 +529,8 @@ class ExcelExporter:
         self, worksheet, department_summaries: List[DepartmentSummary]
     ) -> None:
         """部門別出勤率グラフの作成"""
-        # グラフ用データを配置（H列以降に配置）
-        chart_start_col = 10  # J列
-
-        # ヘッダー
-        worksheet.cell(row=1, column=chart_start_col, value="部門名")
-        worksheet.cell(row=1, column=chart_start_col + 1, value="出勤率")
-
-        # データ
-        for row, dept in enumerate(department_summaries, 2):
-            worksheet.cell(row=row, column=chart_start_col, value=dept.department_name)
-            worksheet.cell(
-                row=row, column=chart_start_col + 1, value=dept.attendance_rate
-            )
+        # グラフ用データはJ列以降に配置済み
+        chart_start_col = _CHART_DATA_COLUMN
 
         # 棒グラフ作成
         chart = BarChart()
@@ -435,70 +592,81 @@ class ExcelExporter:
         result.add_error(error_msg)
         return result
 
-    def _convert_employee_summary_to_row(
-        self, summary: AttendanceSummary, year: int, month: int
-    ) -> Dict[str, Any]:
-        """AttendanceSummaryをExcel行データに変換（CSVExporter から共通化）"""
-        # データバリデーション
-        employee_id = self._safe_get_value(summary.employee_id, "UNKNOWN")
-        employee_name = self._safe_get_value(summary.employee_name, "Unknown User")
-        department = self._safe_get_value(summary.department, "未設定")
-
-        # 欠勤日数計算
-        absence_days = max(0, summary.business_days - summary.attendance_days)
-
-        # 時間換算
-        total_work_hours = self._minutes_to_hours(summary.total_work_minutes)
-        overtime_hours = self._minutes_to_hours(
-            summary.scheduled_overtime_minutes + summary.legal_overtime_minutes
+    def _build_employee_frame(
+        self, source: pd.DataFrame, year: int, month: int
+    ) -> pd.DataFrame:
+        """社員の属性表から社員別ワークシートの表を構築（換算・集計は列単位で行う）"""
+
+        # 分単位の3列を(N, 3)の配列にまとめ、時間への換算を1回の演算で行う
+        work_hours, overtime_hours, late_night_hours = _minutes_to_hour_columns(
+            source["total_work_minutes"],
+            source["scheduled_overtime_minutes"] + source["legal_overtime_minutes"],
+            source["late_night_work_minutes"],
+        )
+
+        return pd.DataFrame(
+            {
+                # データバリデーション
+                "社員ID": [
+                    self._safe_get_value(v, "UNKNOWN") for v in source["employee_id"]
+                ],
+                "氏名": [
+                    self._safe_get_value(v, "Unknown User")
+                    for v in source["employee_name"]
+                ],
+                "部署": [
+                    self._safe_get_value(v, "未設定") for v in source["department"]
+                ],
+                "対象年月": self._format_period_string(year, month),
+                "出勤日数": source["attendance_days"],
+                "欠勤日数": (source["business_days"] - source["attendance_days"]).clip(
+                    lower=0
+                ),
+                "遅刻回数": source["tardiness_count"],
+                "早退回数": source["early_leave_count"],
+                "総労働時間": work_hours,
+                # 標準労働時間（仮定：8時間/日）
+                "所定労働時間": (source["attendance_days"] * 8.0).round(2),
+                "残業時間": overtime_hours,
+                "深夜労働時間": late_night_hours,
+                "有給取得日数": source["paid_leave_days"].round(1),
+            },
+            columns=_EMPLOYEE_HEADERS,
         )
 
-        # 標準労働時間（仮定：8時間/日）
-        standard_work_hours = summary.attendance_days * 8.0
-
-        return {
-            "社員ID": employee_id,
-            "氏名": employee_name,
-            "部署": department,
-            "対象年月": self._format_period_string(year, month),
-            "出勤日数": summary.attendance_days,
-            "欠勤日数": absence_days,
-            "遅刻回数": summary.tardiness_count,
-            "早退回数": summary.early_leave_count,
-            "総労働時間": round(total_work_hours, 2),
-            "所定労働時間": round(standard_work_hours, 2),
-            "残業時間": round(overtime_hours, 2),
-            "深夜労働時間": round(
-                getattr(summary, "late_night_work_minutes", 0) / 60.0, 2
-            ),
-            "有給取得日数": round(summary.paid_leave_days, 1),
-        }
-
-    def _convert_department_summary_to_row(
-        self, summary: DepartmentSummary, year: int, month: int
-    ) -> Dict[str, Any]:
-        """DepartmentSummaryをExcel行データに変換（CSVExporter から共通化）"""
-        department_name = self._safe_get_value(summary.department_name, "未設定部門")
-
-        # 時間換算
-        total_work_hours = self._minutes_to_hours(summary.total_work_minutes)
-        total_overtime_hours = self._minutes_to_hours(summary.total_overtime_minutes)
-
-        # 推定値計算
+    def _build_department_frame(
+        self, source: pd.DataFrame, year: int, month: int
+    ) -> pd.DataFrame:
+        """部門の属性表から部門別ワークシートの表を構築"""
+
+        # 推定値計算（平均労働時間から総出勤日数を逆算、22営業日と仮定して欠勤日数を推定）
+        employee_count = source["employee_count"]
+        average_work_minutes = source["average_work_minutes"]
         total_work_days = (
-            int(summary.employee_count * summary.average_work_minutes / 480)
-            if summary.average_work_minutes > 0
-            else 0
+            (employee_count * average_work_minutes / 480)
+            .where(average_work_minutes > 0, 0)
+            .astype("int64")
+        )
+        total_absent_days = (employee_count * 22 - total_work_days).clip(lower=0)
+
+        work_hours, overtime_hours = _minutes_to_hour_columns(
+            source["total_work_minutes"], source["total_overtime_minutes"]
+        )
+
+        return pd.DataFrame(
+            {
+                "部署": [
+                    self._safe_get_value(v, "未設定部門")
+                    for v in source["department_name"]
+                ],
+                "対象年月": self._format_period_string(year, month),
+                "所属人数": employee_count,
+                "総出勤日数": total_work_days,
+                "総欠勤日数": total_absent_days,
+                "総労働時間": work_hours,
+                "総残業時間": overtime_hours,
+                # 出勤率は任意の小数のため、組み込みのround()で丸める
+                "平均出勤率": [round(v, 1) for v in source["attendance_rate"]],
+            },
+            columns=_DEPARTMENT_HEADERS,
         )
-        total_absent_days = max(0, summary.employee_count * 22 - total_work_days)
-
-        return {
-            "部署": department_name,
-            "対象年月": self._format_period_string(year, month),
-            "所属人数": summary.employee_count,
-            "総出勤日数": total_work_days,
-            "総欠勤日数": total_absent_days,
-            "総労働時間": round(total_work_hours, 2),
-            "総残業時間": round(total_overtime_hours, 2),
-            "平均出勤率": round(summary.attendance_rate, 1),
-        }
@@ -6,9 +6,12 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportResult:
-    """CSV出力結果"""
+    """CSV出力結果
+
+    レポートごとに生成されるため、slotsでインスタンス辞書を持たない。
+    """
 
     success: bool
     file_path: Path
@@ -28,7 +31,7 @@ class ExportResult:
         self.warnings.append(warning)
 
 
-@dataclass
+@dataclass(slots=True)
 class CSVColumnConfig:
     """CSV列設定"""
 
@@ -37,7 +40,7 @@ class CSVColumnConfig:
     format: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CSVExportConfig:
     """CSV出力設定"""
 
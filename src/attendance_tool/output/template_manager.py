@@ -1,8 +1,11 @@
 """テンプレート管理機能 - TASK-303実装"""
 
+import codecs
+import copy
 import logging
 import shutil
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -11,6 +14,7 @@ import yaml
 from ..calculation.department_summary import DepartmentSummary
 from ..calculation.summary import AttendanceSummary
 from ..utils.config import ConfigManager
+from ._direct_xlsx_writer import save_workbook
 from .csv_exporter import CSVExporter
 from .excel_exporter import ExcelExporter
 from .models import ExportResult
@@ -18,9 +22,19 @@ from .models import ExportResult
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _parse_template_config(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """テンプレート設定ファイルの解析結果（更新時刻をキーにし、変更されれば再解析）"""
+    with open(config_path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
 class TemplateManager:
     """レポートテンプレート管理クラス"""
 
+    # 複数月統合レポートで扱える最大月数（設定ファイルで未指定の場合）
+    MAX_MONTHS = 12
+
     def __init__(self):
         """TemplateManager初期化"""
         self.config_manager = ConfigManager()
@@ -33,8 +47,11 @@ class TemplateManager:
         try:
             config_path = Path("config/template_config.yaml")
             if config_path.exists():
-                with open(config_path, "r", encoding="utf-8") as f:
-                    return yaml.safe_load(f)
+                # キャッシュを共有するため、インスタンスごとの変更に備えてコピーを返す
+                parsed = _parse_template_config(
+                    str(config_path.resolve()), config_path.stat().st_mtime_ns
+                )
+                return copy.deepcopy(parsed)
             else:
                 logger.warning(
                     "テンプレート設定ファイルが見つかりません。デフォルト設定を使用します。"
@@ -67,7 +84,7 @@ class TemplateManager:
             "template_features": {
                 "comparison": {"enabled": True, "previous_months": 3},
                 "charts": {"enabled": True, "chart_types": ["bar_chart"]},
-                "multi_month": {"enabled": True, "max_months": 12},
+                "multi_month": {"enabled": True, "max_months": self.MAX_MONTHS},
             },
         }
 
@@ -319,7 +336,8 @@ class TemplateManager:
             if style_info:
                 self._apply_excel_styles(workbook, style_info)
 
-            workbook.save(file_path)
+            # 出力時と同じ圧縮レベルで保存し直す
+            save_workbook(workbook, file_path)
 
         except Exception as e:
             logger.error(f"Excel テンプレート適用エラー: {e}")
@@ -403,16 +421,16 @@ class TemplateManager:
 
         primary_color = style_info.get("primary_color", "#2E86AB").replace("#", "")
 
+        # ヘッダーセルのスタイル（全ワークシートで同じオブジェクトを共有）
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(
+            start_color=primary_color, end_color=primary_color, fill_type="solid"
+        )
+
         # 各ワークシートにスタイル適用
         for sheet_name in workbook.sheetnames:
             worksheet = workbook[sheet_name]
 
-            # ヘッダーセルのスタイル適用
-            header_font = Font(bold=True, color="FFFFFF")
-            header_fill = PatternFill(
-                start_color=primary_color, end_color=primary_color, fill_type="solid"
-            )
-
             # 最初の行（ヘッダー）にスタイル適用
             for cell in worksheet[1]:
                 if cell.value:
@@ -434,9 +452,9 @@ class TemplateManager:
         if not any(header_format.values()):
             return  # ヘッダー情報が不要な場合はスキップ
 
-        # 既存ファイルの読み取り
-        with open(file_path, "r", encoding="utf-8-sig") as f:
-            original_content = f.read()
+        # 既存ファイルはデコードせずバイト列のまま読み取る（先頭のBOMは付け直すため除去）
+        with open(file_path, "rb") as f:
+            original_content = f.read().removeprefix(codecs.BOM_UTF8)
 
         # ヘッダー情報の生成
         header_lines = []
@@ -456,9 +474,10 @@ class TemplateManager:
 
         header_lines.append("")  # 空行
 
-        # ヘッダー付きファイルの書き込み
-        with open(file_path, "w", encoding="utf-8-sig") as f:
-            f.write("\n".join(header_lines))
+        # ヘッダーはレポート出力時と同じエンコーディングで書き込む
+        encoding = getattr(self.csv_exporter, f"{report_type}_config").encoding
+        with open(file_path, "wb") as f:
+            f.write("\n".join(header_lines).encode(encoding))
             f.write(original_content)
 
     def generate_multi_month_report(
@@ -490,9 +509,13 @@ class TemplateManager:
                 )
 
             # 月数制限チェック
-            max_months = multi_month.get("max_months", 12)
-            month_count = self._calculate_month_count(
-                start_year, start_month, end_year, end_month
+            # 期間の月数に加え、渡されたデータの月数も制限の対象とする
+            max_months = multi_month.get("max_months", self.MAX_MONTHS)
+            month_count = max(
+                self._calculate_month_count(
+                    start_year, start_month, end_year, end_month
+                ),
+                len(data_by_month),
             )
 
             if month_count > max_months:
@@ -541,21 +564,13 @@ class TemplateManager:
     def _calculate_month_count(
         self, start_year: int, start_month: int, end_year: int, end_month: int
     ) -> int:
-        """月数の計算"""
-        start_date = datetime(start_year, start_month, 1)
-        end_date = datetime(end_year, end_month, 1)
-
-        month_count = 0
-        current = start_date
-        while current <= end_date:
-            month_count += 1
-            # 次の月に移動
-            if current.month == 12:
-                current = current.replace(year=current.year + 1, month=1)
-            else:
-                current = current.replace(month=current.month + 1)
+        """月数の計算（開始月・終了月を含む。終了が開始より前なら0）"""
+        for month in (start_month, end_month):
+            if not 1 <= month <= 12:
+                raise ValueError(f"month must be in 1..12: {month}")
 
-        return month_count
+        month_count = (end_year - start_year) * 12 + (end_month - start_month) + 1
+        return max(month_count, 0)
 
     def _aggregate_multi_month_data(
         self, data_by_month: Dict[str, Dict]
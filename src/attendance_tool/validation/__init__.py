@@ -4,6 +4,10 @@ TASK-102: データ検証・クレンジング機能の実装
 pydantic風のデータモデル定義と業務ルールに基づくデータ検証・クレンジング機能を提供
 """
 
+import importlib
+import warnings
+from typing import Any
+
 # モデルは常にインポート可能
 from .models import (
     AttendanceRecord,
@@ -23,32 +27,37 @@ __all__ = [
     "ValidationRule",
 ]
 
-# pandas依存のモジュールは条件付きインポート
-try:
-    from .cleaner import CleaningResult, CorrectionSuggestion, DataCleaner
-    from .validator import (
-        DataValidator,
-        ValidationError,
-        ValidationReport,
-        ValidationWarning,
-    )
-
-    __all__.extend(
-        [
-            "DataValidator",
-            "ValidationReport",
-            "ValidationError",
-            "ValidationWarning",
-            "DataCleaner",
-            "CleaningResult",
-            "CorrectionSuggestion",
-        ]
-    )
-
-except ImportError as e:
-    # pandas等が利用できない場合のフォールバック
-    print(
-        f"Warning: Some validation modules not available due to missing dependencies: {e}"
-    )
-    DataValidator = None
-    DataCleaner = None
+# pandas依存のモジュールは初回アクセス時に遅延インポート
+# （models/rulesのみを使う場合にpandasの読み込みコストを払わないため）
+_LAZY_ATTRIBUTES = {
+    "DataValidator": ".validator",
+    "ValidationReport": ".validator",
+    "ValidationError": ".validator",
+    "ValidationWarning": ".validator",
+    "DataCleaner": ".cleaner",
+    "CleaningResult": ".cleaner",
+    "CorrectionSuggestion": ".cleaner",
+}
+
+__all__.extend(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    """pandas依存クラスの遅延インポート"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except ImportError as e:
+        # pandas等が利用できない場合のフォールバック
+        warnings.warn(
+            "Some validation modules not available due to missing dependencies: "
+            f"{e}",
+            stacklevel=2,
+        )
+        value = None
+
+    globals()[name] = value
+    return value
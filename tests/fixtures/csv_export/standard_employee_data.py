@@ -1,11 +1,16 @@
-"""標準テストデータ - 社員別集計用"""
+"""標準テストデータ - 社員別集計用
+
+データはインポート時に1度だけ生成し、テスト間で共有する。
+タプルで保持するのは要素の差し替えを防ぐためで、要素のAttendanceSummary等は
+可変オブジェクトのままなので、テスト内で属性を変更しないこと
+"""
 
 from datetime import date
 
 from attendance_tool.calculation.department_summary import DepartmentSummary
 from attendance_tool.calculation.summary import AttendanceSummary
 
-STANDARD_EMPLOYEE_DATA = [
+STANDARD_EMPLOYEE_DATA = (
     AttendanceSummary(
         employee_id="EMP001",
         employee_name="田中太郎",
@@ -60,9 +65,9 @@ STANDARD_EMPLOYEE_DATA = [
         warnings=[],
         violations=[],
     ),
-]
+)
 
-STANDARD_DEPARTMENT_DATA = [
+STANDARD_DEPARTMENT_DATA = (
     DepartmentSummary(
         department_code="DEV",
         department_name="開発部",
@@ -89,10 +94,10 @@ STANDARD_DEPARTMENT_DATA = [
         violation_count=2,
         compliance_score=75.0,
     ),
-]
+)
 
 # エッジケース用テストデータ
-EDGE_CASE_DATA = [
+EDGE_CASE_DATA = (
     # 空の名前
     AttendanceSummary(
         employee_id="EDGE001",
@@ -127,4 +132,4 @@ EDGE_CASE_DATA = [
         early_leave_count=0,
         paid_leave_days=0,
     ),
-]
+)
@@ -5,13 +5,8 @@
 """
 
 import os
-import sys
 import tempfile
 import unittest
-from pathlib import Path
-
-# パス設定
-sys.path.append(str(Path(__file__).parent.parent.parent.parent / "src"))
 
 from attendance_tool.cli.main import main
 from attendance_tool.errors.handler import ErrorHandler
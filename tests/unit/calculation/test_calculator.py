@@ -22,6 +22,20 @@ class TestAttendanceCalculatorBasic:
         """各テストメソッド前の準備"""
         self.calculator = AttendanceCalculator()
 
+    def test_summary_has_no_instance_dict(self):
+        """集計結果はslotsでインスタンス辞書を持たない"""
+        summary = AttendanceSummary(
+            employee_id="EMP001",
+            period_start=date(2024, 1, 1),
+            period_end=date(2024, 1, 31),
+            total_days=31,
+            business_days=22,
+        )
+
+        assert not hasattr(summary, "__dict__")
+        assert summary.warnings == []
+        assert summary.violations == []
+
     def test_calculate_attendance_days_normal(self):
         """通常の出勤日数集計テスト"""
         # Given: 20日間の勤怠データ（18日出勤、2日欠勤）
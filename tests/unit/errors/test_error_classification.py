@@ -4,12 +4,7 @@
 このテストはRed Phase用で、すべて失敗することを確認する
 """
 
-import sys
 import unittest
-from pathlib import Path
-
-# パス設定
-sys.path.append(str(Path(__file__).parent.parent.parent.parent / "src"))
 
 from attendance_tool.errors.exceptions import (
     AttendanceToolError,
@@ -24,10 +19,11 @@ from attendance_tool.errors.handler import ErrorHandler
 class TestErrorClassification(unittest.TestCase):
     """エラー分類テストクラス"""
 
-    def setUp(self):
-        """テスト前準備"""
+    @classmethod
+    def setUpClass(cls):
+        """テストクラス共通の準備（状態を持たないため1回だけ生成）"""
         # ErrorHandlerは未実装なので、インスタンス化で失敗するはず
-        self.error_handler = ErrorHandler()
+        cls.error_handler = ErrorHandler()
 
     def test_system_error_classification(self):
         """システムエラーの分類テスト (TC-401-001)"""
@@ -111,6 +107,21 @@ class TestErrorClassification(unittest.TestCase):
                 self.assertEqual(result.code, case["expected_code"])
                 self.assertEqual(result.severity, case["expected_severity"])
 
+    def test_subclass_inherits_base_classification(self):
+        """登録済み例外のサブクラスは基底クラスの分類を継承する"""
+
+        class CustomFileNotFoundError(FileNotFoundError):
+            pass
+
+        result = self.error_handler.classify_error(CustomFileNotFoundError("x.csv"))
+        self.assertEqual(result.category, "SYSTEM")
+        self.assertEqual(result.code, "SYS-001")
+
+        # 2回目以降は型ごとのキャッシュから同じ分類を返す
+        again = self.error_handler.classify_error(CustomFileNotFoundError("y.csv"))
+        self.assertEqual(again.code, "SYS-001")
+        self.assertIn(CustomFileNotFoundError, self.error_handler._classification_map)
+
 
 if __name__ == "__main__":
     unittest.main()
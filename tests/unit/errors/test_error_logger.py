@@ -4,25 +4,26 @@
 このテストはRed Phase用で、すべて失敗することを確認する
 """
 
+import gc
 import json
-import sys
+import logging.handlers
+import os
+import tempfile
 import unittest
-from pathlib import Path
+from datetime import datetime
 from unittest.mock import Mock, patch
 
-# パス設定
-sys.path.append(str(Path(__file__).parent.parent.parent.parent / "src"))
-
 from attendance_tool.errors.logger import ErrorLogger
 
 
 class TestErrorLogger(unittest.TestCase):
     """エラーログテストクラス"""
 
-    def setUp(self):
-        """テスト前準備"""
+    @classmethod
+    def setUpClass(cls):
+        """テストクラス共通の準備（状態を持たないため1回だけ生成）"""
         # ErrorLoggerは未実装なので、インスタンス化で失敗するはず
-        self.logger = ErrorLogger()
+        cls.logger = ErrorLogger()
 
     def test_structured_log_output(self):
         """構造化ログの出力テスト (TC-401-030)"""
@@ -59,6 +60,82 @@ class TestErrorLogger(unittest.TestCase):
         json_log = json.dumps(log_entry, ensure_ascii=False)
         self.assertIsInstance(json_log, str)
 
+    def test_serialize_log_entry(self):
+        """構造化ログのJSONシリアライズテスト"""
+        log_entry = self.logger.log_structured_error(
+            {"exception": FileNotFoundError("/データ/入力.csv"), "code": "SYS-001"}
+        )
+
+        serialized = self.logger.serialize_log_entry(log_entry)
+
+        # 日本語がエスケープされずにそのまま出力される
+        self.assertIn("/データ/入力.csv", serialized)
+        self.assertEqual(json.loads(serialized), log_entry)
+
+    def test_serialize_log_entry_without_orjson(self):
+        """orjson未導入時の標準jsonフォールバックテスト"""
+        log_entry = self.logger.log_structured_error(
+            {"exception": ValueError('値 "A\\B"\n'), "code": "DATA-001"}
+        )
+
+        with patch("attendance_tool.errors.logger.orjson", None):
+            serialized = self.logger.serialize_log_entry(log_entry)
+
+        self.assertEqual(json.loads(serialized), log_entry)
+        self.assertEqual(
+            serialized,
+            json.dumps(log_entry, ensure_ascii=False, separators=(",", ":")),
+        )
+
+    def test_serialize_datetime_matches_orjson(self):
+        """日時の値がorjsonの有無に関わらず同じISO 8601形式になること"""
+        log_entry = {
+            "code": "SYS-001",
+            "details": {"occurred_at": datetime(2024, 1, 1, 9, 30)},
+        }
+
+        with patch("attendance_tool.errors.logger.orjson", None):
+            serialized = self.logger.serialize_log_entry(log_entry)
+
+        self.assertEqual(
+            json.loads(serialized)["details"]["occurred_at"], "2024-01-01T09:30:00"
+        )
+        self.assertEqual(serialized, self.logger.serialize_log_entry(log_entry))
+
+    def test_structured_log_file_buffering(self):
+        """構造化ログファイルのバッファリングテスト"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = os.path.join(temp_dir, "errors.jsonl")
+            logger = ErrorLogger(log_file_path=log_path)
+
+            # WARNINGはバッファに溜まり、ERRORで一括して書き出される
+            logger.log_structured_error({"severity": "WARNING", "code": "DATA-001"})
+            self.assertEqual(os.path.getsize(log_path), 0)
+
+            logger.log_structured_error({"severity": "ERROR", "code": "SYS-001"})
+            logger.close()
+
+            with open(log_path, encoding="utf-8") as f:
+                codes = [json.loads(line)["code"] for line in f]
+            self.assertEqual(codes, ["DATA-001", "SYS-001"])
+
+    def test_structured_log_flushed_without_close(self):
+        """close()を呼ばなくても、withブロック終了時・破棄時にバッファが書き出されること"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = os.path.join(temp_dir, "errors.jsonl")
+
+            with ErrorLogger(log_file_path=log_path) as logger:
+                logger.log_structured_error({"severity": "WARNING", "code": "DATA-001"})
+
+            logger = ErrorLogger(log_file_path=log_path)
+            logger.log_structured_error({"severity": "INFO", "code": "INFO-001"})
+            del logger
+            gc.collect()
+
+            with open(log_path, encoding="utf-8") as f:
+                codes = [json.loads(line)["code"] for line in f]
+            self.assertEqual(codes, ["DATA-001", "INFO-001"])
+
     def test_personal_info_masking(self):
         """個人情報マスキングテスト (TC-401-031)"""
         test_cases = [
@@ -82,6 +159,16 @@ class TestErrorLogger(unittest.TestCase):
                 masked_message = self.logger.mask_personal_info(case["input"])
                 self.assertEqual(masked_message, case["expected"])
 
+    def test_known_employee_name_masking(self):
+        """既知の社員名マスキングテスト"""
+        logger = ErrorLogger(employee_names=["Tanaka Taro", "タナカ タロウ"])
+
+        masked = logger.mask_personal_info(
+            "Tanaka Taro (タナカ タロウ) tanaka@example.com"
+        )
+
+        self.assertEqual(masked, "****** (******) ******@example.com")
+
     def test_log_level_output_routing(self):
         """ログレベル別出力テスト (TC-401-032)"""
         test_cases = [
@@ -103,6 +190,42 @@ class TestErrorLogger(unittest.TestCase):
 
                 self.assertEqual(set(outputs), set(case["expected_outputs"]))
 
+    def test_queued_sink_routing(self):
+        """キュー経由でレベル別の出力先ハンドラーに届くことのテスト"""
+        console = logging.handlers.BufferingHandler(capacity=100)
+        file = logging.handlers.BufferingHandler(capacity=100)
+        logger = ErrorLogger(sinks={"console": console, "file": file})
+
+        logger.log_with_level("critical message", "CRITICAL")
+        logger.log_with_level("warning message", "WARNING")
+        logger.close()
+
+        self.assertEqual(
+            [record.getMessage() for record in console.buffer], ["critical message"]
+        )
+        self.assertEqual(
+            [record.getMessage() for record in file.buffer],
+            ["critical message", "warning message"],
+        )
+        # 利用者から渡されたハンドラーにフィルターを追加しない
+        self.assertEqual(console.filters, [])
+        self.assertEqual(file.filters, [])
+
+    def test_queue_listener_stopped_without_close(self):
+        """close()を呼ばなくても、破棄時に滞留中のレコードが書き出されること"""
+        file = logging.handlers.BufferingHandler(capacity=100)
+        logger = ErrorLogger(sinks={"file": file})
+
+        logger.log_with_level("warning message", "WARNING")
+        listener = logger._listener
+        del logger
+        gc.collect()
+
+        self.assertIsNone(listener._thread)
+        self.assertEqual(
+            [record.getMessage() for record in file.buffer], ["warning message"]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
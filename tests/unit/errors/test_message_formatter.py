@@ -4,12 +4,7 @@
 このテストはRed Phase用で、すべて失敗することを確認する
 """
 
-import sys
 import unittest
-from pathlib import Path
-
-# パス設定
-sys.path.append(str(Path(__file__).parent.parent.parent.parent / "src"))
 
 from attendance_tool.errors.messages import MessageFormatter
 
@@ -17,10 +12,11 @@ from attendance_tool.errors.messages import MessageFormatter
 class TestMessageFormatter(unittest.TestCase):
     """メッセージフォーマッターテストクラス"""
 
-    def setUp(self):
-        """テスト前準備"""
+    @classmethod
+    def setUpClass(cls):
+        """テストクラス共通の準備（状態を持たないため1回だけ生成）"""
         # MessageFormatterは未実装なので、インスタンス化で失敗するはず
-        self.formatter = MessageFormatter(language="ja")
+        cls.formatter = MessageFormatter(language="ja")
 
     def test_japanese_error_messages(self):
         """日本語エラーメッセージテスト (TC-401-020)"""
@@ -0,0 +1,14 @@
+"""
+期間フィルタリングテスト用設定とフィクスチャ
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def date_filter():
+    """テスト全体で共有する期間フィルタ（状態を持たないため1回だけ生成）"""
+    # テストモジュールと同じモジュールパスから読み込み、_todayの差し替えを共有する
+    from src.attendance_tool.filtering.date_filter import DateFilter
+
+    return DateFilter()
@@ -6,18 +6,17 @@ TASK-103: 期間フィルタリング機能テスト - Red Phase実装
     pytest tests/unit/filtering/test_date_filter.py -v
 """
 
-import os
-import time
-from datetime import date, datetime, timedelta
+import functools
+from datetime import date, timedelta
 from typing import Any, Dict, List
 
+import numpy as np
 import pandas as pd
-import psutil
 import pytest
-from freezegun import freeze_time
 
 # テスト対象のインポート（Red Phase実装時点では失敗する）
 try:
+    from src.attendance_tool.filtering import date_filter as date_filter_module
     from src.attendance_tool.filtering.date_filter import DateFilter
     from src.attendance_tool.filtering.integrated_filter import IntegratedDateFilter
     from src.attendance_tool.filtering.models import (
@@ -33,144 +32,221 @@ except ImportError as e:
     pytest.skip(f"期間フィルタリングモジュール未実装: {e}", allow_module_level=True)
 
 
+@functools.cache
+def _work_date(value: str) -> pd.Timestamp:
+    """勤務日文字列をTimestampに変換（同じ文字列はテスト間で変換結果を再利用）"""
+    return pd.Timestamp(value)
+
+
+def create_test_dataframe(data: List[Dict[str, Any]]) -> pd.DataFrame:
+    """テスト用DataFrame作成ヘルパー
+
+    行の辞書リストを列ごとのリストに転置してから構築し、行ごとの辞書を
+    pandasに渡さない。勤務日は_work_dateで変換する。
+    """
+    # Noneエントリをフィルタアウト
+    rows = [item for item in data if item is not None]
+    columns = {key: [row[key] for row in rows] for key in (rows[0] if rows else ())}
+    if "work_date" in columns:
+        columns["work_date"] = pd.DatetimeIndex(
+            [_work_date(work_date) for work_date in columns["work_date"]]
+        )
+    return pd.DataFrame(columns)
+
+
+def is_in_month(dates: pd.Series, year: int, month: int) -> bool:
+    """全日付が指定年月に含まれるか（文字列化せず年・月フィールドで比較）"""
+    return bool((dates.dt.year.eq(year) & dates.dt.month.eq(month)).all())
+
+
+# 月単位フィルタリングの共通データ（標準月・平年2月・うるう年2月の前後日を含む）
+MONTH_FILTER_DATES = [
+    "2023-01-31",
+    "2023-02-01",
+    "2023-02-28",
+    "2023-03-01",
+    "2023-12-31",
+    "2024-01-01",
+    "2024-01-15",
+    "2024-01-31",
+    "2024-02-01",
+    "2024-02-28",
+    "2024-02-29",  # うるう年特有
+    "2024-03-01",
+]
+
+
 class TestFilterByMonth:
     """月単位フィルタリング単体テスト"""
 
-    def setup_method(self):
-        """各テストメソッド実行前のセットアップ"""
-        self.filter = DateFilter()
-
-    def create_test_dataframe(self, data: List[Dict[str, Any]]) -> pd.DataFrame:
-        """テスト用DataFrame作成ヘルパー"""
-        df = pd.DataFrame(data)
-        if "work_date" in df.columns:
-            df["work_date"] = pd.to_datetime(df["work_date"])
-        return df
-
-    def test_filter_standard_month(self):
-        """標準月フィルタリング - 2024年1月"""
-        # テストデータ準備
-        df = self.create_test_dataframe(
-            [
-                {"work_date": "2023-12-31", "employee_id": "EMP001"},
-                {"work_date": "2024-01-01", "employee_id": "EMP001"},
-                {"work_date": "2024-01-15", "employee_id": "EMP001"},
-                {"work_date": "2024-01-31", "employee_id": "EMP001"},
-                {"work_date": "2024-02-01", "employee_id": "EMP001"},
-            ]
+    @pytest.fixture(scope="class")
+    @classmethod
+    def month_df(cls):
+        """全パラメータで共有する月フィルタリング用データ"""
+        return create_test_dataframe(
+            [{"work_date": d, "employee_id": "EMP001"} for d in MONTH_FILTER_DATES]
         )
 
-        # テスト実行（Red Phase: 失敗が期待される）
-        result = self.filter.filter_by_month(df, "2024-01")
+    @pytest.mark.parametrize(
+        "month,expected_count,expected_range",
+        [
+            # 標準月 - 2024年1月
+            ("2024-01", 3, (date(2024, 1, 1), date(2024, 1, 31))),
+            # 2月 - 平年(2023年)
+            ("2023-02", 2, (date(2023, 2, 1), date(2023, 2, 28))),
+            # 🎯 2月 - うるう年(2024年) - 重要境界値テスト
+            ("2024-02", 3, (date(2024, 2, 1), date(2024, 2, 29))),
+        ],
+    )
+    def test_filter_month(
+        self, date_filter, month_df, month, expected_count, expected_range
+    ):
+        """月フィルタリング - 標準月・平年2月・うるう年2月"""
+        result = date_filter.filter_by_month(month_df, month)
 
         # 検証（期待値）
-        assert result.filtered_count == 3, "1月のデータ数が正しくない"
-        assert result.original_count == 5, "元データ数が正しくない"
-        assert result.date_range == (
-            date(2024, 1, 1),
-            date(2024, 1, 31),
-        ), "期間範囲が正しくない"
-        assert len(result.filtered_data) == 3, "フィルタ結果のデータ数が正しくない"
-
-        # 1月のデータのみ含まれることを確認
-        filtered_dates = result.filtered_data["work_date"].dt.strftime("%Y-%m")
-        assert all(
-            d == "2024-01" for d in filtered_dates
-        ), "1月以外のデータが含まれている"
-
-    def test_filter_february_normal_year(self):
-        """2月フィルタリング - 平年(2023年)"""
-        df = self.create_test_dataframe(
+        assert result.filtered_count == expected_count, f"{month}のデータ数が正しくない"
+        assert result.original_count == len(month_df), "元データ数が正しくない"
+        assert result.date_range == expected_range, f"{month}の期間範囲が正しくない"
+        assert (
+            len(result.filtered_data) == expected_count
+        ), "フィルタ結果のデータ数が正しくない"
+
+        # 対象月のデータのみ含まれることを確認
+        first_day, last_day = expected_range
+        assert is_in_month(
+            result.filtered_data["work_date"], first_day.year, first_day.month
+        ), f"{month}以外のデータが含まれている"
+
+        # 月末日（うるう年は2月29日）のデータが確実に含まれていることを確認
+        assert result.latest_date == last_day, f"{month}の最終日が正しくない"
+        last_day_count = np.count_nonzero(
+            result.filtered_data["work_date"].to_numpy() == np.datetime64(last_day)
+        )
+        assert last_day_count == 1, f"{month}の月末日のデータが含まれていない"
+
+    def test_filter_month_end_with_time(self, date_filter):
+        """月末日の時刻付きデータも当月に含まれる"""
+        df = create_test_dataframe(
             [
-                {"work_date": "2023-01-31", "employee_id": "EMP001"},
-                {"work_date": "2023-02-01", "employee_id": "EMP001"},
-                {"work_date": "2023-02-28", "employee_id": "EMP001"},
-                {"work_date": "2023-03-01", "employee_id": "EMP001"},
+                {"work_date": "2024-01-31 18:30", "employee_id": "EMP001"},
+                {"work_date": "2024-02-01 00:00", "employee_id": "EMP001"},
             ]
         )
 
-        result = self.filter.filter_by_month(df, "2023-02")
+        result = date_filter.filter_by_month(df, "2024-1")
 
-        assert result.filtered_count == 2, "2月のデータ数が正しくない"
-        assert result.date_range == (
-            date(2023, 2, 1),
-            date(2023, 2, 28),
-        ), "平年2月の期間が正しくない"
-        assert result.latest_date == date(2023, 2, 28), "平年2月の最終日が正しくない"
-
-    def test_filter_february_leap_year(self):
-        """🎯 2月フィルタリング - うるう年(2024年) - 重要境界値テスト"""
-        df = self.create_test_dataframe(
-            [
-                {"work_date": "2024-01-31", "employee_id": "EMP001"},
-                {"work_date": "2024-02-01", "employee_id": "EMP001"},
-                {"work_date": "2024-02-28", "employee_id": "EMP001"},
-                {"work_date": "2024-02-29", "employee_id": "EMP001"},  # うるう年特有
-                {"work_date": "2024-03-01", "employee_id": "EMP001"},
-            ]
+        assert result.filtered_count == 1, "月末日の時刻付きデータが除外されている"
+        assert result.latest_date == date(2024, 1, 31)
+
+    def test_filter_empty_dataframe(self, date_filter):
+        """0件データの月フィルタリング"""
+        df = pd.DataFrame(
+            {"work_date": pd.DatetimeIndex([]), "employee_id": pd.Series([], dtype=str)}
         )
 
-        result = self.filter.filter_by_month(df, "2024-02")
+        result = date_filter.filter_by_month(df, "2024-02")
 
-        # うるう年の2月29日が正しく含まれることを検証
-        assert result.filtered_count == 3, "うるう年2月のデータ数が正しくない"
-        assert result.date_range == (
-            date(2024, 2, 1),
-            date(2024, 2, 29),
-        ), "うるう年2月の期間が正しくない"
-        assert result.latest_date == date(
-            2024, 2, 29
-        ), "うるう年2月の最終日が正しくない"
+        assert result.filtered_count == 0
+        assert result.original_count == 0
+        assert result.date_range == (date(2024, 2, 1), date(2024, 2, 29))
+        assert result.earliest_date is None
+        assert list(result.filtered_data.columns) == ["work_date", "employee_id"]
 
-        # 2024年2月29日のデータが確実に含まれていることを確認
-        feb29_data = result.filtered_data[
-            result.filtered_data["work_date"].dt.strftime("%Y-%m-%d") == "2024-02-29"
+    def test_filter_invalid_month(self, date_filter):
+        """無効な月指定のエラーテスト"""
+        df = create_test_dataframe(
+            [{"work_date": "2024-01-15", "employee_id": "EMP001"}]
+        )
+
+        with pytest.raises(InvalidPeriodError, match="無効な月指定フォーマット"):
+            date_filter.filter_by_month(df, "2024-13")
+
+
+# 2月末日検出テストの年と期待末日
+FEBRUARY_LAST_DAYS = [
+    (2020, 29),  # うるう年
+    (2021, 28),  # 平年
+    (2022, 28),  # 平年
+    (2023, 28),  # 平年
+    (2024, 29),  # うるう年
+    (2025, 28),  # 平年
+    (2100, 28),  # 100年ルール（うるう年でない）
+    (2000, 29),  # 400年ルール（うるう年）
+]
+
+# 月末日数テストの月と日数（平年の2023年を使用、2月はうるう年テストで網羅）
+MONTH_END_YEAR = 2023
+MONTH_END_DAYS = [
+    (1, 31),  # 1月 - 31日
+    (3, 31),  # 3月 - 31日
+    (4, 30),  # 4月 - 30日
+    (5, 31),  # 5月 - 31日
+    (6, 30),  # 6月 - 30日
+    (7, 31),  # 7月 - 31日
+    (8, 31),  # 8月 - 31日
+    (9, 30),  # 9月 - 30日
+    (10, 31),  # 10月 - 31日
+    (11, 30),  # 11月 - 30日
+    (12, 31),  # 12月 - 31日
+]
+
+
+def build_boundary_dataframes() -> Dict[Any, pd.DataFrame]:
+    """境界値テスト用DataFrameを一括生成する
+
+    2月末・月末日の全グループの日付を1回のto_datetimeで変換し、
+    (種別, 年または月)のキーごとに切り出す。
+    """
+    date_groups = {}
+    for year, last_day in FEBRUARY_LAST_DAYS:
+        dates = [f"{year}-02-28", f"{year}-03-01"]
+        if last_day == 29:
+            dates.insert(1, f"{year}-02-29")
+        date_groups[("february", year)] = dates
+    for month, days in MONTH_END_DAYS:
+        next_month_start = date(MONTH_END_YEAR, month, days) + timedelta(days=1)
+        date_groups[("month_end", month)] = [
+            f"{MONTH_END_YEAR}-{month:02d}-{days:02d}",
+            next_month_start.isoformat(),
         ]
-        assert len(feb29_data) == 1, "うるう年2月29日のデータが含まれていない"
 
+    # 日付のみのISO形式に固定し、書式推定を省く
+    all_dates = pd.to_datetime(
+        [work_date for dates in date_groups.values() for work_date in dates],
+        format="%Y-%m-%d",
+    )
 
-class TestMonthFilterBoundaries:
-    """月フィルタリング境界値テスト - うるう年・月末日重点"""
+    frames = {}
+    offset = 0
+    for key, dates in date_groups.items():
+        frames[key] = pd.DataFrame(
+            {
+                "work_date": all_dates[offset : offset + len(dates)],
+                "employee_id": ["EMP001"] * len(dates),
+            }
+        )
+        offset += len(dates)
+    return frames
 
-    def setup_method(self):
-        """各テストメソッド実行前のセットアップ"""
-        self.filter = DateFilter()
 
-    def create_test_dataframe(self, data: List[Dict[str, Any]]) -> pd.DataFrame:
-        """テスト用DataFrame作成ヘルパー"""
-        # Noneエントリをフィルタアウト
-        filtered_data = [item for item in data if item is not None]
-        df = pd.DataFrame(filtered_data)
-        if "work_date" in df.columns:
-            df["work_date"] = pd.to_datetime(df["work_date"])
-        return df
+# モジュール読み込み時に1回だけ生成（DateFilterは入力をコピーするため共有可能）
+_BOUNDARY_DFS = build_boundary_dataframes()
+FEBRUARY_DFS = {
+    year: _BOUNDARY_DFS[("february", year)] for year, _ in FEBRUARY_LAST_DAYS
+}
+MONTH_END_DFS = {
+    month: _BOUNDARY_DFS[("month_end", month)] for month, _ in MONTH_END_DAYS
+}
 
-    @pytest.mark.parametrize(
-        "year,expected_last_day",
-        [
-            (2020, 29),  # うるう年
-            (2021, 28),  # 平年
-            (2022, 28),  # 平年
-            (2023, 28),  # 平年
-            (2024, 29),  # うるう年
-            (2025, 28),  # 平年
-            (2100, 28),  # 100年ルール（うるう年でない）
-            (2000, 29),  # 400年ルール（うるう年）
-        ],
-    )
-    def test_february_last_day_detection(self, year, expected_last_day):
-        """🎯 2月末日検出テスト - うるう年判定完全網羅"""
-        test_data = [
-            {"work_date": f"{year}-02-28", "employee_id": "EMP001"},
-            {"work_date": f"{year}-03-01", "employee_id": "EMP001"},
-        ]
 
-        # うるう年の場合のみ2/29データを追加
-        if expected_last_day == 29:
-            test_data.insert(1, {"work_date": f"{year}-02-29", "employee_id": "EMP001"})
+class TestMonthFilterBoundaries:
+    """月フィルタリング境界値テスト - うるう年・月末日重点"""
 
-        df = self.create_test_dataframe(test_data)
-        result = self.filter.filter_by_month(df, f"{year}-02")
+    @pytest.mark.parametrize("year,expected_last_day", FEBRUARY_LAST_DAYS)
+    def test_february_last_day_detection(self, date_filter, year, expected_last_day):
+        """🎯 2月末日検出テスト - うるう年判定完全網羅"""
+        result = date_filter.filter_by_month(FEBRUARY_DFS[year], f"{year}-02")
 
         # 2月末日が正しく検出されることを検証
         assert result.date_range[1] == date(
@@ -183,40 +259,15 @@ class TestMonthFilterBoundaries:
         else:
             assert result.filtered_count >= 1, f"{year}年平年で2月データ数が不正"
 
-    @pytest.mark.parametrize(
-        "month,expected_days",
-        [
-            (1, 31),  # 1月 - 31日
-            (3, 31),  # 3月 - 31日
-            (4, 30),  # 4月 - 30日
-            (5, 31),  # 5月 - 31日
-            (6, 30),  # 6月 - 30日
-            (7, 31),  # 7月 - 31日
-            (8, 31),  # 8月 - 31日
-            (9, 30),  # 9月 - 30日
-            (10, 31),  # 10月 - 31日
-            (11, 30),  # 11月 - 30日
-            (12, 31),  # 12月 - 31日
-        ],
-    )
-    def test_month_end_days_all_months(self, month, expected_days):
+    @pytest.mark.parametrize("month,expected_days", MONTH_END_DAYS)
+    def test_month_end_days_all_months(self, date_filter, month, expected_days):
         """🎯 全月の月末日数テスト - 30/31日月の正確な処理"""
-        year = 2023  # 平年を使用
-
-        # 各月の最後の日のデータを作成
-        last_day_str = f"{year}-{month:02d}-{expected_days:02d}"
-        next_month_start = date(year, month, expected_days) + timedelta(days=1)
-        next_month_str = next_month_start.strftime("%Y-%m-%d")
+        year = MONTH_END_YEAR
 
-        df = self.create_test_dataframe(
-            [
-                {"work_date": last_day_str, "employee_id": "EMP001"},
-                {"work_date": next_month_str, "employee_id": "EMP001"},
-            ]
+        result = date_filter.filter_by_month(
+            MONTH_END_DFS[month], f"{year}-{month:02d}"
         )
 
-        result = self.filter.filter_by_month(df, f"{year}-{month:02d}")
-
         # 月末日の正確な検出を検証
         assert result.date_range == (
             date(year, month, 1),
@@ -227,9 +278,9 @@ class TestMonthFilterBoundaries:
             year, month, expected_days
         ), f"{month}月の最終日が正しくない"
 
-    def test_year_boundary_crossing(self):
+    def test_year_boundary_crossing(self, date_filter):
         """🎯 年跨ぎ境界テスト - 12月→1月の正確な処理"""
-        df = self.create_test_dataframe(
+        df = create_test_dataframe(
             [
                 {"work_date": "2023-12-29", "employee_id": "EMP001"},
                 {"work_date": "2023-12-30", "employee_id": "EMP001"},
@@ -240,42 +291,118 @@ class TestMonthFilterBoundaries:
         )
 
         # 2023年12月のフィルタリング
-        result_dec = self.filter.filter_by_month(df, "2023-12")
+        result_dec = date_filter.filter_by_month(df, "2023-12")
         assert result_dec.filtered_count == 3, "2023年12月のデータ数が正しくない"
         assert result_dec.latest_date == date(
             2023, 12, 31
         ), "2023年12月の最終日が正しくない"
 
         # 2024年1月のフィルタリング
-        result_jan = self.filter.filter_by_month(df, "2024-01")
+        result_jan = date_filter.filter_by_month(df, "2024-01")
         assert result_jan.filtered_count == 2, "2024年1月のデータ数が正しくない"
         assert result_jan.earliest_date == date(
             2024, 1, 1
         ), "2024年1月の開始日が正しくない"
 
         # 重複データがないことを確認
-        dec_dates = set(result_dec.filtered_data["work_date"].dt.strftime("%Y-%m-%d"))
-        jan_dates = set(result_jan.filtered_data["work_date"].dt.strftime("%Y-%m-%d"))
-        assert dec_dates.isdisjoint(jan_dates), "年跨ぎで重複データが存在する"
+        common_dates = np.intersect1d(
+            result_dec.filtered_data["work_date"].to_numpy(),
+            result_jan.filtered_data["work_date"].to_numpy(),
+        )
+        assert common_dates.size == 0, "年跨ぎで重複データが存在する"
 
 
-class TestFilterByRange:
-    """日付範囲フィルタリング単体テスト"""
+class TestDateIndexFiltering:
+    """日付インデックス（DatetimeIndex）を持つDataFrameのフィルタリングテスト"""
+
+    def create_indexed_dataframe(self, work_dates: List[str]) -> pd.DataFrame:
+        """work_dateをインデックスにしたテスト用DataFrame"""
+        df = create_test_dataframe(
+            [
+                {"work_date": d, "employee_id": f"EMP{i:03d}"}
+                for i, d in enumerate(work_dates, start=1)
+            ]
+        )
+        return df.set_index("work_date")
+
+    def test_filter_month_by_sorted_index(self, date_filter):
+        """ソート済み日付インデックスの月フィルタリング"""
+        df = self.create_indexed_dataframe(
+            ["2024-01-31", "2024-02-01", "2024-02-29", "2024-03-01"]
+        )
+
+        result = date_filter.filter_by_month(df, "2024-02")
 
-    def setup_method(self):
-        """各テストメソッド実行前のセットアップ"""
-        self.filter = DateFilter()
+        assert result.filtered_data["employee_id"].tolist() == ["EMP002", "EMP003"]
+        assert result.latest_date == date(2024, 2, 29)
+        assert isinstance(result.filtered_data.index, pd.DatetimeIndex)
 
-    def create_test_dataframe(self, data: List[Dict[str, Any]]) -> pd.DataFrame:
-        """テスト用DataFrame作成ヘルパー"""
-        df = pd.DataFrame(data)
-        if "work_date" in df.columns:
-            df["work_date"] = pd.to_datetime(df["work_date"])
-        return df
+    def test_filter_range_by_unsorted_index(self, date_filter):
+        """未ソートの日付インデックスの範囲フィルタリング"""
+        df = self.create_indexed_dataframe(
+            ["2024-01-20", "2024-01-10", "2024-01-30", "2024-01-15"]
+        )
+
+        result = date_filter.filter_by_range(df, "2024-01-15", "2024-01-25")
+
+        assert result.filtered_data["employee_id"].tolist() == ["EMP001", "EMP004"]
+        assert result.earliest_date == date(2024, 1, 15)
+
+
+class TestEndDateBoundary:
+    """終了日の時刻付きデータ・タイムゾーン付き日付の境界テスト"""
+
+    @pytest.mark.parametrize(
+        "apply_filter",
+        [
+            lambda f, df: f.filter_by_month(df, "2024-01"),
+            lambda f, df: f.filter_by_range(df, date(2024, 1, 1), date(2024, 1, 31)),
+            lambda f, df: f.filter_by_specification(
+                df,
+                PeriodSpecification(
+                    period_type=PeriodType.MONTH, month_string="2024-01"
+                ),
+            ),
+        ],
+        ids=["month", "range", "specification"],
+    )
+    def test_last_day_with_time_included(self, date_filter, apply_filter):
+        """終了日の時刻付きデータはどのフィルタでも期間に含まれる"""
+        df = create_test_dataframe(
+            [
+                {"work_date": "2024-01-15", "employee_id": "EMP001"},
+                {"work_date": "2024-01-31 18:30", "employee_id": "EMP002"},
+                {"work_date": "2024-02-01 00:00", "employee_id": "EMP003"},
+            ]
+        )
+
+        result = apply_filter(date_filter, df)
+
+        assert result.filtered_data["employee_id"].tolist() == ["EMP001", "EMP002"]
+        assert result.latest_date == date(2024, 1, 31)
+
+    def test_timezone_aware_dates(self, date_filter):
+        """タイムゾーン付きの日付は、そのタイムゾーンの日付で期間を判定する"""
+        df = pd.DataFrame(
+            {
+                "work_date": pd.DatetimeIndex(
+                    ["2024-01-01 00:30", "2024-01-31 23:00", "2024-02-01 05:00"]
+                ).tz_localize("Asia/Tokyo"),
+                "employee_id": ["EMP001", "EMP002", "EMP003"],
+            }
+        )
+
+        result = date_filter.filter_by_month(df, "2024-01")
+
+        assert result.filtered_data["employee_id"].tolist() == ["EMP001", "EMP002"]
+
+
+class TestFilterByRange:
+    """日付範囲フィルタリング単体テスト"""
 
-    def test_filter_standard_range(self):
+    def test_filter_standard_range(self, date_filter):
         """標準日付範囲フィルタリング"""
-        df = self.create_test_dataframe(
+        df = create_test_dataframe(
             [
                 {"work_date": "2024-01-10", "employee_id": "EMP001"},
                 {"work_date": "2024-01-15", "employee_id": "EMP001"},
@@ -285,7 +412,7 @@ class TestFilterByRange:
             ]
         )
 
-        result = self.filter.filter_by_range(df, "2024-01-15", "2024-01-25")
+        result = date_filter.filter_by_range(df, "2024-01-15", "2024-01-25")
 
         assert (
             result.filtered_count == 3
@@ -301,9 +428,9 @@ class TestFilterByRange:
             2024, 1, 25
         ), "範囲フィルタの終了日が正しくない"
 
-    def test_filter_cross_month_range(self):
+    def test_filter_cross_month_range(self, date_filter):
         """月跨ぎ日付範囲フィルタリング"""
-        df = self.create_test_dataframe(
+        df = create_test_dataframe(
             [
                 {"work_date": "2024-01-25", "employee_id": "EMP001"},
                 {"work_date": "2024-01-31", "employee_id": "EMP001"},
@@ -313,15 +440,15 @@ class TestFilterByRange:
             ]
         )
 
-        result = self.filter.filter_by_range(df, "2024-01-30", "2024-02-10")
+        result = date_filter.filter_by_range(df, "2024-01-30", "2024-02-10")
 
         assert (
             result.filtered_count == 2
         ), "月跨ぎ範囲フィルタのデータ数が正しくない"  # 1/31, 2/1
 
-    def test_filter_cross_year_range(self):
+    def test_filter_cross_year_range(self, date_filter):
         """🎯 年跨ぎ日付範囲フィルタリング - 重要境界値テスト"""
-        df = self.create_test_dataframe(
+        df = create_test_dataframe(
             [
                 {"work_date": "2023-12-25", "employee_id": "EMP001"},
                 {"work_date": "2023-12-31", "employee_id": "EMP001"},
@@ -331,7 +458,7 @@ class TestFilterByRange:
             ]
         )
 
-        result = self.filter.filter_by_range(df, "2023-12-30", "2024-01-10")
+        result = date_filter.filter_by_range(df, "2023-12-30", "2024-01-10")
 
         assert (
             result.filtered_count == 2
@@ -341,24 +468,31 @@ class TestFilterByRange:
             date(2024, 1, 10),
         ), "年跨ぎ範囲の期間が正しくない"
 
+    def test_filter_unsorted_range(self, date_filter):
+        """日付順でないデータの範囲フィルタリング"""
+        df = create_test_dataframe(
+            [
+                {"work_date": "2024-01-20", "employee_id": "EMP001"},
+                {"work_date": "2024-01-10", "employee_id": "EMP002"},
+                {"work_date": "2024-01-30", "employee_id": "EMP003"},
+                {"work_date": "2024-01-15", "employee_id": "EMP004"},
+            ]
+        )
 
-class TestRangeFilterBoundaries:
-    """日付範囲境界値・エラーケーステスト"""
+        result = date_filter.filter_by_range(df, "2024-01-15", "2024-01-25")
 
-    def setup_method(self):
-        """各テストメソッド実行前のセットアップ"""
-        self.filter = DateFilter()
+        # 元の行順のまま範囲内の行だけが残る
+        assert result.filtered_data["employee_id"].tolist() == ["EMP001", "EMP004"]
+        assert result.earliest_date == date(2024, 1, 15)
+        assert result.latest_date == date(2024, 1, 20)
 
-    def create_test_dataframe(self, data: List[Dict[str, Any]]) -> pd.DataFrame:
-        """テスト用DataFrame作成ヘルパー"""
-        df = pd.DataFrame(data)
-        if "work_date" in df.columns:
-            df["work_date"] = pd.to_datetime(df["work_date"])
-        return df
 
-    def test_leap_year_february_range(self):
+class TestRangeFilterBoundaries:
+    """日付範囲境界値・エラーケーステスト"""
+
+    def test_leap_year_february_range(self, date_filter):
         """🎯 うるう年2月を含む範囲テスト"""
-        df = self.create_test_dataframe(
+        df = create_test_dataframe(
             [
                 {"work_date": "2024-02-27", "employee_id": "EMP001"},
                 {"work_date": "2024-02-28", "employee_id": "EMP001"},
@@ -371,7 +505,7 @@ class TestRangeFilterBoundaries:
             ]
         )
 
-        result = self.filter.filter_by_range(df, "2024-02-28", "2024-03-01")
+        result = date_filter.filter_by_range(df, "2024-02-28", "2024-03-01")
 
         # うるう年の2月29日が含まれることを確認
         assert (
@@ -379,38 +513,35 @@ class TestRangeFilterBoundaries:
         ), "うるう年2月29日を含む範囲フィルタのデータ数が正しくない"  # 2/28, 2/29, 3/1
 
         # 2024年2月29日が確実に含まれることを確認
-        filtered_dates = (
-            result.filtered_data["work_date"].dt.strftime("%Y-%m-%d").tolist()
-        )
         assert (
-            "2024-02-29" in filtered_dates
-        ), "うるう年2月29日が範囲フィルタに含まれていない"
+            result.filtered_data["work_date"].to_numpy() == np.datetime64("2024-02-29")
+        ).any(), "うるう年2月29日が範囲フィルタに含まれていない"
 
-    def test_invalid_date_range_start_after_end(self):
+    def test_invalid_date_range_start_after_end(self, date_filter):
         """🎯 無効範囲 - 開始日 > 終了日のエラーテスト"""
-        df = self.create_test_dataframe(
+        df = create_test_dataframe(
             [
                 {"work_date": "2024-01-15", "employee_id": "EMP001"},
             ]
         )
 
         with pytest.raises(DateRangeError, match="開始日が終了日より後です"):
-            self.filter.filter_by_range(df, "2024-01-20", "2024-01-10")
+            date_filter.filter_by_range(df, "2024-01-20", "2024-01-10")
 
-    def test_invalid_date_format(self):
+    def test_invalid_date_format(self, date_filter):
         """🎯 無効日付フォーマットのエラーテスト"""
-        df = self.create_test_dataframe(
+        df = create_test_dataframe(
             [
                 {"work_date": "2024-01-15", "employee_id": "EMP001"},
             ]
         )
 
         with pytest.raises(InvalidPeriodError, match="無効な日付フォーマット"):
-            self.filter.filter_by_range(df, "2024/13/45", "2024-01-31")
+            date_filter.filter_by_range(df, "2024/13/45", "2024-01-31")
 
-    def test_nonexistent_date_handling(self):
+    def test_nonexistent_date_handling(self, date_filter):
         """🎯 存在しない日付の処理テスト"""
-        df = self.create_test_dataframe(
+        df = create_test_dataframe(
             [
                 {"work_date": "2024-02-28", "employee_id": "EMP001"},
                 {"work_date": "2024-02-29", "employee_id": "EMP001"},
@@ -419,18 +550,18 @@ class TestRangeFilterBoundaries:
 
         # 平年の2月29日を指定した場合の処理
         with pytest.raises(InvalidPeriodError, match="存在しない日付"):
-            self.filter.filter_by_range(df, "2023-02-29", "2023-03-01")  # 2023年は平年
+            date_filter.filter_by_range(df, "2023-02-29", "2023-03-01")  # 2023年は平年
 
-    def test_same_date_range(self):
+    def test_same_date_range(self, date_filter):
         """同一日付範囲テスト"""
-        df = self.create_test_dataframe(
+        df = create_test_dataframe(
             [
                 {"work_date": "2024-01-15", "employee_id": "EMP001"},
                 {"work_date": "2024-01-16", "employee_id": "EMP001"},
             ]
         )
 
-        result = self.filter.filter_by_range(df, "2024-01-15", "2024-01-15")
+        result = date_filter.filter_by_range(df, "2024-01-15", "2024-01-15")
 
         assert result.filtered_count == 1, "同一日付範囲フィルタのデータ数が正しくない"
         assert (
@@ -441,21 +572,20 @@ class TestRangeFilterBoundaries:
 class TestFilterByRelative:
     """相対期間フィルタリング単体テスト"""
 
-    def setup_method(self):
-        """各テストメソッド実行前のセットアップ"""
-        self.filter = DateFilter()
+    @pytest.fixture
+    def freeze_today(self, monkeypatch):
+        """date_filterの現在日付を固定する（freezegunより軽量な差し替え）"""
 
-    def create_test_dataframe(self, data: List[Dict[str, Any]]) -> pd.DataFrame:
-        """テスト用DataFrame作成ヘルパー"""
-        df = pd.DataFrame(data)
-        if "work_date" in df.columns:
-            df["work_date"] = pd.to_datetime(df["work_date"])
-        return df
+        def _freeze(iso_date: str):
+            today = date.fromisoformat(iso_date)
+            monkeypatch.setattr(date_filter_module, "_today", lambda: today)
 
-    @freeze_time("2024-02-15")  # 現在時刻を固定
-    def test_filter_last_month(self):
+        return _freeze
+
+    def test_filter_last_month(self, date_filter, freeze_today):
         """先月フィルタリング"""
-        df = self.create_test_dataframe(
+        freeze_today("2024-02-15")  # 現在日付を固定
+        df = create_test_dataframe(
             [
                 {"work_date": "2023-12-15", "employee_id": "EMP001"},
                 {"work_date": "2024-01-05", "employee_id": "EMP001"},
@@ -465,7 +595,7 @@ class TestFilterByRelative:
             ]
         )
 
-        result = self.filter.filter_by_relative(df, "last_month")
+        result = date_filter.filter_by_relative(df, "last_month")
 
         # 2024-02-15の先月は2024-01
         assert result.filtered_count == 3, "先月フィルタのデータ数が正しくない"
@@ -474,10 +604,10 @@ class TestFilterByRelative:
             date(2024, 1, 31),
         ), "先月の期間範囲が正しくない"
 
-    @freeze_time("2024-03-10")  # うるう年3月での先月テスト
-    def test_filter_last_month_leap_february(self):
+    def test_filter_last_month_leap_february(self, date_filter, freeze_today):
         """🎯 先月フィルタリング - うるう年2月の検証"""
-        df = self.create_test_dataframe(
+        freeze_today("2024-03-10")  # うるう年3月での先月テスト
+        df = create_test_dataframe(
             [
                 {"work_date": "2024-01-31", "employee_id": "EMP001"},
                 {"work_date": "2024-02-01", "employee_id": "EMP001"},
@@ -487,7 +617,7 @@ class TestFilterByRelative:
             ]
         )
 
-        result = self.filter.filter_by_relative(df, "last_month")
+        result = date_filter.filter_by_relative(df, "last_month")
 
         # 2024-03-10の先月は2024-02（うるう年なので29日まで）
         assert (
@@ -501,10 +631,10 @@ class TestFilterByRelative:
             2024, 2, 29
         ), "うるう年2月の最終日が正しくない"
 
-    @freeze_time("2024-01-10")
-    def test_filter_this_month(self):
+    def test_filter_this_month(self, date_filter, freeze_today):
         """今月フィルタリング"""
-        df = self.create_test_dataframe(
+        freeze_today("2024-01-10")
+        df = create_test_dataframe(
             [
                 {"work_date": "2023-12-25", "employee_id": "EMP001"},
                 {"work_date": "2024-01-05", "employee_id": "EMP001"},
@@ -513,18 +643,17 @@ class TestFilterByRelative:
             ]
         )
 
-        result = self.filter.filter_by_relative(df, "this_month")
+        result = date_filter.filter_by_relative(df, "this_month")
 
         assert result.filtered_count == 2, "今月フィルタのデータ数が正しくない"
-        filtered_dates = result.filtered_data["work_date"].dt.strftime("%Y-%m")
-        assert all(
-            d == "2024-01" for d in filtered_dates
+        assert is_in_month(
+            result.filtered_data["work_date"], 2024, 1
         ), "今月以外のデータが含まれている"
 
-    @freeze_time("2024-12-15")
-    def test_filter_next_month_year_crossing(self):
+    def test_filter_next_month_year_crossing(self, date_filter, freeze_today):
         """🎯 来月フィルタリング - 年跨ぎケース"""
-        df = self.create_test_dataframe(
+        freeze_today("2024-12-15")
+        df = create_test_dataframe(
             [
                 {"work_date": "2024-11-25", "employee_id": "EMP001"},
                 {"work_date": "2024-12-15", "employee_id": "EMP001"},
@@ -534,7 +663,7 @@ class TestFilterByRelative:
             ]
         )
 
-        result = self.filter.filter_by_relative(df, "next_month")
+        result = date_filter.filter_by_relative(df, "next_month")
 
         # 2024-12-15の来月は2025-01
         assert result.filtered_count == 2, "年跨ぎ来月フィルタのデータ数が正しくない"
@@ -543,6 +672,51 @@ class TestFilterByRelative:
             date(2025, 1, 31),
         ), "年跨ぎ来月の期間が正しくない"
 
+    def test_filter_with_reference_date(self, date_filter):
+        """基準日指定の相対期間フィルタリング"""
+        df = create_test_dataframe(
+            [
+                {"work_date": "2024-01-31", "employee_id": "EMP001"},
+                {"work_date": "2024-02-29", "employee_id": "EMP001"},
+                {"work_date": "2024-03-01", "employee_id": "EMP001"},
+            ]
+        )
+
+        result = date_filter.filter_by_relative(
+            df, "last_month", reference_date=date(2024, 3, 31)
+        )
+
+        assert result.filtered_count == 1
+        assert result.date_range == (date(2024, 2, 1), date(2024, 2, 29))
+
+    def test_relative_specification_uses_same_clock(self, date_filter, freeze_today):
+        """相対期間仕様によるフィルタリングもfilter_by_relativeと同じ現在日付を使う"""
+        freeze_today("2024-03-10")
+        df = create_test_dataframe(
+            [
+                {"work_date": "2024-01-31", "employee_id": "EMP001"},
+                {"work_date": "2024-02-29", "employee_id": "EMP002"},
+                {"work_date": "2024-03-01", "employee_id": "EMP003"},
+            ]
+        )
+        spec = PeriodSpecification(
+            period_type=PeriodType.RELATIVE, relative_string="last_month"
+        )
+
+        result = date_filter.filter_by_specification(df, spec)
+
+        assert result.filtered_data["employee_id"].tolist() == ["EMP002"]
+        assert result.date_range == (date(2024, 2, 1), date(2024, 2, 29))
+
+    def test_unsupported_relative_period(self, date_filter):
+        """未サポートの相対期間指定のエラーテスト"""
+        df = create_test_dataframe(
+            [{"work_date": "2024-01-15", "employee_id": "EMP001"}]
+        )
+
+        with pytest.raises(InvalidPeriodError, match="未サポートの相対期間"):
+            date_filter.filter_by_relative(df, "last_year")
+
 
 # Red Phase実行確認用スクリプト
 if __name__ == "__main__":
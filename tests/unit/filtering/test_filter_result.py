@@ -2,6 +2,7 @@
 フィルタリング結果モデル単体テスト - Red Phase実装
 """
 
+import dataclasses
 from datetime import date
 
 import pandas as pd
@@ -63,3 +64,37 @@ class TestFilterResult:
         assert summary["filtered_ratio"] == 0.1  # 1/10
         assert summary["processing_time"] == 0.05
         assert summary["date_span_days"] == 30  # 1月の日数
+
+    def test_get_summary_is_cached(self):
+        """サマリー情報は初回計算結果のコピーを返す"""
+        result = FilterResult(
+            filtered_data=pd.DataFrame(),
+            original_count=0,
+            filtered_count=0,
+            date_range=(date(2024, 2, 1), date(2024, 2, 29)),
+            processing_time=0.01,
+        )
+
+        summary = result.get_summary()
+
+        assert summary["filtered_ratio"] == 0.0  # 元データ0件
+        assert summary["date_span_days"] == 28
+        assert result.get_summary() == summary
+
+        # 返されたサマリーを変更してもキャッシュには影響しない
+        summary["filtered_count"] = 99
+        assert result.get_summary()["filtered_count"] == 0
+
+    def test_filter_result_is_immutable(self):
+        """フィルタリング結果は生成後に変更できない"""
+        result = FilterResult(
+            filtered_data=pd.DataFrame(),
+            original_count=1,
+            filtered_count=0,
+            date_range=(date(2024, 1, 1), date(2024, 1, 31)),
+            processing_time=0.01,
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.filtered_count = 1
+        assert not hasattr(result, "__dict__")
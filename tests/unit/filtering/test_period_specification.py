@@ -5,6 +5,7 @@
 from datetime import date, datetime
 
 import pytest
+from freezegun import freeze_time
 
 # テスト対象のインポート（Red Phase実装時点では失敗する）
 try:
@@ -32,6 +33,25 @@ class TestPeriodSpecification:
         assert start_date == date(2024, 1, 1)
         assert end_date == date(2024, 1, 31)
 
+    @pytest.mark.parametrize(
+        "month_string,expected_end",
+        [
+            ("2024-02", date(2024, 2, 29)),  # うるう年
+            ("2023-02", date(2023, 2, 28)),  # 平年
+            ("2100-02", date(2100, 2, 28)),  # 100年ルール
+            ("2000-02", date(2000, 2, 29)),  # 400年ルール
+            ("2023-04", date(2023, 4, 30)),
+            ("2023-12", date(2023, 12, 31)),
+        ],
+    )
+    def test_month_end_date(self, month_string, expected_end):
+        """月末日算出テスト（うるう年・30/31日月）"""
+        spec = PeriodSpecification(
+            period_type=PeriodType.MONTH, month_string=month_string
+        )
+
+        assert spec.to_date_range()[1] == expected_end
+
     def test_date_range_period_specification(self):
         """日付範囲期間仕様テスト"""
         spec = PeriodSpecification(
@@ -58,6 +78,17 @@ class TestPeriodSpecification:
         assert spec.period_type == PeriodType.RELATIVE
         assert spec.relative_string == "last_month"
 
+    def test_relative_range_follows_current_date(self):
+        """相対期間のキャッシュは基準日が変わると再計算される"""
+        spec = PeriodSpecification(
+            period_type=PeriodType.RELATIVE, relative_string="this_month"
+        )
+
+        with freeze_time("2024-01-31"):
+            assert spec.to_date_range() == (date(2024, 1, 1), date(2024, 1, 31))
+        with freeze_time("2024-02-01"):
+            assert spec.to_date_range() == (date(2024, 2, 1), date(2024, 2, 29))
+
     def test_validation(self):
         """期間仕様バリデーションテスト"""
         # 有効な仕様
@@ -5,12 +5,9 @@ GUI コンポーネントのテストは特別な考慮が必要です。
 実際の GUI を表示せずにテストできるよう、モック化を活用します。
 """
 
-import os
-import tempfile
-import tkinter as tk
-import unittest
-from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock
+
+import pytest
 
 # テスト用に GUI 関連の import エラーを処理
 try:
@@ -19,116 +16,87 @@ except ImportError:
     MainWindow = None
 
 
-class TestMainWindow(unittest.TestCase):
+@pytest.mark.skipif(MainWindow is None, reason="GUI module not available")
+class TestMainWindow:
     """メインウィンドウのテストクラス"""
 
-    def setUp(self):
-        """テストの前準備"""
-        # 仮想的なディスプレイ環境でのテスト
-        self.temp_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        """テスト後のクリーンアップ"""
-        # 一時ディレクトリの削除
-        if os.path.exists(self.temp_dir):
-            import shutil
+    @pytest.fixture(autouse=True)
+    def mock_root(self, monkeypatch):
+        """全テスト共通のGUIモック
 
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    @unittest.skipIf(MainWindow is None, "GUI module not available")
-    @patch("attendance_tool.gui.main_window.MainWindow._create_widgets")
-    @patch("tkinter.Tk")
-    def test_main_window_initialization(self, mock_tk, mock_create_widgets):
-        """メインウィンドウの初期化テスト"""
+        tkinter.Tkとウィジェット生成をmonkeypatchで差し替え、
+        テストごとのpatchデコレータ積み重ねを不要にする。
+        """
         mock_root = Mock()
-        mock_tk.return_value = mock_root
+        monkeypatch.setattr("tkinter.Tk", lambda: mock_root)
+        monkeypatch.setattr(MainWindow, "_create_widgets", lambda self: None)
+        return mock_root
 
+    def test_main_window_initialization(self, mock_root):
+        """メインウィンドウの初期化テスト"""
         # メインウィンドウの作成
         try:
             window = MainWindow()
-            self.assertIsNotNone(window)
-            self.assertEqual(window.root, mock_root)
+            assert window is not None
+            assert window.root == mock_root
         except Exception:
-            self.fail("MainWindow が実装されていません")
+            pytest.fail("MainWindow が実装されていません")
 
-    @unittest.skipIf(MainWindow is None, "GUI module not available")
-    @patch("attendance_tool.gui.main_window.MainWindow._create_widgets")
-    @patch("attendance_tool.gui.file_dialogs.FileDialogs.select_csv_file")
-    @patch("tkinter.Tk")
-    def test_file_selection_dialog(self, mock_tk, mock_select, mock_create_widgets):
+    def test_file_selection_dialog(self, monkeypatch):
         """ファイル選択ダイアログのテスト"""
-        mock_root = Mock()
-        mock_tk.return_value = mock_root
-        mock_select.return_value = "test.csv"
+        monkeypatch.setattr(
+            "attendance_tool.gui.file_dialogs.FileDialogs.select_csv_file",
+            lambda self, *args, **kwargs: "test.csv",
+        )
 
         # ファイル選択機能のテスト
         try:
             window = MainWindow()
             result = window.select_input_file()
-            self.assertEqual(result, "test.csv")
+            assert result == "test.csv"
         except AttributeError:
-            self.fail("ファイル選択機能が実装されていません")
+            pytest.fail("ファイル選択機能が実装されていません")
 
-    @unittest.skipIf(MainWindow is None, "GUI module not available")
-    @patch("tkinter.Tk")
-    def test_output_directory_selection(self, mock_tk):
+    def test_output_directory_selection(self):
         """出力ディレクトリ選択テスト"""
-        mock_root = Mock()
-        mock_tk.return_value = mock_root
-
         try:
             window = MainWindow()
             result = window.select_output_directory()
-            self.assertIsInstance(result, (str, type(None)))
+            assert isinstance(result, (str, type(None)))
         except AttributeError:
-            self.fail("出力ディレクトリ選択機能が実装されていません")
+            pytest.fail("出力ディレクトリ選択機能が実装されていません")
 
-    @unittest.skipIf(MainWindow is None, "GUI module not available")
-    @patch("tkinter.Tk")
-    def test_progress_display(self, mock_tk):
+    def test_progress_display(self):
         """プログレス表示テスト"""
-        mock_root = Mock()
-        mock_tk.return_value = mock_root
-
         try:
             window = MainWindow()
             window.show_progress(50, "処理中...")
             # プログレス表示が正常に動作することを確認
-            self.assertTrue(True)  # 実装後に具体的なテストに変更
+            assert True  # 実装後に具体的なテストに変更
         except AttributeError:
-            self.fail("プログレス表示機能が実装されていません")
+            pytest.fail("プログレス表示機能が実装されていません")
 
-    @unittest.skipIf(MainWindow is None, "GUI module not available")
-    @patch("tkinter.Tk")
-    def test_settings_window_open(self, mock_tk):
+    def test_settings_window_open(self):
         """設定画面を開くテスト"""
-        mock_root = Mock()
-        mock_tk.return_value = mock_root
-
         try:
             window = MainWindow()
             window.open_settings()
             # 設定画面が開かれることを確認
-            self.assertTrue(True)  # 実装後に具体的なテストに変更
+            assert True  # 実装後に具体的なテストに変更
         except AttributeError:
-            self.fail("設定画面機能が実装されていません")
+            pytest.fail("設定画面機能が実装されていません")
 
-    @unittest.skipIf(MainWindow is None, "GUI module not available")
-    @patch("tkinter.Tk")
-    def test_log_display(self, mock_tk):
+    def test_log_display(self):
         """ログ表示テスト"""
-        mock_root = Mock()
-        mock_tk.return_value = mock_root
-
         try:
             window = MainWindow()
             window.add_log("テストログメッセージ")
             window.add_log("エラーメッセージ", level="error")
             # ログが正常に表示されることを確認
-            self.assertTrue(True)  # 実装後に具体的なテストに変更
+            assert True  # 実装後に具体的なテストに変更
         except AttributeError:
-            self.fail("ログ表示機能が実装されていません")
+            pytest.fail("ログ表示機能が実装されていません")
 
 
 if __name__ == "__main__":
-    unittest.main()
+    pytest.main([__file__, "-v"])
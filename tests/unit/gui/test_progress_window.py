@@ -2,61 +2,71 @@
 プログレス表示ウィンドウの単体テスト
 """
 
-import time
-import unittest
-from unittest.mock import Mock, patch
+import tkinter
+from unittest.mock import MagicMock, Mock
+
+import pytest
 
 try:
     from attendance_tool.gui.progress_window import ProgressWindow
 except ImportError:
     ProgressWindow = None
 
+pytestmark = pytest.mark.skipif(
+    ProgressWindow is None, reason="ProgressWindow module not available"
+)
+
+
+@pytest.fixture(scope="module")
+def toplevel_mock():
+    """tkinter.Toplevelをモジュール単位で1回だけモックに差し替える"""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        mock = MagicMock(name="Toplevel")
+        monkeypatch.setattr(tkinter, "Toplevel", mock)
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def fresh_toplevel(toplevel_mock):
+    """テストごとに新しいウィンドウモックを返すよう設定（モック自体は再生成しない）"""
+    toplevel_mock.reset_mock()
+    toplevel_mock.return_value = Mock()
+    return toplevel_mock
+
+
+def test_progress_window_initialization():
+    """プログレスウィンドウの初期化テスト"""
+    try:
+        progress = ProgressWindow()
+        assert progress is not None
+    except Exception:
+        pytest.fail("ProgressWindow が実装されていません")
+
+
+def test_update_progress():
+    """プログレス更新テスト"""
+    try:
+        progress = ProgressWindow()
+        progress.update_progress(50, "処理中...")
+        halfway = progress.current_progress
+        progress.update_progress(100, "完了")
+    except Exception:
+        pytest.fail("プログレス更新機能が実装されていません")
+
+    assert halfway == 50
+    assert progress.current_progress == 100
+
+
+def test_close_progress():
+    """プログレスウィンドウ終了テスト"""
+    try:
+        progress = ProgressWindow()
+        progress.close()
+    except Exception:
+        pytest.fail("プログレスウィンドウ終了機能が実装されていません")
 
-class TestProgressWindow(unittest.TestCase):
-    """プログレス表示ウィンドウのテストクラス"""
-
-    @unittest.skipIf(ProgressWindow is None, "ProgressWindow module not available")
-    @patch("tkinter.Toplevel")
-    def test_progress_window_initialization(self, mock_toplevel):
-        """プログレスウィンドウの初期化テスト"""
-        mock_window = Mock()
-        mock_toplevel.return_value = mock_window
-
-        try:
-            progress = ProgressWindow()
-            self.assertIsNotNone(progress)
-        except Exception:
-            self.fail("ProgressWindow が実装されていません")
-
-    @unittest.skipIf(ProgressWindow is None, "ProgressWindow module not available")
-    @patch("tkinter.Toplevel")
-    def test_update_progress(self, mock_toplevel):
-        """プログレス更新テスト"""
-        mock_window = Mock()
-        mock_toplevel.return_value = mock_window
-
-        try:
-            progress = ProgressWindow()
-            progress.update_progress(50, "処理中...")
-            progress.update_progress(100, "完了")
-            self.assertTrue(True)  # 実装後に具体的なアサーションを追加
-        except Exception:
-            self.fail("プログレス更新機能が実装されていません")
-
-    @unittest.skipIf(ProgressWindow is None, "ProgressWindow module not available")
-    @patch("tkinter.Toplevel")
-    def test_close_progress(self, mock_toplevel):
-        """プログレスウィンドウ終了テスト"""
-        mock_window = Mock()
-        mock_toplevel.return_value = mock_window
-
-        try:
-            progress = ProgressWindow()
-            progress.close()
-            self.assertTrue(True)  # 実装後に具体的なアサーションを追加
-        except Exception:
-            self.fail("プログレスウィンドウ終了機能が実装されていません")
+    assert progress.is_closed
 
 
 if __name__ == "__main__":
-    unittest.main()
+    pytest.main([__file__, "-v"])
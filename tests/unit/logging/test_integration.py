@@ -4,6 +4,7 @@ TASK-402: Red Phase - 失敗するテスト実装
 """
 
 import time
+from typing import List
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,6 +14,29 @@ from attendance_tool.logging.audit_logger import AuditLogger
 from attendance_tool.logging.structured_logger import StructuredLogger
 
 
+def _sample_work(n: int = 200_000) -> int:
+    """決定的なCPU処理（sleepと異なり実処理時間に対するログの影響を測れる）"""
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+
+
+def _min_elapsed_ns(*funcs, repeat: int = 7) -> List[int]:
+    """各関数の処理時間の最小値（ナノ秒）
+
+    関数を交互にrepeat回ずつ実行し、CPUクロック等の変動が
+    特定の関数だけに偏らないようにする。
+    """
+    elapsed = [[] for _ in funcs]
+    for _ in range(repeat):
+        for func, samples in zip(funcs, elapsed):
+            start = time.perf_counter_ns()
+            func()
+            samples.append(time.perf_counter_ns() - start)
+    return [min(samples) for samples in elapsed]
+
+
 class TestLoggingIntegration:
     """ログ機能統合テスト"""
 
@@ -54,7 +78,7 @@ class TestLoggingIntegration:
 
         # 監査ログ確認
         audit_logs = audit_logger.get_recent_logs()
-        assert any(log["event_type"] == "ERROR_OCCURRED" for log in audit_logs)
+        assert audit_logger.get_recent_logs("ERROR_OCCURRED")
 
         # 構造化ログ確認 - 最小実装では構造化ログは直接返される
         # より簡単なテストにする
@@ -66,25 +90,21 @@ class TestLoggingIntegration:
 
         def process_sample_data_without_logging():
             # ログ機能を無効にして処理を実行
-            time.sleep(0.1)  # サンプル処理
+            _sample_work()  # サンプル処理
 
-        def process_sample_data_with_logging():
-            # ログ機能を有効にして処理を実行
+        def logging_for_sample_data():
+            # 処理に付随するログ出力のみを実行
             logger = StructuredLogger()
             logger.info("Processing started")
-            time.sleep(0.1)  # サンプル処理
             logger.info("Processing completed")
 
-        # ログ無効時の処理時間測定
-        start_time = time.time()
-        process_sample_data_without_logging()
-        baseline_time = time.time() - start_time
-
-        # ログ有効時の処理時間測定
-        start_time = time.time()
-        process_sample_data_with_logging()
-        with_logging_time = time.time() - start_time
+        # 処理本体とログ出力の処理時間測定
+        # （交互に複数回実行した最小値でGC・スケジューラの揺らぎを除く。
+        #   処理全体同士の差分はCPU処理自体の揺らぎに埋もれるため、ログ分を個別に測る）
+        baseline_time, logging_time = _min_elapsed_ns(
+            process_sample_data_without_logging, logging_for_sample_data
+        )
 
         # オーバーヘッド確認（3%以内）
-        overhead = (with_logging_time - baseline_time) / baseline_time
+        overhead = logging_time / baseline_time
         assert overhead <= 0.03  # 3%以内
@@ -3,36 +3,49 @@
 TASK-402: Red Phase - 失敗するテスト実装
 """
 
-import time
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
+from attendance_tool.logging import performance_tracker
 from attendance_tool.logging.performance_tracker import PerformanceTracker
 
 
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """PerformanceTrackerが参照する時計を指定値を順に返す偽の時計に差し替える"""
+
+    def _install(readings):
+        clock = iter(readings)
+        fake_time = SimpleNamespace(perf_counter=lambda: next(clock))
+        monkeypatch.setattr(performance_tracker, "time", fake_time)
+
+    return _install
+
+
 class TestPerformanceTracker:
     """パフォーマンス計測機能のテスト"""
 
-    def test_processing_time_measurement(self):
+    def test_processing_time_measurement(self, fake_clock):
         """TC-402-020: 処理時間計測"""
-
-        def dummy_process():
-            time.sleep(1.0)  # 1秒間の処理
+        # 時計を1秒進める（実際には待機しない）
+        fake_clock([0.0, 1.0])
 
         # パフォーマンストラッカーで計測
         with PerformanceTracker() as tracker:
-            dummy_process()
+            pass
 
-        # 計測精度確認（±50ms以内）
-        assert 950 <= tracker.duration_ms <= 1050
+        # 計測値の計算確認
+        assert tracker.duration_ms == 1000
 
     def test_memory_usage_measurement(self):
         """TC-402-021: メモリ使用量計測"""
 
         def memory_intensive_process():
-            # 10MB相当のデータを作成
-            large_data = [0] * (10 * 1024 * 1024 // 8)
+            # 10MB相当のデータを作成（単一の連続領域として確保）
+            large_data = bytearray(10 * 1024 * 1024)
             return large_data
 
         with PerformanceTracker() as tracker:
@@ -76,11 +89,9 @@ class TestPerformanceTracker:
         """CPU使用率計測"""
 
         def cpu_intensive_process():
-            # CPU集約的な処理
-            result = 0
-            for i in range(1000000):
-                result += i * i
-            return result
+            # CPU集約的な処理（NumPyのベクトル演算で実行）
+            values = np.arange(1_000_000, dtype=np.int64)
+            return int((values * values).sum())
 
         with PerformanceTracker() as tracker:
             cpu_intensive_process()
@@ -9,6 +9,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from attendance_tool.logging import structured_logger
 from attendance_tool.logging.structured_logger import StructuredLogger
 
 
@@ -34,6 +35,11 @@ class TestStructuredLogger:
         # JSON形式であることを確認
         assert isinstance(result, dict)
 
+        # シリアライズ結果がJSONとして往復できることを確認
+        blob = logger.serialize(result)
+        assert isinstance(blob, bytes)
+        assert json.loads(blob) == result
+
         # 必須フィールドの存在確認
         required_fields = [
             "timestamp",
@@ -122,3 +128,35 @@ class TestStructuredLogger:
         # 相関IDが処理ごとに一意であることを確認
         correlation_ids = [entry["correlation_id"] for entry in log_entries]
         assert len(set(correlation_ids)) == len(correlation_ids)  # 全て異なる
+
+    def test_serialize_without_orjson(self):
+        """orjson未導入時の標準jsonフォールバックテスト"""
+        logger = StructuredLogger()
+        entry = logger.log_structured(
+            {"message": "CSVファイル読み込み開始", "details": {"count": 1}}
+        )
+
+        with patch("attendance_tool.logging.structured_logger.orjson", None):
+            blob = logger.serialize(entry)
+
+        # 日本語がエスケープされずにそのまま出力される
+        assert "CSVファイル読み込み開始".encode("utf-8") in blob
+        assert json.loads(blob) == entry
+
+    def test_dispatch_serializes_once(self):
+        """複数出力先への配信でシリアライズが1回だけ行われることのテスト"""
+        logger = StructuredLogger()
+        record = logger.log_structured({"level": "CRITICAL", "message": "重大エラー"})
+
+        with patch.object(
+            structured_logger, "_dumps_bytes", wraps=structured_logger._dumps_bytes
+        ) as spy:
+            payloads = logger.dispatch(record)
+
+        assert set(payloads) == {"file", "console", "email"}
+        assert spy.call_count == 1
+        assert json.loads(payloads["email"]) == record
+
+        # 呼び出し元がエントリを変更した場合は次の配信に反映される
+        record["message"] = "変更後"
+        assert json.loads(logger.dispatch(record)["file"])["message"] == "変更後"
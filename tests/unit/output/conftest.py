@@ -0,0 +1,112 @@
+"""
+レポート出力テスト用設定とフィクスチャ
+"""
+
+from datetime import date
+
+import pytest
+
+from attendance_tool.calculation.department_summary import DepartmentSummary
+from attendance_tool.calculation.summary import AttendanceSummary
+from attendance_tool.output.csv_exporter import CSVExporter
+from tests.fixtures.csv_export.standard_employee_data import (
+    EDGE_CASE_DATA,
+    STANDARD_DEPARTMENT_DATA,
+    STANDARD_EMPLOYEE_DATA,
+)
+
+
+@pytest.fixture(scope="session")
+def csv_exporter():
+    """テスト全体で共有するCSVExporter（設定ファイルの読み込みを1回だけ行う）"""
+    return CSVExporter()
+
+
+@pytest.fixture(scope="session")
+def std_employee_data():
+    """標準の社員別集計データ（全テストで同一のタプルを共有）"""
+    return STANDARD_EMPLOYEE_DATA
+
+
+@pytest.fixture(scope="session")
+def std_department_data():
+    """標準の部門別集計データ（全テストで同一のタプルを共有）"""
+    return STANDARD_DEPARTMENT_DATA
+
+
+@pytest.fixture(scope="session")
+def edge_case_data():
+    """境界値・特殊文字を含む社員別集計データ"""
+    return EDGE_CASE_DATA
+
+
+@pytest.fixture(scope="session")
+def sample_employee_data():
+    """Excel出力・テンプレート管理テスト用の社員別集計データ（2名分）"""
+    return (
+        AttendanceSummary(
+            employee_id="EMP001",
+            period_start=date(2024, 1, 1),
+            period_end=date(2024, 1, 31),
+            total_days=31,
+            business_days=22,
+            employee_name="田中太郎",
+            department="営業部",
+            attendance_days=22,
+            tardiness_count=1,
+            early_leave_count=0,
+            total_work_minutes=10560,  # 176時間
+            scheduled_overtime_minutes=960,  # 16時間
+            legal_overtime_minutes=0,
+            paid_leave_days=2,
+        ),
+        AttendanceSummary(
+            employee_id="EMP002",
+            period_start=date(2024, 1, 1),
+            period_end=date(2024, 1, 31),
+            total_days=31,
+            business_days=22,
+            employee_name="佐藤花子",
+            department="開発部",
+            attendance_days=20,
+            tardiness_count=0,
+            early_leave_count=1,
+            total_work_minutes=9600,  # 160時間
+            scheduled_overtime_minutes=480,  # 8時間
+            legal_overtime_minutes=0,
+            paid_leave_days=1,
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_department_data():
+    """Excel出力・テンプレート管理テスト用の部門別集計データ（2部門分）"""
+    return (
+        DepartmentSummary(
+            department_code="SALES",
+            department_name="営業部",
+            period_start=date(2024, 1, 1),
+            period_end=date(2024, 1, 31),
+            employee_count=10,
+            total_work_minutes=105600,
+            total_overtime_minutes=9600,
+            attendance_rate=95.5,
+            average_work_minutes=528,
+            violation_count=0,
+            compliance_score=95.0,
+        ),
+        DepartmentSummary(
+            department_code="DEV",
+            department_name="開発部",
+            period_start=date(2024, 1, 1),
+            period_end=date(2024, 1, 31),
+            employee_count=8,
+            total_work_minutes=76800,
+            total_overtime_minutes=3840,
+            attendance_rate=90.9,
+            average_work_minutes=480,
+            violation_count=1,
+            compliance_score=90.0,
+        ),
+    )
@@ -1,15 +1,9 @@
 """Excel出力機能のテスト - Red Phase"""
 
-import shutil
-import tempfile
-from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock, patch
 
-import pandas as pd
 import pytest
 from openpyxl import load_workbook
-from openpyxl.workbook import Workbook
 
 from attendance_tool.calculation.department_summary import DepartmentSummary
 from attendance_tool.calculation.summary import AttendanceSummary
@@ -23,89 +17,31 @@ from attendance_tool.output.excel_exporter import (
 from attendance_tool.output.models import ExportResult
 
 
-class TestExcelExporter:
-    """ExcelExporter単体テスト"""
+@pytest.fixture
+def read_workbook():
+    """値の検証用に読み取り専用モードでワークブックを開くローダー
 
-    @pytest.fixture
-    def temp_output_dir(self):
-        """テスト用一時出力ディレクトリ"""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
+    読み取り専用モードは行を遅延して読み込むため、ヘッダーや先頭行の確認だけで済む。
+    条件付き書式・グラフ・列幅・印刷設定は読み込まれないため、それらを検証する
+    テストでは通常のload_workbookを使う。開いたワークブックはテスト終了時に閉じる。
+    """
+    workbooks = []
 
-    @pytest.fixture
-    def sample_employee_data(self):
-        """サンプル社員データ"""
-        from datetime import date
+    def _load(path):
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        workbooks.append(workbook)
+        # 書き込み専用で出力したシートは寸法情報を持たないため、max_rowを走査で求める
+        for worksheet in workbook.worksheets:
+            worksheet.calculate_dimension(force=True)
+        return workbook
 
-        return [
-            AttendanceSummary(
-                employee_id="EMP001",
-                period_start=date(2024, 1, 1),
-                period_end=date(2024, 1, 31),
-                total_days=31,
-                business_days=22,
-                employee_name="田中太郎",
-                department="営業部",
-                attendance_days=22,
-                tardiness_count=1,
-                early_leave_count=0,
-                total_work_minutes=10560,  # 176時間
-                scheduled_overtime_minutes=960,  # 16時間
-                legal_overtime_minutes=0,
-                paid_leave_days=2,
-            ),
-            AttendanceSummary(
-                employee_id="EMP002",
-                period_start=date(2024, 1, 1),
-                period_end=date(2024, 1, 31),
-                total_days=31,
-                business_days=22,
-                employee_name="佐藤花子",
-                department="開発部",
-                attendance_days=20,
-                tardiness_count=0,
-                early_leave_count=1,
-                total_work_minutes=9600,  # 160時間
-                scheduled_overtime_minutes=480,  # 8時間
-                legal_overtime_minutes=0,
-                paid_leave_days=1,
-            ),
-        ]
+    yield _load
+    for workbook in workbooks:
+        workbook.close()
 
-    @pytest.fixture
-    def sample_department_data(self):
-        """サンプル部門データ"""
-        from datetime import date
 
-        return [
-            DepartmentSummary(
-                department_code="SALES",
-                department_name="営業部",
-                period_start=date(2024, 1, 1),
-                period_end=date(2024, 1, 31),
-                employee_count=10,
-                total_work_minutes=105600,
-                total_overtime_minutes=9600,
-                attendance_rate=95.5,
-                average_work_minutes=528,
-                violation_count=0,
-                compliance_score=95.0,
-            ),
-            DepartmentSummary(
-                department_code="DEV",
-                department_name="開発部",
-                period_start=date(2024, 1, 1),
-                period_end=date(2024, 1, 31),
-                employee_count=8,
-                total_work_minutes=76800,
-                total_overtime_minutes=3840,
-                attendance_rate=90.9,
-                average_work_minutes=480,
-                violation_count=1,
-                compliance_score=90.0,
-            ),
-        ]
+class TestExcelExporter:
+    """ExcelExporter単体テスト"""
 
     def test_excel_exporter_initialization(self):
         """T302-001: ExcelExporter初期化テスト"""
@@ -117,7 +53,7 @@ class TestExcelExporter:
         assert hasattr(exporter, "excel_config")
 
     def test_export_basic_excel_file(
-        self, temp_output_dir, sample_employee_data, sample_department_data
+        self, tmp_path, sample_employee_data, sample_department_data
     ):
         """T302-001: 基本Excel出力機能テスト"""
         exporter = ExcelExporter()
@@ -126,7 +62,7 @@ class TestExcelExporter:
         result = exporter.export_excel_report(
             employee_summaries=sample_employee_data,
             department_summaries=sample_department_data,
-            output_path=temp_output_dir,
+            output_path=tmp_path,
             year=2024,
             month=1,
         )
@@ -141,7 +77,11 @@ class TestExcelExporter:
         assert result.processing_time >= 0
 
     def test_employee_worksheet_structure(
-        self, temp_output_dir, sample_employee_data, sample_department_data
+        self,
+        read_workbook,
+        tmp_path,
+        sample_employee_data,
+        sample_department_data,
     ):
         """T302-002: 社員別ワークシート構造テスト"""
         exporter = ExcelExporter()
@@ -150,13 +90,13 @@ class TestExcelExporter:
         result = exporter.export_excel_report(
             employee_summaries=sample_employee_data,
             department_summaries=sample_department_data,
-            output_path=temp_output_dir,
+            output_path=tmp_path,
             year=2024,
             month=1,
         )
 
         # Excelファイルを開いて検証
-        workbook = load_workbook(result.file_path)
+        workbook = read_workbook(result.file_path)
 
         # 社員別ワークシートの存在確認
         assert "社員別レポート" in workbook.sheetnames
@@ -191,7 +131,7 @@ class TestExcelExporter:
         assert worksheet.cell(row=2, column=3).value == "営業部"
 
     def test_employee_worksheet_formatting(
-        self, temp_output_dir, sample_employee_data, sample_department_data
+        self, tmp_path, sample_employee_data, sample_department_data
     ):
         """T302-002: 社員別ワークシート書式テスト"""
         exporter = ExcelExporter()
@@ -199,7 +139,7 @@ class TestExcelExporter:
         result = exporter.export_excel_report(
             employee_summaries=sample_employee_data,
             department_summaries=sample_department_data,
-            output_path=temp_output_dir,
+            output_path=tmp_path,
             year=2024,
             month=1,
         )
@@ -222,7 +162,11 @@ class TestExcelExporter:
             assert worksheet.column_dimensions[col_letter].width > 0
 
     def test_department_worksheet_structure(
-        self, temp_output_dir, sample_employee_data, sample_department_data
+        self,
+        read_workbook,
+        tmp_path,
+        sample_employee_data,
+        sample_department_data,
     ):
         """T302-003: 部門別ワークシート構造テスト"""
         exporter = ExcelExporter()
@@ -230,12 +174,12 @@ class TestExcelExporter:
         result = exporter.export_excel_report(
             employee_summaries=sample_employee_data,
             department_summaries=sample_department_data,
-            output_path=temp_output_dir,
+            output_path=tmp_path,
             year=2024,
             month=1,
         )
 
-        workbook = load_workbook(result.file_path)
+        workbook = read_workbook(result.file_path)
 
         # 部門別ワークシートの存在確認
         assert "部門別レポート" in workbook.sheetnames
@@ -264,7 +208,7 @@ class TestExcelExporter:
         assert worksheet.cell(row=2, column=3).value == 10  # 所属人数
 
     def test_department_conditional_formatting(
-        self, temp_output_dir, sample_employee_data, sample_department_data
+        self, tmp_path, sample_employee_data, sample_department_data
     ):
         """T302-003: 部門別条件付き書式テスト"""
         # 条件付き書式用のテストデータを作成
@@ -317,7 +261,7 @@ class TestExcelExporter:
         result = exporter.export_excel_report(
             employee_summaries=sample_employee_data,
             department_summaries=department_data_with_various_rates,
-            output_path=temp_output_dir,
+            output_path=tmp_path,
             year=2024,
             month=1,
         )
@@ -333,7 +277,11 @@ class TestExcelExporter:
         assert any(cf for cf in attendance_rate_range if "H" in str(cf.cells))
 
     def test_summary_worksheet_creation(
-        self, temp_output_dir, sample_employee_data, sample_department_data
+        self,
+        read_workbook,
+        tmp_path,
+        sample_employee_data,
+        sample_department_data,
     ):
         """T302-004: サマリーワークシート作成テスト"""
         exporter = ExcelExporter()
@@ -341,12 +289,12 @@ class TestExcelExporter:
         result = exporter.export_excel_report(
             employee_summaries=sample_employee_data,
             department_summaries=sample_department_data,
-            output_path=temp_output_dir,
+            output_path=tmp_path,
             year=2024,
             month=1,
         )
 
-        workbook = load_workbook(result.file_path)
+        workbook = read_workbook(result.file_path)
 
         # サマリーワークシートの存在確認
         assert "サマリー" in workbook.sheetnames
@@ -370,7 +318,7 @@ class TestExcelExporter:
             assert any(metric in str(value) for value in all_values)
 
     def test_summary_worksheet_charts(
-        self, temp_output_dir, sample_employee_data, sample_department_data
+        self, tmp_path, sample_employee_data, sample_department_data
     ):
         """T302-004: サマリーワークシートグラフテスト"""
         exporter = ExcelExporter()
@@ -378,7 +326,7 @@ class TestExcelExporter:
         result = exporter.export_excel_report(
             employee_summaries=sample_employee_data,
             department_summaries=sample_department_data,
-            output_path=temp_output_dir,
+            output_path=tmp_path,
             year=2024,
             month=1,
             include_charts=True,
@@ -395,7 +343,7 @@ class TestExcelExporter:
         assert chart.graphical_properties is not None
 
     def test_excel_specific_features(
-        self, temp_output_dir, sample_employee_data, sample_department_data
+        self, tmp_path, sample_employee_data, sample_department_data
     ):
         """T302-005: Excel固有機能テスト"""
         exporter = ExcelExporter()
@@ -403,7 +351,7 @@ class TestExcelExporter:
         result = exporter.export_excel_report(
             employee_summaries=sample_employee_data,
             department_summaries=sample_department_data,
-            output_path=temp_output_dir,
+            output_path=tmp_path,
             year=2024,
             month=1,
         )
@@ -424,7 +372,7 @@ class TestExcelExporter:
             assert worksheet.page_setup.fitToWidth == 1
             assert worksheet.page_setup.fitToHeight == 0
 
-    def test_export_with_empty_data(self, temp_output_dir):
+    def test_export_with_empty_data(self, read_workbook, tmp_path):
         """T302-E001: 空データ処理テスト"""
         exporter = ExcelExporter()
 
@@ -432,7 +380,7 @@ class TestExcelExporter:
         result = exporter.export_excel_report(
             employee_summaries=[],
             department_summaries=[],
-            output_path=temp_output_dir,
+            output_path=tmp_path,
             year=2024,
             month=1,
         )
@@ -443,7 +391,7 @@ class TestExcelExporter:
         assert len(result.warnings) > 0  # 空データの警告があること
 
         # ファイル内容確認
-        workbook = load_workbook(result.file_path)
+        workbook = read_workbook(result.file_path)
 
         # ワークシートは作成されているがデータ行はない
         employee_sheet = workbook["社員別レポート"]
@@ -473,7 +421,7 @@ class TestExcelExporter:
         assert result.success is False
         assert any("Permission denied" in error for error in result.errors)
 
-    def test_export_with_invalid_data(self, temp_output_dir):
+    def test_export_with_invalid_data(self, read_workbook, tmp_path):
         """T302-E003: 不正データ処理テスト"""
         # 不正データを含む社員データ
         from datetime import date
@@ -502,7 +450,7 @@ class TestExcelExporter:
         result = exporter.export_excel_report(
             employee_summaries=invalid_employee_data,
             department_summaries=[],
-            output_path=temp_output_dir,
+            output_path=tmp_path,
             year=2024,
             month=1,
         )
@@ -512,38 +460,75 @@ class TestExcelExporter:
         assert len(result.warnings) > 0
 
         # ファイル内容確認
-        workbook = load_workbook(result.file_path)
+        workbook = read_workbook(result.file_path)
         worksheet = workbook["社員別レポート"]
 
         # デフォルト値が適用されていることを確認
         assert worksheet.cell(row=2, column=1).value == "UNKNOWN"  # employee_id
         assert worksheet.cell(row=2, column=2).value == "Unknown User"  # employee_name
 
-    def test_large_data_processing(self, temp_output_dir):
+    def test_missing_values_mixed_with_valid_rows(self, read_workbook, tmp_path):
+        """T302-E004: 有効な値と混在するNoneにもデフォルト値が適用されること"""
+        from datetime import date
+
+        employee_data = [
+            AttendanceSummary(
+                employee_id=employee_id,
+                period_start=date(2024, 1, 1),
+                period_end=date(2024, 1, 31),
+                total_days=31,
+                business_days=22,
+                employee_name=employee_name,
+                department=department,
+                attendance_days=20,
+            )
+            for employee_id, employee_name, department in [
+                ("EMP001", "田中太郎", "営業部"),
+                (None, None, None),
+            ]
+        ]
+
+        result = ExcelExporter().export_excel_report(
+            employee_summaries=employee_data,
+            department_summaries=[],
+            output_path=tmp_path,
+            year=2024,
+            month=1,
+        )
+
+        assert result.success is True
+        worksheet = read_workbook(result.file_path)["社員別レポート"]
+        rows = list(worksheet.iter_rows(min_row=2, max_col=3, values_only=True))
+        assert rows == [
+            ("EMP001", "田中太郎", "営業部"),
+            ("UNKNOWN", "Unknown User", "未設定"),
+        ]
+
+    def test_large_data_processing(self, tmp_path):
         """T302-B001: 大容量データ処理テスト"""
         # 大量のデータを生成（メモリ制約のためサイズは調整）
         from datetime import date
 
-        large_employee_data = []
-        for i in range(1000):  # 1000名分
-            large_employee_data.append(
-                AttendanceSummary(
-                    employee_id=f"EMP{i:04d}",
-                    period_start=date(2024, 1, 1),
-                    period_end=date(2024, 1, 31),
-                    total_days=31,
-                    business_days=22,
-                    employee_name=f"社員{i}",
-                    department=f"部門{i % 10}",
-                    attendance_days=22,
-                    tardiness_count=0,
-                    early_leave_count=0,
-                    total_work_minutes=10560,
-                    scheduled_overtime_minutes=480,
-                    legal_overtime_minutes=0,
-                    paid_leave_days=1,
-                )
+        # リストに溜めず、ジェネレーターで1件ずつ渡す
+        large_employee_data = (
+            AttendanceSummary(
+                employee_id=f"EMP{i:04d}",
+                period_start=date(2024, 1, 1),
+                period_end=date(2024, 1, 31),
+                total_days=31,
+                business_days=22,
+                employee_name=f"社員{i}",
+                department=f"部門{i % 10}",
+                attendance_days=22,
+                tardiness_count=0,
+                early_leave_count=0,
+                total_work_minutes=10560,
+                scheduled_overtime_minutes=480,
+                legal_overtime_minutes=0,
+                paid_leave_days=1,
             )
+            for i in range(1000)  # 1000名分
+        )
 
         exporter = ExcelExporter()
 
@@ -554,7 +539,7 @@ class TestExcelExporter:
         result = exporter.export_excel_report(
             employee_summaries=large_employee_data,
             department_summaries=[],
-            output_path=temp_output_dir,
+            output_path=tmp_path,
             year=2024,
             month=1,
         )
@@ -563,10 +548,68 @@ class TestExcelExporter:
 
         # パフォーマンス基準確認
         assert result.success is True
+        assert result.record_count == 1000  # 書き込んだ行数から求める
         assert processing_time < 60  # 60秒以内
         assert result.file_size < 20 * 1024 * 1024  # 20MB以下
 
-    def test_unicode_character_handling(self, temp_output_dir):
+    def test_direct_row_writing_matches_openpyxl(
+        self, read_workbook, tmp_path, monkeypatch
+    ):
+        """T302-B002: 大量行の直接書き出しがopenpyxlでの書き込みと同じ内容になること"""
+        from datetime import date
+
+        from attendance_tool.output import excel_exporter
+
+        names = ["田中🌸太郎", " 先頭空白", "末尾空白 ", "R&D <営業>", "", None]
+        employee_data = [
+            AttendanceSummary(
+                employee_id=f"EMP{i:04d}",
+                period_start=date(2024, 1, 1),
+                period_end=date(2024, 1, 31),
+                total_days=31,
+                business_days=22,
+                employee_name=names[i % len(names)],
+                department=f"部門{i % 10}",
+                attendance_days=i % 23,
+                total_work_minutes=i * 37,
+                scheduled_overtime_minutes=i % 91,
+                paid_leave_days=(i % 3) * 0.5,
+            )
+            for i in range(600)
+        ]
+
+        def export_rows(threshold, output_dir):
+            monkeypatch.setattr(excel_exporter, "_DIRECT_WRITE_THRESHOLD", threshold)
+            output_dir.mkdir()
+            result = ExcelExporter().export_excel_report(
+                employee_summaries=employee_data,
+                department_summaries=[],
+                output_path=output_dir,
+                year=2024,
+                month=1,
+            )
+            assert result.success is True
+            worksheet = read_workbook(result.file_path)["社員別レポート"]
+            return list(worksheet.iter_rows(values_only=True))
+
+        direct_rows = export_rows(500, tmp_path / "direct")
+        openpyxl_rows = export_rows(len(employee_data), tmp_path / "openpyxl")
+
+        assert len(direct_rows) == len(employee_data) + 1
+        assert direct_rows == openpyxl_rows
+
+        # 空文字列・Noneの氏名はデフォルト値、空白は保持されること
+        expected_names = [
+            "田中🌸太郎",
+            " 先頭空白",
+            "末尾空白 ",
+            "R&D <営業>",
+            "Unknown User",
+            "Unknown User",
+        ]
+        assert [row[1] for row in direct_rows[1:7]] == expected_names
+
+    def test_unicode_character_handling(self, read_workbook, tmp_path):
         """T302-B004: 特殊文字処理テスト"""
         from datetime import date
 
@@ -610,7 +653,7 @@ class TestExcelExporter:
         result = exporter.export_excel_report(
             employee_summaries=unicode_employee_data,
             department_summaries=[],
-            output_path=temp_output_dir,
+            output_path=tmp_path,
             year=2024,
             month=1,
         )
@@ -618,7 +661,7 @@ class TestExcelExporter:
         assert result.success is True
 
         # Unicode文字が正確に保存されていることを確認
-        workbook = load_workbook(result.file_path)
+        workbook = read_workbook(result.file_path)
         worksheet = workbook["社員別レポート"]
 
         assert worksheet.cell(row=2, column=2).value == "田中🌸太郎"
@@ -667,16 +710,22 @@ class TestExcelIntegration:
     """Excel出力統合テスト"""
 
     def test_csv_excel_consistency(
-        self, temp_output_dir, sample_employee_data, sample_department_data
+        self,
+        read_workbook,
+        tmp_path,
+        sample_employee_data,
+        sample_department_data,
     ):
         """T302-I001: CSV出力との一貫性テスト"""
+        import pandas as pd
+
         from attendance_tool.output.csv_exporter import CSVExporter
 
         # CSV出力
         csv_exporter = CSVExporter()
         csv_result = csv_exporter.export_employee_report(
             summaries=sample_employee_data,
-            output_path=temp_output_dir,
+            output_path=tmp_path,
             year=2024,
             month=1,
         )
@@ -686,7 +735,7 @@ class TestExcelIntegration:
         excel_result = excel_exporter.export_excel_report(
             employee_summaries=sample_employee_data,
             department_summaries=sample_department_data,
-            output_path=temp_output_dir,
+            output_path=tmp_path,
             year=2024,
             month=1,
         )
@@ -697,7 +746,7 @@ class TestExcelIntegration:
         # データ一貫性の確認（CSVとExcelで同じデータが出力されている）
         csv_df = pd.read_csv(csv_result.file_path)
 
-        workbook = load_workbook(excel_result.file_path)
+        workbook = read_workbook(excel_result.file_path)
         worksheet = workbook["社員別レポート"]
 
         # 社員数の一貫性確認
@@ -715,7 +764,7 @@ pytest.mark.performance = pytest.mark.slowtest
 class TestExcelPerformance:
     """Excelパフォーマンステスト"""
 
-    def test_processing_time_measurement(self, temp_output_dir):
+    def test_processing_time_measurement(self, tmp_path):
         """T302-P001: 処理時間測定テスト"""
         # 様々なサイズのデータでの処理時間測定
         test_cases = [
@@ -736,7 +785,7 @@ class TestExcelPerformance:
             result = exporter.export_excel_report(
                 employee_summaries=employee_data,
                 department_summaries=department_data,
-                output_path=temp_output_dir,
+                output_path=tmp_path,
                 year=2024,
                 month=1,
             )
@@ -1,14 +1,9 @@
 """テンプレート管理機能のテスト - TASK-303"""
 
-import shutil
-import tempfile
-from datetime import date
-from pathlib import Path
+import copy
 
 import pytest
 
-from attendance_tool.calculation.department_summary import DepartmentSummary
-from attendance_tool.calculation.summary import AttendanceSummary
 from attendance_tool.output.models import ExportResult
 from attendance_tool.output.template_manager import TemplateManager
 
@@ -16,58 +11,25 @@ from attendance_tool.output.template_manager import TemplateManager
 class TestTemplateManager:
     """TemplateManagerのテスト"""
 
-    @pytest.fixture
-    def temp_output_dir(self):
-        """テスト用一時出力ディレクトリ"""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
+    @pytest.fixture(scope="module")
+    def output_root(self, tmp_path_factory):
+        """モジュール全体で1つだけ作成する出力ルートディレクトリ"""
+        return tmp_path_factory.mktemp("template_manager")
 
     @pytest.fixture
-    def template_manager(self):
-        """TemplateManagerインスタンス"""
-        return TemplateManager()
+    def temp_output_dir(self, output_root, request):
+        """テスト用一時出力ディレクトリ（出力ルート配下にテストごとに作成）"""
+        output_dir = output_root / request.node.name
+        output_dir.mkdir(exist_ok=True)
+        return output_dir
 
-    @pytest.fixture
-    def sample_employee_data(self):
-        """サンプル社員データ"""
-        return [
-            AttendanceSummary(
-                employee_id="EMP001",
-                period_start=date(2024, 1, 1),
-                period_end=date(2024, 1, 31),
-                total_days=31,
-                business_days=22,
-                employee_name="田中太郎",
-                department="営業部",
-                attendance_days=22,
-                tardiness_count=1,
-                early_leave_count=0,
-                total_work_minutes=10560,
-                scheduled_overtime_minutes=960,
-                legal_overtime_minutes=0,
-                paid_leave_days=2,
-            )
-        ]
+    @pytest.fixture(scope="module")
+    def template_manager(self):
+        """TemplateManagerインスタンス（モジュール全体で共有）
 
-    @pytest.fixture
-    def sample_department_data(self):
-        """サンプル部門データ"""
-        return [
-            DepartmentSummary(
-                department_code="SALES",
-                department_name="営業部",
-                period_start=date(2024, 1, 1),
-                period_end=date(2024, 1, 31),
-                employee_count=10,
-                total_work_minutes=105600,
-                total_overtime_minutes=9600,
-                attendance_rate=95.5,
-                average_work_minutes=528,
-                violation_count=0,
-                compliance_score=95.0,
-            )
-        ]
+        テンプレート設定を変更するテストでは、設定をコピーに差し替えてから使うこと。
+        """
+        return TemplateManager()
 
     def test_template_manager_initialization(self, template_manager):
         """テンプレートマネージャ初期化テスト"""
@@ -200,8 +162,14 @@ class TestTemplateManager:
         assert result.success is True
         assert result.file_path.exists()
 
-    def test_create_custom_template(self, template_manager):
+    def test_create_custom_template(self, template_manager, monkeypatch):
         """カスタムテンプレート作成テスト"""
+        # 共有インスタンスの設定を汚さないよう、テスト中だけコピーに差し替える
+        monkeypatch.setattr(
+            template_manager,
+            "template_config",
+            copy.deepcopy(template_manager.template_config),
+        )
 
         custom_settings = {
             "excel": {